@@ -0,0 +1,147 @@
+"""Content bundles: a whole frameworks checkout compiled into a single file
+
+Loading content from a checkout means opening and parsing hundreds of small
+YAML files. A bundle holds every YAML file under `frameworks/`, already
+parsed, with an index of where each one is. A `ContentLoader` made with
+`ContentLoader.from_bundle()` memory-maps the bundle, and only unpickles the
+files it uses, so the operating system only has to read (and keep in memory)
+the parts of the bundle that are used, and can share them between processes.
+
+Build a bundle with
+
+    python -m dmcontent.bundle path/to/digitalmarketplace-frameworks content.bundle
+
+The file is a magic string, the length of the index, the index (JSON, mapping
+each file's path in the checkout to the offset and length of its content)
+and then each file's content, pickled. Only load bundles you've built
+yourself, as unpickling can run arbitrary code.
+"""
+import argparse
+import json
+import mmap
+import os
+import pickle
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+MAGIC = b"DMCONTENT-BUNDLE-1\n"
+_INDEX_LENGTH = struct.Struct("<Q")
+
+
+def _bundle_key(path: str) -> str:
+    return path.replace(os.sep, "/")
+
+
+def build_bundle(content_path: str, bundle_path: str) -> int:
+    """Compile every YAML file under `content_path`/frameworks into a bundle at `bundle_path`
+
+    Returns the number of files in the bundle.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    data = bytearray()
+
+    for directory, subdirectories, filenames in os.walk(os.path.join(content_path, "frameworks")):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".yml"):
+                continue
+            path = os.path.join(directory, filename)
+            with open(path, "r") as file:
+                content = pickle.dumps(yaml.safe_load(file), protocol=pickle.HIGHEST_PROTOCOL)
+            index[_bundle_key(os.path.relpath(path, content_path))] = (len(data), len(content))
+            data += content
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode()
+    with open(bundle_path, "wb") as bundle:
+        bundle.write(MAGIC)
+        bundle.write(_INDEX_LENGTH.pack(len(index_bytes)))
+        bundle.write(index_bytes)
+        bundle.write(data)
+
+    return len(index)
+
+
+class ContentBundle(object):
+    """The content of a bundle built by `build_bundle`
+
+    The bundle is memory-mapped, and each file is only unpickled when it's read.
+
+    >>> bundle = ContentBundle('content.bundle')
+    >>> bundle.read('frameworks/g-cloud-12/manifests/edit_service.yml')
+    """
+    def __init__(self, bundle_path: str):
+        self.bundle_path = bundle_path
+
+        with open(bundle_path, "rb") as bundle:
+            try:
+                contents = mmap.mmap(bundle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                raise ValueError(f"{bundle_path} is not a content bundle")
+
+        header_length = len(MAGIC) + _INDEX_LENGTH.size
+        if contents[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{bundle_path} is not a content bundle")
+        (index_length,) = _INDEX_LENGTH.unpack_from(contents, len(MAGIC))
+
+        self._index: Dict[str, Tuple[int, int]] = json.loads(contents[header_length:header_length + index_length])
+        self._data = memoryview(contents)[header_length + index_length:]
+
+    def __reduce__(self):
+        return ContentBundle, (self.bundle_path,)
+
+    def __contains__(self, path: str) -> bool:
+        return _bundle_key(path) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def listdir(self, path: str) -> List[str]:
+        """The names of the files in the directory at `path` (relative to the frameworks checkout)
+
+        Raises `FileNotFoundError` if there were no files in that directory, like listing it would.
+        """
+        prefix = _bundle_key(path).rstrip("/") + "/"
+        filenames = [
+            key[len(prefix):] for key in self._index if key.startswith(prefix) and "/" not in key[len(prefix):]
+        ]
+        if not filenames:
+            raise FileNotFoundError(f"No directory at {path} in {self.bundle_path}")
+
+        return filenames
+
+    def read(self, path: str, stored_bytes: Optional[bytes] = None) -> Any:
+        """The content of the YAML file at `path` (relative to the frameworks checkout)
+
+        `stored_bytes` are what `read_bytes()` returned for the file, if they've already been read.
+        Raises `FileNotFoundError` if the file wasn't in the checkout, like reading the file itself would.
+        """
+        return pickle.loads(self._bytes(path) if stored_bytes is None else stored_bytes)
+
+    def read_bytes(self, path: str) -> bytes:
+        """The bytes stored for the YAML file at `path`, which are the same for files with the same content"""
+        return bytes(self._bytes(path))
+
+    def _bytes(self, path: str) -> memoryview:
+        try:
+            offset, length = self._index[_bundle_key(path)]
+        except KeyError:
+            raise FileNotFoundError(f"No file at {path} in {self.bundle_path}")
+
+        return self._data[offset:offset + length]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a frameworks checkout into a single content bundle")
+    parser.add_argument("content_path", help="the digitalmarketplace-frameworks checkout")
+    parser.add_argument("bundle_path", help="where to write the bundle")
+    args = parser.parse_args(argv)
+
+    count = build_bundle(args.content_path, args.bundle_path)
+    print(f"Wrote {count} files to {args.bundle_path}")
+
+
+if __name__ == "__main__":
+    main()
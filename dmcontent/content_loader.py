@@ -5,18 +5,27 @@ import inflection
 import re
 import os
 import copy
+import gc
+import hashlib
+import json
+import sys
 
-from typing import Optional, Dict, MutableMapping, List
+from typing import (
+    Any, Optional, Dict, FrozenSet, Hashable, Iterable, Iterator, MutableMapping, List, Sequence, Set, Tuple, Union,
+    cast,
+)
 
 from collections import defaultdict, OrderedDict
+from contextlib import contextmanager
 from functools import partial
 from werkzeug.datastructures import ImmutableMultiDict
 
-from .errors import ContentNotFoundError, QuestionNotFoundError
+from .bundle import ContentBundle
+from .errors import ContentLoaderFrozenError, ContentNotFoundError, QuestionNotFoundError
 from .questions import Question, ContentQuestion
 from .messages import ContentMessage
 from .metadata import ContentMetadata
-from .utils import TemplateField, template_all, drop_followups, LazyDict
+from .utils import TemplateField, template_all, drop_followups, LazyDict, LazyList
 
 
 class ContentManifest(object):
@@ -44,7 +53,7 @@ class ContentManifest(object):
     def __iter__(self):
         return self.sections.__iter__()
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "ContentManifest":
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "ContentManifest":
         """Create a manifest instance for service summary display
 
         Return a new :class:`ContentManifest` instance with all
@@ -55,14 +64,39 @@ class ContentManifest(object):
         dictionary and so have additional properties used by the
         summary tables.
 
+        If `lazy` is True each section (and each question in it) is only
+        summarised the first time it is accessed, which is cheaper for pages
+        that only use part of the manifest.
+
         """
+        if lazy:
+            summary_manifest = self if inplace_allowed else ContentManifest([])
+            # questions keep the numbers assigned by this manifest, so there's no need to renumber them
+            summary_manifest.sections = LazyList(
+                self.sections,
+                lambda section: section.summary(service_data, inplace_allowed=inplace_allowed, lazy=True),
+            )
+            return summary_manifest
+
         new_sections = [section.summary(service_data, inplace_allowed=inplace_allowed) for section in self.sections]
-        if inplace_allowed:
-            self.sections[:] = new_sections
-            self._assign_question_numbers()
-            return self
-        else:
-            return ContentManifest(new_sections)
+        return self._with_sections(new_sections, inplace_allowed)
+
+    def summarise_many(self, services: Iterable[dict]) -> Iterator["ContentManifest"]:
+        """Create a lazy summary manifest for each of `services` in turn
+
+        Yields the equivalent of `summary(service_data, lazy=True)` for each
+        service, but the sections are only walked once for all of the
+        services, so the cost per service is just that of summarising the
+        questions that are actually accessed.
+        """
+        sections_plan = [section._summary_plan() for section in self.sections]
+
+        for service_data in services:
+            summary_manifest = ContentManifest([])
+            summary_manifest.sections = LazyList(
+                sections_plan, partial(ContentSection._summary_from_plan, service_data=service_data)
+            )
+            yield summary_manifest
 
     def get_section(self, section_id):
         """Return a section by ID"""
@@ -121,12 +155,21 @@ class ContentManifest(object):
             for section in self.sections
         ]))
 
-        if inplace_allowed:
+        return self._with_sections(new_sections, inplace_allowed)
+
+    def _with_sections(self, new_sections, inplace_allowed):
+        """This manifest, or a new one, with `new_sections`
+
+        The sections are new (or are allowed to be changed), so unlike
+        `ContentManifest(new_sections)` this doesn't copy them again.
+        """
+        manifest = self if inplace_allowed else ContentManifest([])
+        if inplace_allowed and isinstance(self.sections, list):
             self.sections[:] = new_sections
-            self._assign_question_numbers()
-            return self
         else:
-            return ContentManifest(new_sections)
+            manifest.sections = new_sections
+        manifest._assign_question_numbers()
+        return manifest
 
     def get_question(self, field_name):
         for section in self.sections:
@@ -141,9 +184,38 @@ class ContentManifest(object):
                 return question
 
 
+class _SectionTemplateField:
+    """A `ContentSection` attribute that renders `TemplateField` values with the section's context
+
+    The value is kept in the instance `__dict__`, so `copy()` and friends
+    still see the raw `TemplateField`. Only these attributes pay for the
+    check, other attributes are looked up as normal.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+        if isinstance(value, TemplateField):
+            return value.render(instance._context)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
 class ContentSection(object):
     TEMPLATE_FIELDS = ['name', 'description', 'summary_page_description']
 
+    name = _SectionTemplateField()
+    description = _SectionTemplateField()
+    summary_page_description = _SectionTemplateField()
+
     @classmethod
     def create(cls, section):
         if isinstance(section, ContentSection):
@@ -185,30 +257,56 @@ class ContentSection(object):
         self.step = step
         self._context = _context
 
-    def __getattribute__(self, key):
-        context = object.__getattribute__(self, '_context')
-        field = object.__getattribute__(self, key)
-        if isinstance(field, TemplateField):
-            return field.render(context)
-        else:
-            return field
-
     def __getitem__(self, key):
         return getattr(self, key)
 
     def copy(self):
+        # the other fields are strings, `TemplateField`s and the like, which we never change
         return ContentSection(
-            **{key: copy.copy(value)
-               for key, value in object.__getattribute__(self, '__dict__').items()
+            **{key: copy.copy(value) if isinstance(value, (list, dict)) else value
+               for key, value in self.__dict__.items()
                if key not in ['id']})
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "ContentManifest":
-        summary_section = self if inplace_allowed else self.copy()
-        summary_section.questions = [
-            question.summary(service_data, inplace_allowed=inplace_allowed) for question in summary_section.questions
-        ]
+    def _copy_with(self, **fields):
+        """A copy of this section with some of its fields replaced, sharing the rest"""
+        return ContentSection(**{
+            key: fields[key] if key in fields else value
+            for key, value in self.__dict__.items()
+            if key not in ['id']
+        })
+
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "ContentSection":
+        questions: Sequence[Question]
+        if lazy:
+            questions = LazyList(
+                self.questions,
+                lambda question: question.summary(service_data, inplace_allowed=inplace_allowed, lazy=True),
+            )
+        else:
+            questions = [
+                question.summary(service_data, inplace_allowed=inplace_allowed) for question in self.questions
+            ]
 
-        return summary_section
+        if inplace_allowed:
+            self.questions = questions
+            return self
+        return self._copy_with(questions=questions)
+
+    def _summary_plan(self):
+        fields = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ['id', 'questions']
+        }
+        return fields, list(self.questions)
+
+    @staticmethod
+    def _summary_from_plan(plan, service_data):
+        fields, questions = plan
+        return ContentSection(
+            questions=LazyList(questions, lambda question: question.summary(service_data, lazy=True)),
+            **fields
+        )
 
     def get_question_as_section(self, question_slug):
         question = self.get_question_by_slug(question_slug)
@@ -446,15 +544,17 @@ class ContentSection(object):
             question.inject_brief_questions_into_boolean_list_question(brief)
 
     def filter(self, context, dynamic=True, inplace_allowed: bool = False) -> Optional["ContentSection"]:
-        section = self if inplace_allowed else self.copy()
-        section._context = context
-
         filtered_questions: List[Question] = list(filter(None, [
             question.filter(context, dynamic=dynamic, inplace_allowed=inplace_allowed)
             for question in self.questions
         ]))
 
-        section.questions = filtered_questions
+        if inplace_allowed:
+            section = self
+            section._context = context
+            section.questions = filtered_questions
+        else:
+            section = self._copy_with(_context=context, questions=filtered_questions)
 
         if not filtered_questions:
             return None
@@ -473,6 +573,75 @@ class ContentSection(object):
         return len(self.questions) > 1 or self.description is not None
 
 
+# a file's path, or the key of a piece of content (see `ContentLoader._dependencies`)
+_Dependency = Union[str, Tuple[str, ...]]
+
+
+class _SharedContent:
+    """Keeps a single copy of each string, `TemplateField`, list and dict in the loaded content
+
+    Frameworks reuse a lot of questions, and the content files repeat the
+    same keys and values over and over. Once a file's content has been loaded
+    (and won't be changed again) each part of it is swapped for an equal part
+    we've already seen, if there is one. Lists and dicts are compared by the
+    identity of their (already shared) items, so they're shared only if
+    everything in them is.
+    """
+    SCALAR_TYPES = (int, bool)
+
+    def __init__(self):
+        self._shared: Dict[Hashable, Any] = {}
+        # the lists and dicts in `_shared`, by id, so content that's already shared isn't walked again
+        self._shared_containers: Dict[int, Any] = {}
+
+    def __reduce__(self):
+        # the table is keyed on the ids of objects in this process, so a copy starts again with an empty table
+        return _SharedContent, ()
+
+    def share(self, content) -> Tuple[Any, int]:
+        """Return the shared version of `content`, and roughly how many bytes using it saves
+
+        The bytes are the shallow sizes of the objects that were swapped, so
+        don't include the compiled templates of reused `TemplateField`s.
+        """
+        saved = 0
+
+        def share(obj):
+            nonlocal saved
+            # lists and dicts are rebuilt from their shared items, so `candidate` is the object we'd keep otherwise
+            obj_type = type(obj)
+            if self._shared_containers.get(id(obj)) is obj:
+                return obj
+            elif obj_type is str:
+                candidate, shared = obj, sys.intern(obj)
+            elif obj_type is list:
+                candidate = [share(item) for item in obj]
+                shared = self._shared.setdefault((list, *map(id, candidate)), candidate)
+            elif obj_type is dict:
+                candidate = {share(key): share(value) for key, value in obj.items()}
+                if not all(type(key) is str for key in candidate):
+                    return candidate
+                shared = self._shared.setdefault(
+                    (dict, *(part for key, value in candidate.items() for part in (key, id(value)))), candidate
+                )
+            elif obj_type is TemplateField:
+                candidate = obj
+                shared = self._shared.setdefault((TemplateField, obj.source, obj.markdown), obj)
+            elif obj_type in self.SCALAR_TYPES:
+                candidate = obj
+                shared = self._shared.setdefault((obj_type, obj), obj)
+            else:
+                return obj
+
+            if shared is not candidate:
+                saved += sys.getsizeof(obj)
+            elif obj_type is list or obj_type is dict:
+                self._shared_containers[id(shared)] = shared
+            return shared
+
+        return share(content), saved
+
+
 class ContentLoader(object):
     """Load the frameworks content files
 
@@ -490,6 +659,11 @@ class ContentLoader(object):
     >>> # preload metadata
     >>> loader.load_metadata('framework-1', ['copy_services'])
     >>>
+    >>> # or only load manifests, messages or metadata the first time they're asked for
+    >>> loader.lazy_load_manifests('framework-2', {'manifest-2': 'question-set-1'})
+    >>> loader.lazy_load_messages('framework-2', ['homepage_sidebar'])
+    >>> loader.lazy_load_metadata('framework-2', ['copy_services'])
+    >>>
     >>> # get a manifest
     >>> loader.get_manifest('framework-1', 'manifest-1')
     >>>
@@ -498,20 +672,231 @@ class ContentLoader(object):
     >>>
     >>> # get some metadata
     >>> loader.get_message('framework-1', 'copy_services', 'source_framework')
+    >>>
+    >>> # how much memory sharing identical content between questions and frameworks has saved
+    >>> loader.bytes_saved['framework-1']
+    >>>
+    >>> # the proportion of questions that were loaded from a file identical to one already loaded
+    >>> loader.dedup_ratio
+    >>>
+    >>> # finish loading before forking workers, so they can share the content
+    >>> loader.freeze()
+    >>>
+    >>> # load the content from a bundle built with `python -m dmcontent.bundle` instead of the YAML files
+    >>> loader = ContentLoader.from_bundle('path/to/content.bundle')
+    >>>
+    >>> # only read the content from the bundle the first time it's asked for
+    >>> loader = ContentLoader.from_bundle('path/to/content.bundle', lazy=True)
+    >>>
+    >>> # the files a manifest was made from, and a key for caching things made from it
+    >>> loader.get_files('manifest', 'framework-1', 'manifest-1')
+    >>> loader.get_cache_key('manifest', 'framework-1', 'manifest-1')
 
     """
-    def __init__(self, content_path):
+    def __init__(self, content_path, _bundle: Optional[ContentBundle] = None, _lazy: bool = False):
         self.content_path = content_path
+        self._bundle = _bundle
+        self._lazy = _lazy
         self._content: Dict[str, MutableMapping] = defaultdict(dict)
-        self._messages = defaultdict(dict)
-        self._metadata = defaultdict(dict)
+        self._messages: Dict[str, MutableMapping[str, Any]] = defaultdict(dict)
+        self._metadata: Dict[str, MutableMapping[str, Any]] = defaultdict(dict)
 
         # A defaultdict that defaults to a defaultdict of dicts
-        self._questions = defaultdict(partial(defaultdict, dict))
+        self._questions = cast(Dict[str, Dict[str, Dict[str, dict]]], defaultdict(partial(defaultdict, dict)))
+
+        self._shared = _SharedContent()
+        self.bytes_saved: Dict[str, int] = defaultdict(int)
+        self.frozen = False
+
+        # questions by (name, digest of their file), so identical files in different frameworks are loaded once
+        self._questions_by_content: Dict[Tuple[str, str], Tuple[dict, str]] = {}
+        self.questions_loaded = 0
+        self.questions_deduplicated = 0
+
+        # The files each manifest, question, message and metadata block was made from, and the questions it nests:
+        #   ("manifest", framework_slug, manifest) -> {manifest file, ("question", framework_slug, question_set, id)...}
+        #   ("question", framework_slug, question_set, id) -> {question file, nested ("question", ...) keys...}
+        #   ("messages" or "metadata", framework_slug, block) -> {file}
+        self._dependencies: Dict[Tuple[str, ...], Set[_Dependency]] = {}
+        self._manifest_question_sets: Dict[Tuple[str, str], str] = {}
+        # a digest of the content of each file read, for cache keys
+        self._file_digests: Dict[str, str] = {}
+        # the questions in each question set's directory, or None if the directory couldn't be listed
+        self._question_set_indexes: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._recording: List[Set[_Dependency]] = []
+
+    @classmethod
+    def from_bundle(cls, bundle_path, lazy=False):
+        """A loader that reads content from the bundle at `bundle_path` (see `dmcontent.bundle`)
+
+        With `lazy`, loading a manifest, messages or metadata only checks the
+        bundle has them, and they're read from the bundle the first time
+        they're asked for with `get_manifest`, `get_message` or `get_metadata`.
+        The bundle is memory-mapped, so frameworks that are never asked for
+        aren't read into memory at all, and the parts that are can be shared
+        between processes. Missing questions are only found when their
+        manifest is first asked for, as with `lazy_load_manifests`.
+        """
+        return cls(bundle_path, _bundle=ContentBundle(bundle_path), _lazy=lazy)
+
+    def freeze(self):
+        """Finish loading content, so that forked worker processes can share it with the process that loaded it
+
+        Call this once everything has been loaded, just before forking (for
+        example from gunicorn's `when_ready` hook). Any lazily loaded manifests
+        are loaded now, and every object the process has made so far is moved
+        out of the garbage collector's reach with `gc.freeze()`, so collections
+        in the workers don't write to (and copy) the pages holding the content.
+        Reference counting still copies the pages of objects a worker uses.
+
+        Loading more content into a frozen loader raises a `ContentLoaderFrozenError`.
+        Freezing a lazy loader loads everything it's been asked to load.
+        """
+        if not self.frozen:
+            self._content = {
+                framework_slug: dict(manifests) for framework_slug, manifests in self._content.items()
+            }
+            self._messages = {framework_slug: dict(blocks) for framework_slug, blocks in self._messages.items()}
+            self._metadata = {framework_slug: dict(blocks) for framework_slug, blocks in self._metadata.items()}
+            self._questions = {
+                framework_slug: dict(question_sets) for framework_slug, question_sets in self._questions.items()
+            }
+            # nothing else will be loaded, so the table of content to share (and any bundle) can go
+            self._shared = _SharedContent()
+            self._bundle = None
+            self._question_set_indexes = {}
+            self._questions_by_content = {}
+            self.frozen = True
+
+        gc.collect()
+        gc.freeze()
+
+    def reload_files(self, paths: Iterable[str]) -> List[Tuple[str, ...]]:
+        """Reload the content made from the files at `paths`, after they've changed
+
+        Only the questions, manifests, messages and metadata made from those
+        files are reloaded; the rest stay as they are. Returns the keys (as in
+        `get_dependencies`) of the manifests, messages and metadata that were
+        reloaded. Questions are reloaded when they're next asked for.
+
+        The content is replaced while holding the lock lazily loaded content
+        is made under (see `LazyDict`), so this can be called from another
+        thread, such as a `ContentWatcher`'s, while the loader is in use.
+        """
+        self._check_not_frozen()
+        with LazyDict._evaluating:
+            # files may have been added or removed too
+            self._question_set_indexes.clear()
+            # the tables of content to share and of loaded questions would otherwise keep the content being replaced
+            self._shared = _SharedContent()
+            self._questions_by_content = {}
+
+            dependants = self._dependants()
+            affected = set()
+            to_visit: List[_Dependency] = list(paths)
+            while to_visit:
+                for key in dependants[to_visit.pop()]:
+                    if key not in affected:
+                        affected.add(key)
+                        to_visit.append(key)
+
+            for kind, framework_slug, *names in affected:
+                if kind == "question":
+                    question_set, question = names
+                    self._questions.get(framework_slug, {}).get(question_set, {}).pop(question, None)
+
+            reloaded = []
+            for key in sorted(affected):
+                kind, framework_slug, name, *_ = key
+                if kind == "manifest" and name in self._content.get(framework_slug, {}):
+                    question_set = self._manifest_question_sets[framework_slug, name]
+                    self._content[framework_slug][name] = self.generate_manifest(framework_slug, question_set, name)
+                elif kind == "messages" and name in self._messages.get(framework_slug, {}):
+                    self._messages[framework_slug][name] = self._load_message(framework_slug, name)
+                elif kind == "metadata" and name in self._metadata.get(framework_slug, {}):
+                    self._metadata[framework_slug][name] = self._load_metadata(framework_slug, name)
+                else:
+                    continue
+                reloaded.append(key)
+
+            return reloaded
+
+    def get_dependencies(self, *key: str) -> FrozenSet[_Dependency]:
+        """The files, and the keys of the questions, that the content for `key` was made from
+
+        `key` is one of
+          - "manifest", framework_slug, manifest
+          - "question", framework_slug, question_set, question
+          - "messages", framework_slug, block
+          - "metadata", framework_slug, block
+
+        so a manifest depends on its own file and the questions in it, and a
+        multiquestion on its own file and the questions nested in it.
+        Raises `ContentNotFoundError` if that content hasn't been loaded.
+        """
+        try:
+            return frozenset(self._dependencies[key])
+        except KeyError:
+            raise ContentNotFoundError(f"No content loaded for {key}")
+
+    def get_dependants(self, dependency: _Dependency) -> FrozenSet[Tuple[str, ...]]:
+        """The keys of the content made directly from `dependency`, a file's path or a question's key"""
+        return frozenset(self._dependants().get(dependency, ()))
+
+    def get_files(self, *key: str) -> FrozenSet[str]:
+        """Every file the content for `key` (see `get_dependencies`) was made from, including its questions' files"""
+        files = set()
+        to_visit: List[_Dependency] = list(self.get_dependencies(*key))
+        visited = set(to_visit)
+        while to_visit:
+            dependency = to_visit.pop()
+            if isinstance(dependency, str):
+                files.add(dependency)
+                continue
+            for nested in self._dependencies.get(dependency, ()):
+                if nested not in visited:
+                    visited.add(nested)
+                    to_visit.append(nested)
+
+        return frozenset(files)
+
+    def get_cache_key(self, *key: str) -> str:
+        """A key for caching anything made from the content for `key` (see `get_dependencies`)
+
+        The key depends on the content of every file the content was made from
+        (and their paths in the frameworks checkout), not on when or where they
+        were loaded, so it's the same in every process and only changes when
+        those files do.
+        """
+        digest = hashlib.sha256(json.dumps(key).encode())
+        for path in sorted(self.get_files(*key)):
+            digest.update(b"\0" + os.path.relpath(path, self.content_path).encode())
+            digest.update(b"\0" + self._file_digests[path].encode())
+
+        return digest.hexdigest()
+
+    def _dependants(self) -> Dict[_Dependency, Set[Tuple[str, ...]]]:
+        dependants: Dict[_Dependency, Set[Tuple[str, ...]]] = defaultdict(set)
+        for key, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                dependants[dependency].add(key)
+
+        return dependants
+
+    def _dependency_files(self) -> Set[str]:
+        return {
+            dependency
+            for dependencies in self._dependencies.values() for dependency in dependencies
+            if isinstance(dependency, str)
+        }
+
+    def _check_not_frozen(self):
+        if self.frozen:
+            raise ContentLoaderFrozenError("Can't load content into a frozen ContentLoader")
 
     def get_manifest(self, framework_slug, manifest):
         try:
-            manifest = self._content[framework_slug][manifest]
+            manifest = self._content.get(framework_slug, {})[manifest]
         except KeyError:
             raise ContentNotFoundError("Content not found for {} and {}".format(framework_slug, manifest))
 
@@ -520,21 +905,31 @@ class ContentLoader(object):
     get_builder = get_manifest  # TODO remove once apps have switched to .get_manifest
 
     def generate_manifest(self, framework_slug, question_set, manifest) -> List:
-        manifest_path = os.path.join(
-            self._root_path(framework_slug), 'manifests', f'{manifest}.yml'
-        )
-        try:
-            manifest_sections = read_yaml(manifest_path)
-        except IOError:
-            raise ContentNotFoundError(f"No manifest at {manifest_path}")
+        manifest_path = self._manifest_path(framework_slug, manifest)
+        with self._recording_dependencies(("manifest", framework_slug, manifest)):
+            try:
+                manifest_sections = self._read_yaml(manifest_path)
+            except IOError:
+                raise ContentNotFoundError(f"No manifest at {manifest_path}")
 
-        return [
-            self._process_section(framework_slug, question_set, section)
-            for section in manifest_sections
-        ]
+            sections = [
+                self._process_section(framework_slug, question_set, section)
+                for section in manifest_sections
+            ]
+        self._manifest_question_sets[framework_slug, manifest] = question_set
+
+        return self._share(framework_slug, sections)
 
     def load_manifest(self, framework_slug, question_set, manifest) -> Optional[List]:
-        if manifest in self._content[framework_slug]:
+        if manifest in self._content.get(framework_slug, {}):
+            return None
+
+        self._check_not_frozen()
+        # anything missing from the bundle is loaded straight away, to raise the same error it would otherwise
+        if self._lazy and self._in_bundle(self._manifest_path(framework_slug, manifest)):
+            self._lazy_blocks(self._content, framework_slug)[manifest] = partial(
+                self.generate_manifest, framework_slug, question_set, manifest
+            )
             return None
 
         self._content[framework_slug][manifest] = self.generate_manifest(framework_slug, question_set, manifest)
@@ -551,6 +946,7 @@ class ContentLoader(object):
 
         As of March 2021, the effect is about a second a manifest.
         """
+        self._check_not_frozen()
         existing_manifests = self._content[framework_slug]
 
         self._content[framework_slug] = LazyDict(
@@ -575,14 +971,130 @@ class ContentLoader(object):
         return section
 
     def get_question(self, framework_slug, question_set, question):
+        key = ("question", framework_slug, question_set, question)
+        self._depend_on(key)
         if question in self._questions.get(framework_slug, {}).get(question_set, {}):
             return self._questions[framework_slug][question_set][question].copy()
 
+        self._check_not_frozen()
+        with self._recording_dependencies(key):
+            question_data = self._load_deduplicated_question(framework_slug, question_set, question)
+
+        self._questions[framework_slug][question_set][question] = question_data
+
+        return self._questions[framework_slug][question_set][question].copy()
+
+    @property
+    def dedup_ratio(self) -> float:
+        """The proportion of the questions loaded that were shared with a question loaded from an identical file"""
+        return self.questions_deduplicated / self.questions_loaded if self.questions_loaded else 0.0
+
+    def _load_deduplicated_question(self, framework_slug, question_set, question):
+        """Load a question, or reuse the question loaded from an identical file in any framework
+
+        Multiquestions are always loaded, as the questions nested in them can
+        be different in each framework even when their own files are the same.
+        """
+        self.questions_loaded += 1
+        question_path = os.path.join(self._questions_path(framework_slug, question_set), f'{question}.yml')
+        question_bytes = self._read_question_bytes(framework_slug, question_set, question, question_path)
+        content_key = None if question_bytes is None else (question, hashlib.sha1(question_bytes).hexdigest())
+        if content_key in self._questions_by_content:
+            question_data, file_digest = self._questions_by_content[content_key]
+            self._depend_on(question_path)
+            self._file_digests[question_path] = file_digest
+            self.questions_deduplicated += 1
+            return question_data
+
+        question_data = self._share(
+            framework_slug, self._generate_question(framework_slug, question_set, question, question_bytes)
+        )
+        if content_key is not None and 'questions' not in question_data:
+            self._questions_by_content[content_key] = (question_data, self._file_digests[question_path])
+
+        return question_data
+
+    def _read_question_bytes(self, framework_slug, question_set, question, question_path) -> Optional[bytes]:
+        """The bytes of the question's file (or stored for it in the bundle), or None if they can't be read
+
+        These are hashed to find identical files, and the question is made
+        from the same bytes, so the file is only read once.
+        """
+        if not self._may_be_in_question_set(framework_slug, question_set, question):
+            return None
+
+        try:
+            if self._bundle is not None:
+                question_bytes = self._bundle.read_bytes(os.path.relpath(question_path, self.content_path))
+            else:
+                with open(question_path, 'rb') as question_file:
+                    question_bytes = question_file.read()
+        except OSError:
+            return None
+
+        return question_bytes
+
+    def load_question_set(self, framework_slug, question_set):
+        """Load every question in a question set
+
+        This is for loading questions up front (for example before `freeze`)
+        that would otherwise be loaded when they're first asked for.
+        """
+        question_set_index = self._question_set_index(framework_slug, question_set)
+        if question_set_index is None:
+            raise ContentNotFoundError(
+                "No question set at {}".format(self._questions_path(framework_slug, question_set))
+            )
+
+        for question in sorted(question_set_index):
+            self.get_question(framework_slug, question_set, question)
+
+    def _question_set_index(self, framework_slug, question_set) -> Optional[FrozenSet[str]]:
+        """The names of the questions in a question set, from a single listing of its directory
+
+        Returns None if the directory can't be listed, in which case reading
+        the question's file will say what's wrong.
+        """
+        questions_path = self._questions_path(framework_slug, question_set)
+        if questions_path not in self._question_set_indexes:
+            try:
+                if self._bundle is not None:
+                    filenames = self._bundle.listdir(os.path.relpath(questions_path, self.content_path))
+                else:
+                    with os.scandir(questions_path) as entries:
+                        filenames = [entry.name for entry in entries if entry.is_file()]
+            except OSError:
+                self._question_set_indexes[questions_path] = None
+            else:
+                self._question_set_indexes[questions_path] = frozenset(
+                    filename[:-len('.yml')] for filename in filenames if filename.endswith('.yml')
+                )
+
+        return self._question_set_indexes[questions_path]
+
+    def _may_be_in_question_set(self, framework_slug, question_set, question) -> bool:
+        """Whether the question set's index has (or, if it can't be listed, might have) a file for `question`
+
+        The index is case-sensitive, but opening a file may not be (as on
+        macOS), so a question whose name only differs in case from a YAML file
+        in the question set is still looked for on the filesystem. Bundles are
+        always case-sensitive.
+        """
+        question_set_index = self._question_set_index(framework_slug, question_set)
+        if question_set_index is None or question in question_set_index:
+            return True
+
+        return self._bundle is None and question.casefold() in {name.casefold() for name in question_set_index}
+
+    def _generate_question(self, framework_slug, question_set, question, question_bytes: Optional[bytes] = None):
+        questions_path = self._questions_path(framework_slug, question_set)
+        if not self._may_be_in_question_set(framework_slug, question_set, question):
+            raise ContentNotFoundError("No question {} at {}".format(question, questions_path))
+
         try:
-            questions_path = self._questions_path(framework_slug, question_set)
             question_data = self._load_nested_questions(
                 framework_slug, question_set,
-                _load_question(question, questions_path)
+                _load_question(question, questions_path, partial(self._read_yaml, file_bytes=question_bytes))
             )
         except IOError:
             raise ContentNotFoundError("No question {} at {}".format(question, questions_path))
@@ -606,9 +1118,7 @@ class ContentLoader(object):
                     if subfield in option:
                         question_data[field][i][subfield] = TemplateField(question_data[field][i][subfield])
 
-        self._questions[framework_slug][question_set][question] = question_data
-
-        return self._questions[framework_slug][question_set][question].copy()
+        return question_data
 
     def get_message(self, framework_slug, block, key=None):
         """
@@ -621,7 +1131,7 @@ class ContentLoader(object):
           - the status of a supplier’s application to a framework
           - the context in which the message will be displayed
         """
-        if block not in self._messages[framework_slug]:
+        if block not in self._messages.get(framework_slug, {}):
             raise ContentNotFoundError(
                 "Message file at {} not loaded".format(self._message_path(framework_slug, block))
             )
@@ -637,16 +1147,40 @@ class ContentLoader(object):
         if not isinstance(blocks, list):
             raise TypeError('Content blocks must be a list')
 
+        self._check_not_frozen()
         for block in blocks:
-            try:
-                self._messages[framework_slug][block] = self._load_message(framework_slug, block)
-            except IOError:
-                raise ContentNotFoundError(
-                    "No message file at {}".format(self._message_path(framework_slug, block))
+            if self._lazy and self._in_bundle(self._message_path(framework_slug, block)):
+                self._lazy_blocks(self._messages, framework_slug)[block] = partial(
+                    self._load_message, framework_slug, block
                 )
+                continue
+            self._messages[framework_slug][block] = self._load_message(framework_slug, block)
+
+    def lazy_load_messages(self, framework_slug, blocks):
+        """
+        Lazily load message blocks for a framework.
+
+        Like `lazy_load_manifests`, each block is only read the first time it's asked for, so use this for messages
+        that are only shown on pages users rarely visit. A block that doesn't exist raises `ContentNotFoundError`
+        when it's asked for, rather than when it's loaded.
+        """
+        if not isinstance(blocks, list):
+            raise TypeError('Content blocks must be a list')
+
+        self._check_not_frozen()
+        messages = self._lazy_blocks(self._messages, framework_slug)
+        for block in blocks:
+            if block not in messages:
+                messages[block] = partial(self._load_message, framework_slug, block)
 
     def _load_message(self, framework_slug, message_name):
-        return template_all(read_yaml(self._message_path(framework_slug, message_name)))
+        message_path = self._message_path(framework_slug, message_name)
+        with self._recording_dependencies(("messages", framework_slug, message_name)):
+            try:
+                message = template_all(self._read_yaml(message_path))
+            except IOError:
+                raise ContentNotFoundError("No message file at {}".format(message_path))
+        return self._share(framework_slug, message)
 
     def get_metadata(self, framework_slug, block, key=None):
         """
@@ -656,7 +1190,7 @@ class ContentLoader(object):
         `key` and `sub_key` are used to look up a specific metadata:
           - the framework which services can be copied from
         """
-        if block not in self._metadata[framework_slug]:
+        if block not in self._metadata.get(framework_slug, {}):
             raise ContentNotFoundError(
                 "Message file at {} not loaded".format(self._metadata_path(framework_slug, block))
             )
@@ -672,20 +1206,101 @@ class ContentLoader(object):
         if not isinstance(blocks, list):
             raise TypeError('Content blocks must be a list')
 
+        self._check_not_frozen()
         for block in blocks:
-            try:
-                self._metadata[framework_slug][block] = self._load_metadata(framework_slug, block)
-            except IOError:
-                raise ContentNotFoundError(
-                    "No metadata file at {}".format(self._metadata_path(framework_slug, block))
+            if self._lazy and self._in_bundle(self._metadata_path(framework_slug, block)):
+                self._lazy_blocks(self._metadata, framework_slug)[block] = partial(
+                    self._load_metadata, framework_slug, block
                 )
+                continue
+            self._metadata[framework_slug][block] = self._load_metadata(framework_slug, block)
+
+    def lazy_load_metadata(self, framework_slug, blocks):
+        """
+        Lazily load metadata blocks for a framework.
+
+        Like `lazy_load_messages`, each block is only read the first time it's asked for, and a block that doesn't
+        exist raises `ContentNotFoundError` then.
+        """
+        if not isinstance(blocks, list):
+            raise TypeError('Content blocks must be a list')
+
+        self._check_not_frozen()
+        metadata = self._lazy_blocks(self._metadata, framework_slug)
+        for block in blocks:
+            if block not in metadata:
+                metadata[block] = partial(self._load_metadata, framework_slug, block)
 
     def _load_metadata(self, framework_slug, metadata_name):
-        return read_yaml(self._metadata_path(framework_slug, metadata_name))
+        metadata_path = self._metadata_path(framework_slug, metadata_name)
+        with self._recording_dependencies(("metadata", framework_slug, metadata_name)):
+            try:
+                metadata = self._read_yaml(metadata_path)
+            except IOError:
+                raise ContentNotFoundError("No metadata file at {}".format(metadata_path))
+        return self._share(framework_slug, metadata)
+
+    def _share(self, framework_slug, content):
+        """Swap the parts of `content` that are the same as content we've already loaded for that content
+
+        Only do this once `content` won't be changed, as the parts can end
+        up shared between questions and frameworks.
+        """
+        content, saved = self._shared.share(content)
+        self.bytes_saved[framework_slug] += saved
+        return content
+
+    @staticmethod
+    def _lazy_blocks(blocks_by_framework, framework_slug) -> LazyDict:
+        """The framework's manifests (or messages, or metadata), as a `LazyDict` that can have lazy blocks added"""
+        blocks = blocks_by_framework[framework_slug]
+        if not isinstance(blocks, LazyDict):
+            blocks = blocks_by_framework[framework_slug] = LazyDict(blocks)
+        return blocks
+
+    def _in_bundle(self, yaml_file):
+        return os.path.relpath(yaml_file, self.content_path) in self._bundle
+
+    @contextmanager
+    def _recording_dependencies(self, key):
+        """Record the files read, and questions got, while making the content for `key`
+
+        The lock is held while recording so that content being made (or reloaded) in another thread
+        can't add to, or take from, the same stack.
+        """
+        with LazyDict._evaluating:
+            dependencies: Set[_Dependency] = set()
+            self._recording.append(dependencies)
+            try:
+                yield
+            finally:
+                self._recording.pop()
+            self._dependencies[key] = dependencies
+
+    def _depend_on(self, dependency):
+        with LazyDict._evaluating:
+            if self._recording:
+                self._recording[-1].add(dependency)
+
+    def _read_yaml(self, yaml_file, file_bytes: Optional[bytes] = None):
+        """The content of a YAML file, from `file_bytes` if they've already been read (see `_read_question_bytes()`)"""
+        self._depend_on(yaml_file)
+        if self._bundle is not None:
+            content = self._bundle.read(os.path.relpath(yaml_file, self.content_path), stored_bytes=file_bytes)
+        elif file_bytes is not None:
+            content = read_yaml(yaml_file, file_bytes=file_bytes)
+        else:
+            content = read_yaml(yaml_file)
+
+        self._file_digests[yaml_file] = _digest(content)
+        return content
 
     def _root_path(self, framework_slug):
         return os.path.join(self.content_path, 'frameworks', framework_slug)
 
+    def _manifest_path(self, framework_slug, manifest):
+        return os.path.join(self._root_path(framework_slug), 'manifests', f'{manifest}.yml')
+
     def _questions_path(self, framework_slug, question_set):
         return os.path.join(self._root_path(framework_slug), 'questions', question_set)
 
@@ -711,8 +1326,8 @@ class ContentLoader(object):
         return section_or_question
 
 
-def _load_question(question, directory):
-    question_content = read_yaml(
+def _load_question(question, directory, read):
+    question_content = read(
         os.path.join(directory, '{}.yml'.format(question))
     )
 
@@ -721,12 +1336,33 @@ def _load_question(question, directory):
     return question_content
 
 
+def _digest(content) -> str:
+    """A digest of some content read from a file, the same in every process"""
+    def default(value):
+        # sets' order changes from process to process
+        if isinstance(value, (set, frozenset)):
+            return sorted(map(repr, value))
+        return repr(value)
+
+    try:
+        serialised = json.dumps(content, default=default)
+    except TypeError:
+        # dict keys JSON can't have, like dates
+        serialised = repr(content)
+
+    return hashlib.sha1(serialised.encode()).hexdigest()
+
+
 def _make_slug(name):
     return inflection.underscore(
         re.sub(r"[^\w]+", "_", name, flags=re.UNICODE).strip("_")
     ).replace('_', '-')
 
 
-def read_yaml(yaml_file):
+def read_yaml(yaml_file, file_bytes: Optional[bytes] = None):
+    """The content of a YAML file, parsed from `file_bytes` if its bytes have already been read"""
+    if file_bytes is not None:
+        return yaml.safe_load(file_bytes)
+
     with open(yaml_file, "r") as file:
         return yaml.safe_load(file)
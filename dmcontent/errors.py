@@ -11,3 +11,7 @@ class ContentTemplateError(Exception):
 
 class QuestionNotFoundError(Exception):
     pass
+
+
+class ContentLoaderFrozenError(Exception):
+    pass
@@ -37,16 +37,31 @@ this function can call (this is not an exhaustive list):
     - govukFileUpload
     - dmListInput
 
+If you use govuk-frontend 3.15.0 you can set `python_components = True` in
+this module to have `render()` use the Python versions of the govuk-frontend
+macros in `dmcontent.govuk_frontend_components` instead, which make the same
+HTML more quickly. Macros without a Python version are still called as usual.
+
 `render_question()` should cover all the usual cases of creating a form from a
 Question, but if for some reason you need to do more you can use
 `from_question()` and `render()` individually; `render_question()` just calls
 `render()` on the output of `from_question()`.
 
+To render all the questions in a section for an edit page you can use
+`render_section()`, which gives the same HTML as `render_question()` for each
+question but compiles the section into a single template that is kept for
+as long as the section is.
+
 Read the docstring for `from_question()` for more detail on how Questions are
 handled.
 """
 
-from typing import cast, Dict, List, Optional, Set, Union, TYPE_CHECKING
+import threading
+import weakref
+from collections import OrderedDict
+from typing import (
+    cast, Collection, Dict, FrozenSet, Hashable, List, Optional, Sequence, Set, Tuple, Union, TYPE_CHECKING
+)
 
 import jinja2
 from jinja2 import Markup, escape
@@ -54,16 +69,25 @@ from jinja2 import Markup, escape
 from dmutils.forms.errors import govuk_error
 from dmutils.forms.helpers import govuk_options
 
+from dmcontent import govuk_frontend_components
+from dmcontent.utils import TemplateField, content_key
+
 if TYPE_CHECKING:
     from dmcontent.questions import Question
 
 
-__all__ = ["render_question", "from_question", "govuk_input", "govuk_label"]
+__all__ = ["render_question", "render_section", "from_question", "govuk_input", "govuk_label"]
 
 # Version of govuk-frontend templates expected. This is just the default,
 # set this in your app to change the behaviour of this code.
 govuk_frontend_version = (2, 13, 0)
 
+# Whether `render()` should use the Python versions of the govuk-frontend
+# macros in `dmcontent.govuk_frontend_components` where it can, instead of
+# the macros in the template environment. These match govuk-frontend 3.15.0,
+# set this in your app if that is the version you use.
+python_components = False
+
 Renderable = Union[dict, str, Markup, List[Union[dict, str, Markup]]]
 
 
@@ -88,6 +112,12 @@ def from_question(
     object to the right function (defined below) for further processing; if you
     need to handle a new type of `Question` try and follow that pattern.
 
+    Most of the output doesn't depend on `data` or `errors`, so that part is
+    only worked out the first time a question's content is rendered, and only
+    the answer, error message and checked options are filled in on each call
+    (see `_question_skeleton()`). The unchecked option items are shared between
+    calls, so copy an item before changing it.
+
     :param question: A Question or QuestionSummary
     :param data: A dict that may contain the answer for question
     :param errors: A dict which may contain an error message for the question
@@ -95,72 +125,240 @@ def from_question(
     :returns: A dict with the macro name, macro parameters, and labels, or None
               if we don't know how to handle this type of question
     """
+    return _from_question(question, data, errors, **kwargs)[0]
+
+
+# Where the `html` values to be rendered are in the output of `from_question()` (see `_html_paths()`): a list of
+# paths in the params for a dict, or a list of those (or None for strings) for each item of a list
+_HtmlPaths = list
+
+
+def _from_question(
+    question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> Tuple[Renderable, _HtmlPaths]:
+    """`from_question()`, and where the `html` values to be rendered are in its output
+
+    The paths are found when the skeleton is made, so `render_question()` and
+    `render_section()` don't have to look through the params for them.
+    """
+    if question.type == "multiquestion":
+        # each of the questions in a multiquestion is rendered with `from_question()`, so gets its own skeleton
+        return _dm_multiquestion(question, data, errors, **kwargs)
+
+    skeleton, html_paths = _question_skeleton(question, **kwargs)
+    to_render = _copy(skeleton)
+    _fill_skeleton(to_render, question, data, errors, **kwargs)
+
+    return to_render, html_paths
+
+
+# The data-independent part of the output of `from_question()` for a question, and where the `html` values to be
+# rendered are in its params. Filling it in doesn't add or move any `html` values, so they don't need finding again.
+_Skeleton = Tuple[dict, List[tuple]]
+
+# The skeletons for the content of each question that has been
+# rendered (see `content_key()`), with the names of the context variables that content's templates use. The least
+# recently rendered content is dropped once there are `_skeletons_maxsize` of them.
+_skeletons: "OrderedDict[tuple, Tuple[FrozenSet[str], Dict[Hashable, _Skeleton]]]" = OrderedDict()
+_skeletons_maxsize = 4096
+_skeletons_lock = threading.Lock()
+
+# rendering the same content with lots of different contexts probably means the context is the service's data
+_max_skeletons_per_question = 64
+
+
+def _question_skeleton(question: 'Question', **kwargs) -> _Skeleton:
+    """The parts of the output of `from_question()` that don't depend on data or errors
+
+    Labels, fieldsets, hints, classes and options are worked out the first
+    time a question's content is rendered with a given set of `kwargs` and
+    the values of the context variables its templates use. A new question
+    made from the same content, such as the same question in the manifest
+    filtered for the next request, then uses the same skeleton.
+
+    The skeleton is shared, so it must be copied before being filled in.
+    """
+    kwargs_key = _kwargs_key(kwargs)
+    if kwargs_key is None:
+        return _skeleton_with_html_paths(question, **kwargs)
+
+    question_key = (question.__class__, content_key(question._data))
+    with _skeletons_lock:
+        entry = _skeletons.get(question_key)
+        if entry is not None:
+            _skeletons.move_to_end(question_key)
+    if entry is None:
+        entry = (_template_variables(question), {})
+        with _skeletons_lock:
+            entry = _skeletons.setdefault(question_key, entry)
+            if len(_skeletons) > _skeletons_maxsize:
+                _skeletons.popitem(last=False)
+
+    variables, skeletons = entry
+    context_key = _context_key(question._context, variables)
+    if context_key is None:
+        return _skeleton_with_html_paths(question, **kwargs)
+
+    key = (context_key, kwargs_key)
+    try:
+        return skeletons[key]
+    except KeyError:
+        pass
+
+    if len(skeletons) >= _max_skeletons_per_question:
+        skeletons.clear()
+    skeleton = skeletons[key] = _skeleton_with_html_paths(question, **kwargs)
+
+    return skeleton
+
+
+def _skeleton_with_html_paths(question: 'Question', **kwargs) -> _Skeleton:
+    skeleton = _skeleton(question, **kwargs)
+    return skeleton, _html_paths(skeleton.get("params", {}))
+
+
+def _template_variables(question: 'Question') -> FrozenSet[str]:
+    """The names of the context variables used by the templates in a question's fields and options"""
+    variables: Set[str] = set()
+    for value in question._data.values():
+        if isinstance(value, TemplateField):
+            variables |= value.variables()
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    for item_value in item.values():
+                        if isinstance(item_value, TemplateField):
+                            variables |= item_value.variables()
+
+    return frozenset(variables)
+
+
+def _context_key(context: Optional[dict], variables: FrozenSet[str]) -> Optional[Hashable]:
+    # the values of `variables` in `context` as a cache key, or None if they can't be used as one
+    context = context or {}
+    key = tuple(
+        (name, context[name].__class__, context[name]) if name in context else (name,)
+        for name in sorted(variables)
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _kwargs_key(kwargs: dict) -> Optional[Hashable]:
+    # a cache key for keyword arguments, or None if they can't be used as one
+    key = tuple(sorted(
+        (name, value.__class__, tuple(value) if isinstance(value, list) else value) for name, value in kwargs.items()
+    ))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _skeleton(question: 'Question', **kwargs) -> dict:
     if question.type == "text" or question.type == "number":
         return {
             "label": govuk_label(question, **kwargs),
             "macro_name": "govukInput",
-            "params": govuk_input(question, data, errors, **kwargs),
+            "params": _govuk_input_skeleton(question, **kwargs),
         }
     elif question.type == "pricing":
-        return dm_pricing_input(question, data, errors, **kwargs)
+        return _dm_pricing_input_skeleton(question, **kwargs)
     elif question.type == "date":
         return {
             "fieldset": govuk_fieldset(question, **kwargs),
             "macro_name": "govukDateInput",
-            "params": govuk_date_input(question, data, errors, **kwargs),
+            "params": _govuk_date_input_skeleton(question, **kwargs),
         }
     elif question.type == "list":
         return {
             "macro_name": "dmListInput",
-            "params": dm_list_input(question, data, errors, **kwargs)
+            "params": _dm_list_input_skeleton(question, **kwargs)
         }
     elif question.type == "radios":
         return {
             "fieldset": govuk_fieldset(question, **kwargs),
             "macro_name": "govukRadios",
-            "params": govuk_radios(question, data, errors, **kwargs)
+            "params": _govuk_radios_skeleton(question, **kwargs)
         }
     elif question.type == "checkboxes":
         return {
             "fieldset": govuk_fieldset(question, **kwargs),
             "macro_name": "govukCheckboxes",
-            "params": govuk_checkboxes(question, data, errors, **kwargs)
+            "params": _govuk_radios_skeleton(question, **kwargs)
         }
     elif question.type == "boolean":
         return {
             "fieldset": govuk_fieldset(question, **kwargs),
             "macro_name": "govukRadios",
-            "params": govuk_radios(question, data, errors, **kwargs)
+            "params": _govuk_radios_skeleton(question, **kwargs)
         }
     elif question.type == "textbox_large":
         return {
             "label": govuk_label(question, **kwargs),
             "macro_name": "govukCharacterCount",
-            "params": govuk_character_count(question, data, errors, **kwargs)
+            "params": _govuk_character_count_skeleton(question, **kwargs)
         }
     elif question.type == "upload":
         return {
             "macro_name": "govukFileUpload",
-            "params": govuk_file_upload(question, data, errors, **kwargs)
+            "params": _govuk_file_upload_skeleton(question, **kwargs)
         }
-    elif question.type == "multiquestion":
-        return dm_multiquestion(question, data, errors, **kwargs)
     else:
         raise jinja2.UndefinedError(f"unable to render question of type '{question.type}'")
 
 
+def _fill_skeleton(
+    to_render: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    """Add the parts of the output of `from_question()` that depend on data or errors to a copy of its skeleton"""
+    params = to_render["params"]
+    question_type = question.type
+
+    if question_type == "text" or question_type == "number":
+        _fill_govuk_input(params, question, data, errors, **kwargs)
+    elif question_type == "pricing":
+        _fill_govuk_input(params, question, data, errors, input_id=question.fields["price"])
+    elif question_type == "date":
+        _fill_govuk_date_input(params, question, data, errors, **kwargs)
+    elif question_type == "list":
+        _fill_dm_list_input(params, question, data, errors, **kwargs)
+    elif question_type in ("radios", "checkboxes", "boolean"):
+        _fill_govuk_radios(params, question, data, errors, **kwargs)
+    elif question_type == "textbox_large":
+        _fill_params(params, question, data, errors)
+    elif question_type == "upload":
+        _fill_govuk_file_upload(params, question, data, errors, **kwargs)
+
+
+def _copy(obj):
+    # skeletons are nested dicts and lists of (immutable) strings, numbers and bools
+    if type(obj) is dict:
+        return {key: _copy(value) if type(value) in (dict, list) else value for key, value in obj.items()}
+    else:
+        return [_copy(value) if type(value) in (dict, list) else value for value in obj]
+
+
 def govuk_input(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
     """Create govukInput macro parameters from a text, number or pricing question"""
 
+    params = _govuk_input_skeleton(question, **kwargs)
+    _fill_govuk_input(params, question, data, errors, **kwargs)
+
+    return params
+
+
+def _govuk_input_skeleton(question: 'Question', **kwargs) -> dict:
     kwargs.setdefault("classes", ["app-text-input--height-compatible"])
-    params = _params(question, data, errors, **kwargs)
+    params = _params_skeleton(question, **kwargs)
 
     if question.type in ("number", "pricing"):
-        # If value is 0, it can get evaluated as False, so we should stringify it
-        if isinstance(params.get("value"), int):
-            params["value"] = str(params["value"])
         params["classes"] += " govuk-input--width-5"
         params["spellcheck"] = False
         if question.get("limits") and question.limits.get("integer_only") is True:
@@ -187,6 +385,16 @@ def govuk_input(
     return params
 
 
+def _fill_govuk_input(
+    params: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    _fill_params(params, question, data, errors, **kwargs)
+
+    # If value is 0, it can get evaluated as False, so we should stringify it
+    if isinstance(params.get("value"), int) and question.type in ("number", "pricing"):
+        params["value"] = str(params["value"])
+
+
 def govuk_checkboxes(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
@@ -200,7 +408,14 @@ def govuk_date_input(
 ) -> dict:
     """Create govukDateInput macro parameters from a date question"""
 
-    params = _params(question, data, errors)
+    params = _govuk_date_input_skeleton(question, **kwargs)
+    _fill_govuk_date_input(params, question, data, errors, **kwargs)
+
+    return params
+
+
+def _govuk_date_input_skeleton(question: 'Question', **kwargs) -> dict:
+    params = _params_skeleton(question)
 
     params["namePrefix"] = question.id
 
@@ -219,6 +434,14 @@ def govuk_date_input(
         }
     ]
 
+    return params
+
+
+def _fill_govuk_date_input(
+    params: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    _fill_params(params, question, data, errors)
+
     for item in params["items"]:
         if data:
             answer_key = f"{question.id}-{item['name']}"
@@ -227,19 +450,20 @@ def govuk_date_input(
         if errors and errors.get(question.id):
             item["classes"] += ' govuk-input--error'
 
-    return params
-
 
 def govuk_radios(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
     """Create govukRadios macro parameters from a radios question"""
 
-    if data is None:
-        data = {}
+    params = _govuk_radios_skeleton(question, **kwargs)
+    _fill_govuk_radios(params, question, data, errors, **kwargs)
+
+    return params
 
-    # we don't pass data to _params because govukRadios deals with value differently
-    params = _params(question, errors=errors)
+
+def _govuk_radios_skeleton(question: 'Question', **kwargs) -> dict:
+    params = _params_skeleton(question)
 
     # govukRadios wants idPrefix, not id
     del params["id"]
@@ -252,18 +476,73 @@ def govuk_radios(
             else:
                 params["classes"] = "govuk-radios--inline"
         options = [{"label": "Yes", "value": "True"}, {"label": "No", "value": "False"}]
-        params["items"] = govuk_options(options, str(data.get(question.id)))
+        items = govuk_options(options)
     else:
-        params["items"] = govuk_options(question.options, data.get(question.id))
+        items = govuk_options(question.options)
+
+    # The items are kept as a tuple so `_copy()` doesn't copy them (there can be hundreds), `_check_items()` makes
+    # the list for each form
+    params["items"] = tuple(items)
 
     return params
 
 
+def _fill_govuk_radios(
+    params: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    if data is None:
+        data = {}
+
+    # we don't pass data to _fill_params because govukRadios deals with value differently
+    _fill_params(params, question, errors=errors)
+
+    if question.get("type") == "boolean":
+        params["items"] = _check_items(params["items"], str(data.get(question.id)))
+    else:
+        params["items"] = _check_items(params["items"], data.get(question.id))
+
+
+def _check_items(items: Sequence[dict], data: Optional[Union[List[str], str]]) -> List[dict]:
+    """A list of the items made by `govuk_options()`, with those whose values are in `data` checked
+
+    This is the part of `govuk_options(options, data)` that depends on
+    `data`. Only the checked items are copied, the others are shared with
+    `items` (and so with every other form made from the same skeleton).
+    """
+    selected: Collection[str]
+    if data is None:
+        return list(items)
+    elif isinstance(data, str):
+        selected = {data}
+    elif isinstance(data, list):
+        try:
+            selected = set(data)
+        except TypeError:
+            selected = data
+    else:
+        raise TypeError("`data` must be a string or a list of strings")
+
+    checked_items = list(items)
+    for index, item in enumerate(items):
+        if item and item["value"] in selected:
+            checked_item = {"value": item["value"], "text": item["text"], "checked": True}
+            checked_item.update(item)
+            checked_items[index] = checked_item
+    return checked_items
+
+
 def govuk_file_upload(
         question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
     """Create govukFileUpload macro parameters from a file upload question"""
-    params = _params(question, data, errors, **kwargs)
+    params = _govuk_file_upload_skeleton(question, **kwargs)
+    _fill_govuk_file_upload(params, question, data, errors, **kwargs)
+
+    return params
+
+
+def _govuk_file_upload_skeleton(question: 'Question', **kwargs) -> dict:
+    params = _params_skeleton(question, **kwargs)
 
     params["label"] = {"text": question.question}
 
@@ -274,13 +553,6 @@ def govuk_file_upload(
     if question.get("hint"):
         params["hint"]["html"] += question.get("hint")
 
-    # If the user has previously uploaded a file for this question
-    # add a line to the hint text rather than pre-filling the input
-    if data and data.get(params["name"]):
-        params["hint"]["html"] += Markup("<p>Previously uploaded file:<br>")
-        params["hint"]["html"] += Markup(str(data.get(params["name"])))
-        params["hint"]["html"] += Markup("</p>")
-
     # Set an empty key in params for `question_advice` so `render` doesn't
     # add the advice again.
     # TODO: remove this once `render` doesn't check for question advice
@@ -289,12 +561,32 @@ def govuk_file_upload(
     return params
 
 
+def _fill_govuk_file_upload(
+    params: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    _fill_params(params, question, data, errors, **kwargs)
+
+    # If the user has previously uploaded a file for this question
+    # add a line to the hint text rather than pre-filling the input
+    if data and data.get(params["name"]):
+        params["hint"]["html"] += Markup("<p>Previously uploaded file:<br>")
+        params["hint"]["html"] += Markup(str(data.get(params["name"])))
+        params["hint"]["html"] += Markup("</p>")
+
+
 def dm_list_input(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
     """Create dmListInput macro parameters from a list question"""
 
-    params = _params(question, data, errors)
+    params = _dm_list_input_skeleton(question, **kwargs)
+    _fill_dm_list_input(params, question, data, errors, **kwargs)
+
+    return params
+
+
+def _dm_list_input_skeleton(question: 'Question', **kwargs) -> dict:
+    params = _params_skeleton(question)
 
     # Params that are not common to other components
     params["addButtonName"] = "item"
@@ -307,6 +599,14 @@ def dm_list_input(
     if question.question_advice:
         params["question_advice"] = question.question_advice
 
+    return params
+
+
+def _fill_dm_list_input(
+    params: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    _fill_params(params, question, data, errors)
+
     if data and question.id in data:
         for item in data[question.id]:
             params["items"].append(
@@ -315,17 +615,19 @@ def dm_list_input(
                 }
             )
 
-    return params
-
 
 def dm_pricing_input(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
     """Create several parameters for several components based on fields in pricing question"""
 
-    if data is None:
-        data = {}
+    to_render = _dm_pricing_input_skeleton(question, **kwargs)
+    _fill_govuk_input(to_render["params"], question, data, errors, input_id=question.fields["price"])
+
+    return to_render
 
+
+def _dm_pricing_input_skeleton(question: 'Question', **kwargs) -> dict:
     # There can either be multiple fields from the set {"maximum_price",
     # "minimum_price", "pricing_unit", "pricing_interval"}, or a single field
     # "price". If there is just a price field we don't want a fieldset.
@@ -333,10 +635,8 @@ def dm_pricing_input(
         return {
             "label": govuk_label(question, **kwargs),
             "macro_name": "govukInput",
-            "params": govuk_input(
+            "params": _govuk_input_skeleton(
                 question,
-                data,
-                errors,
                 input_id=question.fields["price"],
                 prefix_text="£",
             ),
@@ -352,10 +652,18 @@ def dm_pricing_input(
 def dm_multiquestion(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> Renderable:
+    return _dm_multiquestion(question, data, errors, **kwargs)[0]
+
+
+def _dm_multiquestion(
+    question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> Tuple[Renderable, _HtmlPaths]:
     to_render: List[Union[dict, Markup, str]] = []
+    html_paths: _HtmlPaths = []
 
     if question.get("question_advice"):
         to_render.append(_question_advice(question))
+        html_paths.append(None)
 
     # We need to be able to skip followup questions. Questions which have
     # followups always come before the followup, so we create a variable
@@ -369,7 +677,8 @@ def dm_multiquestion(
             continue
 
         # We don't have nested multiquestions, so the output of `from_question` here is always a dict.
-        question_to_render = cast(dict, from_question(q, data, errors, is_page_heading=False))
+        question_to_render, question_html_paths = _from_question(q, data, errors, is_page_heading=False)
+        question_to_render = cast(dict, question_to_render)
 
         if q.get("followup"):
             # flag that the followup question(s) should be skipped later
@@ -379,20 +688,28 @@ def dm_multiquestion(
             # to match the form input item values
             followups = {str(v): qs for v, qs in q.values_followup.items()}
             items = question_to_render["params"]["items"]
+            # the paths are shared with the skeleton, so add to a copy
+            question_html_paths = list(question_html_paths)
 
-            for item in items:
+            for index, item in enumerate(items):
                 if item["value"] in followups:
                     followup_items = [
                         from_question(question.get_question(followup_id), data, errors, is_page_heading=False)
                         for followup_id in followups[item["value"]]
                     ]
-                    item["conditional"] = {
-                        "html": followup_items
+                    # items are shared between forms (see `_check_items()`), so change a copy
+                    items[index] = {
+                        **item,
+                        "conditional": {
+                            "html": followup_items
+                        },
                     }
+                    question_html_paths.append(("items", index, "conditional", "html"))
 
         to_render.append(question_to_render)
+        html_paths.append(question_html_paths)
 
-    return to_render
+    return to_render, html_paths
 
 
 def govuk_label(question: 'Question', *, is_page_heading: bool = True, **kwargs) -> Dict[str, Union[str, bool]]:
@@ -400,7 +717,7 @@ def govuk_label(question: 'Question', *, is_page_heading: bool = True, **kwargs)
     :param bool is_page_heading: If True, the label will be set to display as a page heading
     """
     input_id: str = kwargs.get("input_id", question.id)
-    label_classes: List[str] = kwargs.get("label_classes", [])
+    label_classes: List[str] = list(kwargs.get("label_classes", []))
 
     label: Dict[str, Union[str, bool]] = {
         "for": f"input-{input_id}",
@@ -440,7 +757,14 @@ def govuk_fieldset(
 def govuk_character_count(
     question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
 ) -> dict:
-    params = _params(question, data, errors)
+    params = _govuk_character_count_skeleton(question, **kwargs)
+    _fill_params(params, question, data, errors)
+
+    return params
+
+
+def _govuk_character_count_skeleton(question: 'Question', **kwargs) -> dict:
+    params = _params_skeleton(question)
 
     params["spellcheck"] = True
 
@@ -511,6 +835,14 @@ def _params(
     :returns: A dictionary with parameters that are generally useful for
               govuk-frontend component macros
     """
+    params = _params_skeleton(question, **kwargs)
+    _fill_params(params, question, data, errors, **kwargs)
+
+    return params
+
+
+def _params_skeleton(question: 'Question', **kwargs) -> dict:
+    """The parameters from `_params()` that don't depend on data or errors"""
     classes: Optional[List[str]] = kwargs.get("classes")
     hint_text: Optional[str] = kwargs.get("hint_text", question.get("hint"))
     input_id: str = kwargs.get("input_id", question.id)
@@ -529,14 +861,21 @@ def _params(
             hint["classes"] = " ".join(kwargs["hint_classes"])
         params["hint"] = hint
 
+    return params
+
+
+def _fill_params(
+    params: dict, question: 'Question', data: Optional[dict] = None, errors: Optional[dict] = None, **kwargs
+) -> None:
+    """Add the parameters from `_params()` that depend on data or errors"""
+    input_id: str = kwargs.get("input_id", question.id)
+
     if data and data.get(input_id) is not None:
         params["value"] = data[input_id]
 
     if errors and errors.get(input_id):
         params["errorMessage"] = govuk_error(errors[input_id])["errorMessage"]
 
-    return params
-
 
 def _question_advice(
     question: 'Question', **kwargs
@@ -577,15 +916,22 @@ def render(ctx, obj: Renderable, *, question=None) -> Markup:
 
     :type obj: list[dict or str or Markup] or dict or str or Markup
     """
+    return _render(ctx, obj, question, None)
+
+
+def _render(ctx, obj: Renderable, question, html_paths: Optional[_HtmlPaths]) -> Markup:
+    """`render()`, given where the `html` values are in `obj` (see `_from_question()`), or None to look for them"""
     if isinstance(obj, list):
-        return Markup("".join(render(ctx, el) for el in obj))
+        return Markup("".join(
+            _render(ctx, el, None, None if html_paths is None else html_paths[index]) for index, el in enumerate(obj)
+        ))
     elif isinstance(obj, dict):
         html = Markup("")
         if "label" in obj:
-            html += ctx.resolve("govukLabel")(obj["label"])
+            html += _resolve(ctx, "govukLabel")(obj["label"])
         if "macro_name" in obj:
-            macro = ctx.resolve(obj["macro_name"])
-            params = obj.get("params", {}).copy()
+            macro = _resolve(ctx, obj["macro_name"])
+            params = obj.get("params", {})
             inner_html = Markup("")
 
             # TODO: this shouldn't be here
@@ -596,20 +942,8 @@ def render(ctx, obj: Renderable, *, question=None) -> Markup:
                 inner_html += question.question_advice + "\n"
 
             if params:
-                # look for structures that are {'html': {'macro_name': ...}}
-                # and render them
-                def visit(inner_obj):
-                    if isinstance(inner_obj, dict):
-                        for k, v in inner_obj.items():
-                            if k == "html":
-                                inner_obj["html"] = render(ctx, v)
-                            else:
-                                visit(v)
-                    elif isinstance(inner_obj, list):
-                        for el in inner_obj:
-                            visit(el)
-
-                visit(params)
+                # render structures that are {'html': {'macro_name': ...}}
+                params = _with_html(ctx, params, _html_paths(params) if html_paths is None else html_paths)
 
                 inner_html += Markup(macro(params))  # type:ignore # fix once drop support for Flask 1.0
             else:
@@ -617,7 +951,7 @@ def render(ctx, obj: Renderable, *, question=None) -> Markup:
 
             if "fieldset" in obj:
                 inner_html = Markup(
-                    ctx.resolve("govukFieldset")(obj["fieldset"], caller=lambda: inner_html)
+                    _resolve(ctx, "govukFieldset")(obj["fieldset"], caller=lambda: inner_html)
                 )
 
             html += inner_html  # type:ignore # fix once drop support for Flask 1.0
@@ -629,6 +963,78 @@ def render(ctx, obj: Renderable, *, question=None) -> Markup:
         raise TypeError("render() expects a dict or string type, or a list of dicts or string types")
 
 
+def _html_paths(params: dict) -> List[tuple]:
+    """Where the `html` values to be rendered are in some macro params, as tuples of keys and indexes"""
+    paths: List[tuple] = []
+    _find_html(params, [], paths)
+    return paths
+
+
+def _find_html(obj: Union[dict, list], path: list, paths: List[tuple]) -> None:
+    for key, value in (obj.items() if isinstance(obj, dict) else enumerate(obj)):
+        if key == "html":
+            paths.append((*path, key))
+        elif isinstance(value, (dict, list)):
+            path.append(key)
+            _find_html(value, path, paths)
+            path.pop()
+
+
+def _with_html(ctx, params: dict, paths: List[tuple]) -> dict:
+    """A copy of `params` with the values at `paths` rendered
+
+    Only the dicts and lists on the way to each path are copied, the rest is
+    shared with `params`, which isn't changed.
+    """
+    copies: Dict[tuple, Union[dict, list]] = {(): params.copy()}
+    for path in paths:
+        obj = copies[()]
+        for depth in range(1, len(path)):
+            if path[:depth] not in copies:
+                copies[path[:depth]] = obj[path[depth - 1]] = obj[path[depth - 1]].copy()  # type: ignore
+            obj = copies[path[:depth]]
+        obj[path[-1]] = render(ctx, obj[path[-1]])  # type: ignore
+    return cast(dict, copies[()])
+
+
+def _resolve(ctx, name: str):
+    """Find the macro called `name`, or its Python version if we can use that instead
+
+    Forms call the same few macros over and over, so what is found is kept
+    on the template context, by name and whether `python_components` was
+    set, for as long as the context is. The cache is per context rather than
+    per environment, as different templates can import different macros with
+    the same name. Names that aren't found aren't kept, in case the macro is
+    defined later on in the template.
+    """
+    try:
+        macros = ctx.__dict__["_dmcontent_macros"]
+    except KeyError:
+        macros = ctx.__dict__["_dmcontent_macros"] = {}
+    except AttributeError:
+        # we can't keep anything on the context, so don't cache
+        return _resolve_macro(ctx, name)
+
+    key = (name, python_components)
+    try:
+        return macros[key]
+    except KeyError:
+        macro = _resolve_macro(ctx, name)
+        if not isinstance(macro, jinja2.Undefined):
+            macros[key] = macro
+        return macro
+
+
+def _resolve_macro(ctx, name: str):
+    if (
+        python_components
+        and name in govuk_frontend_components.MACROS
+        and govuk_frontend_components.environment_is_compatible(ctx.environment, ctx.eval_ctx.autoescape)
+    ):
+        return govuk_frontend_components.MACROS[name]
+    return ctx.resolve(name)
+
+
 @jinja2.contextfunction
 def render_question(
     ctx,
@@ -642,9 +1048,160 @@ def render_question(
     Convenience function that calls `render()` on the output of
     `from_question()`. In most circumstances this should be all you need.
     """
-    to_render = from_question(question, data, errors, **kwargs)
-    return render(
-        ctx,
-        to_render,
-        question=question
+    to_render, html_paths = _from_question(question, data, errors, **kwargs)
+    return _render(ctx, to_render, question, html_paths)
+
+
+@jinja2.contextfunction
+def render_section(
+    ctx,
+    section,
+    data: Optional[dict] = None,
+    errors: Optional[dict] = None,
+    **kwargs
+) -> Markup:
+    """Turn all the questions in a ContentSection into HTML for an edit page
+
+    Gives the same HTML as calling `render_question()` on each question in
+    the section in turn, but the macro calls for the whole section are
+    compiled into one Jinja template the first time a section with those
+    questions is rendered, and only the answers and errors are passed in after
+    that (see `_section_template()`), so rendering a page is one template
+    render.
+    """
+    questions = list(section.questions)
+    forms_and_html_paths = [_from_question(question, data, errors, **kwargs) for question in questions]
+    forms = [form for form, _ in forms_and_html_paths]
+    html_paths = [paths for _, paths in forms_and_html_paths]
+    template = _section_template(ctx.environment, questions, forms, html_paths)
+
+    return Markup(template.render(
+        forms=forms,
+        html_paths=html_paths,
+        questions=questions,
+        macros=_Macros(ctx),
+        render=lambda obj: render(ctx, obj),
+        with_html=lambda params, paths: _with_html(ctx, params, paths),
+    ))
+
+
+class _Macros:
+    """The macros for a compiled section template, from the template context `render_section()` was called in"""
+    __slots__ = ("ctx",)
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+
+    def __getitem__(self, name):
+        return _resolve(self.ctx, name)
+
+
+# The compiled section templates for each template environment, by the structure of the forms they render (see
+# `_structure()`). The least recently used are dropped once an environment has `_section_templates_maxsize` of them.
+_section_templates: "weakref.WeakKeyDictionary[jinja2.Environment, OrderedDict[Hashable, jinja2.Template]]" = (
+    weakref.WeakKeyDictionary()
+)
+_section_templates_maxsize = 1024
+_section_templates_lock = threading.Lock()
+
+
+def _section_template(
+    environment: jinja2.Environment, questions: list, forms: list, html_paths: List[_HtmlPaths]
+) -> jinja2.Template:
+    """A template that calls the macros in `forms` in the same way `render()` would
+
+    The template refers to the output of `from_question()` for each question
+    (and where its `html` values are) by position, rather than including it,
+    so the same template can be used with any data and errors, and for any
+    section whose forms have the same structure: the same macros, labels and
+    fieldsets, `html` values in the same params and question advice for the
+    same questions. Apps make new sections for each request, so the template
+    is kept by that structure (and the environment it's compiled in) rather
+    than by section. Only the `html` values are rendered and copied (with
+    `_with_html()`) for each page.
+    """
+    key = tuple(
+        _structure(form, paths, question) for form, paths, question in zip(forms, html_paths, questions)
     )
+
+    with _section_templates_lock:
+        templates = _section_templates.get(environment)
+        if templates is None:
+            templates = _section_templates[environment] = OrderedDict()
+        template = templates.get(key)
+        if template is not None:
+            templates.move_to_end(key)
+            return template
+
+    source = "".join(
+        _form_source(form, f"forms[{index}]", paths, f"html_paths[{index}]", f"questions[{index}]", question)
+        for index, (form, paths, question) in enumerate(zip(forms, html_paths, questions))
+    )
+    template = environment.from_string("{% autoescape true %}" + source + "{% endautoescape %}")
+
+    with _section_templates_lock:
+        templates[key] = template
+        if len(templates) > _section_templates_maxsize:
+            templates.popitem(last=False)
+
+    return template
+
+
+def _structure(obj, html_paths: _HtmlPaths, question=None) -> Hashable:
+    # the parts of the output of `from_question()` that decide the source `_form_source()` makes for it
+    if isinstance(obj, list):
+        return tuple(_structure(item, paths) for item, paths in zip(obj, html_paths))
+    elif not isinstance(obj, dict):
+        return None
+
+    params = obj.get("params", {})
+    return (
+        tuple(obj),
+        obj.get("macro_name"),
+        bool(params),
+        bool(html_paths),
+        "question_advice" not in params and bool(question and question.get("question_advice")),
+    )
+
+
+def _form_source(
+    obj, path: str, html_paths: _HtmlPaths, html_paths_path: str, question_path: Optional[str] = None, question=None
+) -> str:
+    """Jinja source that renders `obj` (found at `path` in the template's variables) the same way `render()` does
+
+    Where `obj`'s params have `html` values to render, the source renders them
+    with the paths found at `html_paths_path`.
+    """
+    if isinstance(obj, list):
+        # `render()` doesn't pass the question on to the items in a list
+        return "".join(
+            _form_source(item, f"{path}[{index}]", paths, f"{html_paths_path}[{index}]")
+            for index, (item, paths) in enumerate(zip(obj, html_paths))
+        )
+    elif not isinstance(obj, dict):
+        return f"{{{{ render({path}) }}}}"
+
+    params = obj.get("params", {})
+    params_source = f'{path}["params"]'
+    if "macro_name" in obj and params and html_paths:
+        params_source = f"with_html({params_source}, {html_paths_path})"
+
+    source = ""
+    if "label" in obj:
+        source += f'{{{{ macros["govukLabel"]({path}["label"]) }}}}'
+    if "macro_name" in obj:
+        inner_source = ""
+        if "question_advice" not in params and question and question.get("question_advice"):
+            inner_source += f'{{{{ {question_path}.question_advice }}}}{{{{ "\\n" }}}}'
+        if params:
+            inner_source += f'{{{{ macros[{obj["macro_name"]!r}]({params_source}) | safe }}}}'
+        else:
+            inner_source += f'{{{{ macros[{obj["macro_name"]!r}]() | safe }}}}'
+
+        if "fieldset" in obj:
+            inner_source = (
+                f'{{% call macros["govukFieldset"]({path}["fieldset"]) %}}{inner_source}{{% endcall %}}'
+            )
+        source += inner_source
+
+    return source
@@ -0,0 +1,743 @@
+"""
+Python versions of the govuk-frontend component macros used by `render()`.
+
+`dmcontent.govuk_frontend.render()` normally calls the govuk-frontend Jinja
+macros (`govukInput`, `govukRadios`, `govukFieldset` etc.) to make the HTML
+for a question, and calling macros is the slowest part of rendering a form.
+The functions in this module make exactly the same HTML as the macros for
+govuk-frontend 3.15.0 (as ported to Jinja by the govuk-frontend-jinja
+package), but directly in Python.
+
+To use them set
+
+    >>> from dmcontent import govuk_frontend
+    >>> govuk_frontend.python_components = True
+
+in your app. `render()` will then use the functions in `MACROS` instead of the
+macros with those names, as long as the template environment is one the macros
+would give the same output in (see `environment_is_compatible()`); anything
+else is still rendered with the macros from your template environment.
+
+Each function is a straight translation of the compiled macro, so they follow
+its whitespace exactly and treat missing parameters the way Jinja does (they
+are falsy and are rendered as nothing). Keep them in step with the macros if
+you change them; `tests/test_govuk_frontend_components.py` compares the two.
+"""
+
+from collections import abc
+from typing import Callable, Dict, List, Optional
+
+import jinja2
+from jinja2 import Markup, escape
+from jinja2.filters import do_indent
+
+
+__all__ = ["MACROS", "environment_is_compatible"]
+
+
+class _Missing:
+    """The value of a parameter that wasn't given, which behaves like a Jinja Undefined"""
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def __html__(self):
+        return ""
+
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _get(obj, key):
+    # `obj.key` in a template
+    if isinstance(obj, abc.Mapping):
+        return obj.get(key, _MISSING)
+    return _MISSING
+
+
+def _html_or_text(obj) -> Markup:
+    # `{{ obj.html | safe if obj.html else obj.text }}`
+    html = _get(obj, "html")
+    return escape(Markup(html) if html else _get(obj, "text"))
+
+
+def _attributes(attributes) -> List[str]:
+    # `{% for attribute, value in (attributes.items() if attributes else {}.items()) %} {{ attribute }}="{{ value }}"`
+    if not attributes:
+        return []
+    return [f' {escape(name)}="{escape(value)}"' for name, value in attributes.items()]
+
+
+def _trim(html: Markup, indent: Optional[int] = None) -> Markup:
+    # `{{ html | indent(indent) | trim }}`
+    if indent is not None:
+        html = do_indent(html, indent)
+    return html.strip()
+
+
+def _concat(*values):
+    # `{{ a ~ b }}`
+    if any(hasattr(value, "__html__") for value in values):
+        return Markup("").join(escape(value) for value in values)
+    return "".join(str(value) for value in values)
+
+
+def _or_missing(condition, value):
+    # `{{ value if condition }}`
+    return value if condition else _MISSING
+
+
+def _hint_params(hint, hint_id) -> dict:
+    return {
+        "id": hint_id,
+        "classes": _or_missing(hint and _get(hint, "classes"), _get(hint, "classes")),
+        "attributes": _get(hint, "attributes"),
+        "html": _get(hint, "html"),
+        "text": _get(hint, "text"),
+    }
+
+
+def _error_message_params(error_message, error_id) -> dict:
+    return {
+        "id": error_id,
+        "classes": _get(error_message, "classes"),
+        "attributes": _get(error_message, "attributes"),
+        "html": _get(error_message, "html"),
+        "text": _get(error_message, "text"),
+        "visuallyHiddenText": _get(error_message, "visuallyHiddenText"),
+    }
+
+
+def _label_params(label, for_id) -> dict:
+    return {
+        "html": _get(label, "html"),
+        "text": _get(label, "text"),
+        "classes": _get(label, "classes"),
+        "isPageHeading": _get(label, "isPageHeading"),
+        "attributes": _get(label, "attributes"),
+        "for": for_id,
+    }
+
+
+def _form_group(params) -> List[str]:
+    html = ['<div class="govuk-form-group']
+    if _get(params, "errorMessage"):
+        html.append(" govuk-form-group--error")
+    form_group = _get(params, "formGroup")
+    if form_group and _get(form_group, "classes"):
+        html += [" ", escape(form_group["classes"])]
+    return html
+
+
+def _spellcheck(params) -> List[str]:
+    spellcheck = _get(params, "spellcheck")
+    if spellcheck == False or spellcheck == True:  # noqa: E712 (this is what the macros do)
+        return [' spellcheck="', escape(str(spellcheck).lower()), '"']
+    return []
+
+
+def govuk_label(params) -> Markup:
+    html = ["\n  "]
+    if _get(params, "html") or _get(params, "text"):
+        html.append("\n")
+        label_html = ['\n<label class="govuk-label']
+        if _get(params, "classes"):
+            label_html += [" ", escape(params["classes"])]
+        label_html.append('"')
+        label_html += _attributes(_get(params, "attributes"))
+        if _get(params, "for"):
+            label_html += [' for="', escape(params["for"]), '"']
+        label_html += [">\n  ", _html_or_text(params), "\n</label>\n"]
+
+        html.append("\n\n")
+        if _get(params, "isPageHeading"):
+            html += ['\n<h1 class="govuk-label-wrapper">', "".join(label_html), "</h1>\n"]
+        else:
+            html += ["\n", "".join(label_html), "\n"]
+        html.append("\n")
+    html.append("\n\n")
+
+    return Markup("".join(html))
+
+
+def govuk_hint(params) -> Markup:
+    html = ["\n  <div"]
+    if _get(params, "id"):
+        html += [' id="', escape(params["id"]), '"']
+    html.append(' class="govuk-hint')
+    if _get(params, "classes"):
+        html += [" ", escape(params["classes"])]
+    html.append('"')
+    html += _attributes(_get(params, "attributes"))
+    html += [">\n  ", _html_or_text(params), "\n</div>\n\n"]
+
+    return Markup("".join(html))
+
+
+def govuk_error_message(params) -> Markup:
+    visually_hidden_text = _get(params, "visuallyHiddenText")
+    if visually_hidden_text is _MISSING:
+        visually_hidden_text = "Error"
+
+    html = ["\n  <span"]
+    if _get(params, "id"):
+        html += [' id="', escape(params["id"]), '"']
+    html.append(' class="govuk-error-message')
+    if _get(params, "classes"):
+        html += [" ", escape(params["classes"])]
+    html.append('"')
+    html += _attributes(_get(params, "attributes"))
+    html.append(">\n  ")
+    if visually_hidden_text:
+        html += ['<span class="govuk-visually-hidden">', escape(visually_hidden_text), ":</span> "]
+    html += [_html_or_text(params), "\n</span>\n\n"]
+
+    return Markup("".join(html))
+
+
+def govuk_fieldset(params, caller: Optional[Callable[[], str]] = None) -> Markup:
+    html = ['\n<fieldset class="govuk-fieldset']
+    if _get(params, "classes"):
+        html += [" ", escape(params["classes"])]
+    html.append('"')
+    if _get(params, "role"):
+        html += [' role="', escape(params["role"]), '"']
+    if _get(params, "describedBy"):
+        html += [' aria-describedby="', escape(params["describedBy"]), '"']
+    html += _attributes(_get(params, "attributes"))
+    html.append(">\n  ")
+
+    legend = _get(params, "legend")
+    if legend and (_get(legend, "html") or _get(legend, "text")):
+        html.append('\n  <legend class="govuk-fieldset__legend')
+        if _get(legend, "classes"):
+            html += [" ", escape(legend["classes"])]
+        html.append('">\n    ')
+        if _get(legend, "isPageHeading"):
+            html += [
+                '\n      <h1 class="govuk-fieldset__heading">\n        ', _html_or_text(legend), "\n      </h1>\n    "
+            ]
+        else:
+            html += ["\n      ", _html_or_text(legend), "\n    "]
+        html.append("\n  </legend>\n  ")
+
+    html.append("\n  ")
+    if caller:
+        html += [escape(caller()), "\n  "]
+    elif _get(params, "html"):
+        html += ["\n    ", escape(Markup(params["html"])), "\n  "]
+    html.append("\n</fieldset>\n\n")
+
+    return Markup("".join(html))
+
+
+def govuk_input(params) -> Markup:
+    described_by = _get(params, "describedBy") or ""
+    error_message = _get(params, "errorMessage")
+
+    html = ["\n\n\n"]
+    html += _form_group(params)
+    html += ['">\n  ', _trim(govuk_label(_label_params(_get(params, "label"), _get(params, "id"))), 2), "\n"]
+
+    hint = _get(params, "hint")
+    if hint:
+        hint_id = params["id"] + "-hint"
+        described_by = described_by + " " + hint_id if described_by else hint_id
+        html += ["\n  \n  \n  ", _trim(govuk_hint(_hint_params(hint, hint_id)), 2), "\n"]
+    html.append("\n")
+
+    if error_message:
+        error_id = params["id"] + "-error"
+        described_by = described_by + " " + error_id if described_by else error_id
+        html += ["\n  \n  \n  ", _trim(govuk_error_message(_error_message_params(error_message, error_id)), 2), "\n"]
+
+    prefix, suffix = _get(params, "prefix"), _get(params, "suffix")
+    if prefix or suffix:
+        html.append('<div class="govuk-input__wrapper">')
+    if prefix and (_get(prefix, "text") or _get(prefix, "html")):
+        html += [
+            '\n    <div class="govuk-input__prefix',
+            escape(_or_missing(_get(prefix, "classes"), " " + prefix["classes"] if _get(prefix, "classes") else "")),
+            '" aria-hidden="true"',
+        ]
+        html += _attributes(_get(prefix, "attributes"))
+        html += [">", _html_or_text(prefix), "</div>\n  "]
+
+    html.append('<input class="govuk-input')
+    if _get(params, "classes"):
+        html += [" ", escape(params["classes"])]
+    if error_message:
+        html.append(" govuk-input--error")
+    input_type = _get(params, "type")
+    html += [
+        '" id="', escape(_get(params, "id")),
+        '" name="', escape(_get(params, "name")),
+        '" type="', escape("text" if input_type is _MISSING else input_type),
+        '"',
+    ]
+    html += _spellcheck(params)
+    if _get(params, "value"):
+        html += [' value="', escape(params["value"]), '"']
+    if described_by:
+        html += [' aria-describedby="', escape(described_by), '"']
+    for name in ("autocomplete", "pattern", "inputmode"):
+        if _get(params, name):
+            html += [f' {name}="', escape(params[name]), '"']
+    html += _attributes(_get(params, "attributes"))
+    html.append(">")
+
+    if suffix and (_get(suffix, "text") or _get(suffix, "html")):
+        html += [
+            '\n    <div class="govuk-input__suffix',
+            escape(_or_missing(_get(suffix, "classes"), " " + suffix["classes"] if _get(suffix, "classes") else "")),
+            '" aria-hidden="true"',
+        ]
+        html += _attributes(_get(suffix, "attributes"))
+        html += [">", _html_or_text(suffix), "</div>\n  "]
+    if prefix or suffix:
+        html.append("</div>")
+    html.append("\n</div>\n\n")
+
+    return Markup("".join(html))
+
+
+def govuk_textarea(params) -> Markup:
+    described_by = _get(params, "describedBy") or ""
+    error_message = _get(params, "errorMessage")
+
+    html = ["\n\n\n"]
+    html += _form_group(params)
+    html += ['">\n  ', _trim(govuk_label(_label_params(_get(params, "label"), _get(params, "id")))), "\n"]
+
+    hint = _get(params, "hint")
+    if hint:
+        hint_id = params["id"] + "-hint"
+        described_by = described_by + " " + hint_id if described_by else hint_id
+        html += ["\n  \n  \n  ", _trim(govuk_hint(_hint_params(hint, hint_id))), "\n"]
+    html.append("\n")
+
+    if error_message:
+        error_id = params["id"] + "-error"
+        described_by = described_by + " " + error_id if described_by else error_id
+        html += ["\n  \n  \n  ", _trim(govuk_error_message(_error_message_params(error_message, error_id))), "\n"]
+
+    html += [
+        '\n  <textarea class="govuk-textarea',
+        escape(" govuk-textarea--error" if error_message else ""),
+        escape(" " + params["classes"] if _get(params, "classes") else ""),
+        '" id="', escape(_get(params, "id")),
+        '" name="', escape(_get(params, "name")),
+        '" rows="', escape(params["rows"]) if _get(params, "rows") else "5",
+        '"',
+    ]
+    html += _spellcheck(params)
+    if described_by:
+        html += [' aria-describedby="', escape(described_by), '"']
+    if _get(params, "autocomplete"):
+        html += [' autocomplete="', escape(params["autocomplete"]), '"']
+    html += _attributes(_get(params, "attributes"))
+    html += [">", escape(_get(params, "value")), "</textarea>\n</div>\n\n"]
+
+    return Markup("".join(html))
+
+
+def govuk_character_count(params) -> Markup:
+    maxlength, maxwords = _get(params, "maxlength"), _get(params, "maxwords")
+    count_message = _get(params, "countMessage")
+
+    html = ['\n\n\n\n<div class="govuk-character-count" data-module="govuk-character-count"']
+    if maxlength:
+        html += [' data-maxlength="', escape(maxlength), '"']
+    if _get(params, "threshold"):
+        html += [' data-threshold="', escape(params["threshold"]), '"']
+    if maxwords:
+        html += [' data-maxwords="', escape(maxwords), '"']
+
+    textarea = govuk_textarea({
+        "id": _get(params, "id"),
+        "name": _get(params, "name"),
+        "describedBy": params["id"] + "-info",
+        "rows": _get(params, "rows"),
+        "spellcheck": _get(params, "spellcheck"),
+        "value": _get(params, "value"),
+        "formGroup": _get(params, "formGroup"),
+        "classes": (
+            "govuk-js-character-count"
+            + (" govuk-textarea--error" if _get(params, "errorMessage") else "")
+            + (" " + params["classes"] if _get(params, "classes") else "")
+        ),
+        "label": _label_params(_get(params, "label"), _get(params, "id")),
+        "hint": _get(params, "hint"),
+        "errorMessage": _get(params, "errorMessage"),
+        "attributes": _get(params, "attributes"),
+    })
+    hint = govuk_hint({
+        "text": _concat("You can enter up to ", maxlength or maxwords, " words" if maxwords else " characters"),
+        "id": params["id"] + "-info",
+        "classes": "govuk-character-count__message" + (
+            " " + count_message["classes"] if count_message and _get(count_message, "classes") else ""
+        ),
+        "attributes": {"aria-live": "polite"},
+    })
+    html += [">\n  ", textarea, "\n  ", hint, "\n</div>\n\n"]
+
+    return Markup("".join(html))
+
+
+def _choices(params, kind: str) -> Markup:
+    """govukRadios and govukCheckboxes, which only differ in a few places"""
+    checkboxes = kind == "checkboxes"
+    id_prefix = _get(params, "idPrefix") or _get(params, "name")
+    fieldset = _get(params, "fieldset")
+    has_fieldset = bool(fieldset)
+    items = params["items"] if "items" in params else ()
+
+    html = ["\n\n\n\n\n"]
+    if checkboxes:
+        described_by = _get(params, "describedBy") or ""
+        html.append("\n")
+        if fieldset and _get(fieldset, "describedBy"):
+            html += ["\n   ", "\n"]
+            described_by = fieldset["describedBy"]
+    else:
+        described_by = _get(fieldset, "describedBy") if fieldset and _get(fieldset, "describedBy") else ""
+        html.append("\n\n\n")
+
+    is_conditional = False
+    if not checkboxes:
+        for item in items:
+            html.append("\n  ")
+            conditional = _get(item, "conditional")
+            if conditional and _get(conditional, "html"):
+                html.append("\n    \n  ")
+                is_conditional = True
+            html.append("\n")
+
+    inner_html = ["\n"]
+    hint = _get(params, "hint")
+    if hint:
+        hint_id = id_prefix + "-hint"
+        described_by = described_by + " " + hint_id if described_by else hint_id
+        inner_html += ["\n  \n  \n  ", _trim(govuk_hint(_hint_params(hint, hint_id))), "\n"]
+    inner_html.append("\n")
+
+    error_message = _get(params, "errorMessage")
+    if error_message:
+        error_id = id_prefix + "-error"
+        described_by = described_by + " " + error_id if described_by else error_id
+        inner_html += ["\n  \n  \n  ", _trim(govuk_error_message(_error_message_params(error_message, error_id))), "\n"]
+
+    inner_html.append(f'\n  <div class="govuk-{kind}')
+    if _get(params, "classes"):
+        inner_html += [" ", escape(params["classes"])]
+    if is_conditional and not checkboxes:
+        inner_html.append(" govuk-radios--conditional")
+    inner_html.append('"')
+    inner_html += _attributes(_get(params, "attributes"))
+    if checkboxes:
+        inner_html.append('\n    data-module="govuk-checkboxes">\n    ')
+    else:
+        if is_conditional:
+            inner_html.append(' data-module="govuk-radios"')
+        inner_html.append(">\n    ")
+
+    # checkboxes are indented one more level than radios
+    indent = "  " if checkboxes else ""
+    for index, item in enumerate(items, start=1):
+        inner_html.append("\n      ")
+        if item:
+            if _get(item, "id"):
+                item_id = item["id"]
+            elif index == 1:
+                item_id = id_prefix
+                inner_html.append("\n          ")
+            else:
+                item_id = id_prefix + _concat("-", index)
+            conditional_id = "conditional-" + item_id
+            if checkboxes:
+                name = _get(item, "name") or _get(params, "name")
+                inner_html.append("\n        ")
+
+            if _get(item, "divider"):
+                inner_html += [
+                    f'\n{indent}        <div class="govuk-{kind}__divider">', escape(item["divider"]), "</div>"
+                ]
+            else:
+                item_hint = _get(item, "hint")
+                has_hint = item_hint and (_get(item_hint, "text") or _get(item_hint, "html"))
+                conditional = _get(item, "conditional")
+                has_conditional = conditional and _get(conditional, "html")
+
+                inner_html += [f"\n{indent}        ", f"\n{indent}        "]
+                if checkboxes:
+                    item_hint_id = item_id + "-item-hint" if has_hint else ""
+                    item_described_by = described_by if not has_fieldset else ""
+                    item_described_by = (item_described_by + " " + item_hint_id).strip()
+                    inner_html += [f"\n{indent}        ", f"\n{indent}        "]
+                else:
+                    item_hint_id = item_id + "-item-hint"
+                    item_described_by = item_hint_id if has_hint else ""
+
+                inner_html += [
+                    f'\n{indent}        <div class="govuk-{kind}__item">\n{indent}          '
+                    f'<input class="govuk-{kind}__input" id="',
+                    escape(item_id),
+                    '" name="',
+                    escape(name if checkboxes else _get(params, "name")),
+                    '" type="checkbox" value="' if checkboxes else '" type="radio" value="',
+                    escape(_get(item, "value")),
+                    '"',
+                    " checked" if _get(item, "checked") else "",
+                    " disabled" if _get(item, "disabled") else "",
+                ]
+                if has_conditional:
+                    inner_html += [' data-aria-controls="', escape(conditional_id), '"']
+                if checkboxes and _get(item, "behaviour"):
+                    inner_html += [' data-behaviour="', escape(item["behaviour"]), '"']
+                if item_described_by:
+                    inner_html += [' aria-describedby="', escape(item_described_by), '"']
+                inner_html += _attributes(_get(item, "attributes"))
+
+                label = _get(item, "label")
+                inner_html += [
+                    f">\n{indent}          ",
+                    _trim(govuk_label({
+                        "html": _get(item, "html"),
+                        "text": _get(item, "text"),
+                        "classes": f"govuk-{kind}__label" + (
+                            " " + label["classes"] if label and _get(label, "classes") else ""
+                        ),
+                        "attributes": _or_missing(label and _get(label, "attributes"), _get(label, "attributes")),
+                        "for": item_id,
+                    })),
+                    f"\n{indent}          ",
+                ]
+                if has_hint:
+                    inner_html += [
+                        f"\n{indent}          ",
+                        _trim(govuk_hint({
+                            "id": item_hint_id,
+                            "classes": f"govuk-{kind}__hint" + (
+                                " " + item_hint["classes"] if _get(item_hint, "classes") else ""
+                            ),
+                            "attributes": _get(item_hint, "attributes"),
+                            "html": _get(item_hint, "html"),
+                            "text": _get(item_hint, "text"),
+                        })),
+                        f"\n{indent}          ",
+                    ]
+                inner_html.append(f"\n{indent}        </div>\n{indent}        ")
+                if has_conditional:
+                    inner_html.append(f'\n{indent}          <div class="govuk-{kind}__conditional')
+                    if not _get(item, "checked"):
+                        inner_html.append(f" govuk-{kind}__conditional--hidden")
+                    inner_html += [
+                        '" id="',
+                        escape(conditional_id),
+                        f'">\n{indent}            ',
+                        escape(Markup(conditional["html"])),
+                        f"\n{indent}          </div>\n{indent}        ",
+                    ]
+                inner_html.append("\n        ")
+            inner_html.append("\n      ")
+        inner_html.append("\n    ")
+    inner_html.append("\n  </div>\n")
+    inner = Markup("".join(inner_html)).strip()
+
+    html += _form_group(params)
+    html.append('">\n')
+    if fieldset:
+        html += [
+            "\n  ",
+            govuk_fieldset(
+                {
+                    "describedBy": described_by,
+                    "classes": _get(fieldset, "classes"),
+                    "attributes": _get(fieldset, "attributes"),
+                    "legend": _get(fieldset, "legend"),
+                },
+                caller=lambda: Markup("\n  ") + inner + Markup("\n  "),
+            ),
+            "\n",
+        ]
+    else:
+        html += ["\n  ", inner, "\n"]
+    html.append("\n</div>\n" if checkboxes else "\n</div>\n\n")
+
+    return Markup("".join(html))
+
+
+def govuk_radios(params) -> Markup:
+    return _choices(params, "radios")
+
+
+def govuk_checkboxes(params) -> Markup:
+    return _choices(params, "checkboxes")
+
+
+_DEFAULT_DATE_INPUT_ITEMS = [
+    {"name": "day", "classes": "govuk-input--width-2"},
+    {"name": "month", "classes": "govuk-input--width-2"},
+    {"name": "year", "classes": "govuk-input--width-4"},
+]
+
+
+def govuk_date_input(params) -> Markup:
+    fieldset = _get(params, "fieldset")
+    described_by = _get(fieldset, "describedBy") if fieldset and _get(fieldset, "describedBy") else ""
+
+    html = ["\n\n\n\n\n\n"]
+    if "items" in params and len(params["items"]):
+        items = params["items"]
+    else:
+        items = _DEFAULT_DATE_INPUT_ITEMS
+    html.append("\n  \n")
+
+    inner_html = ["\n"]
+    hint = _get(params, "hint")
+    if hint:
+        hint_id = params["id"] + "-hint"
+        described_by = described_by + " " + hint_id if described_by else hint_id
+        inner_html += ["\n  \n  \n  ", _trim(govuk_hint(_hint_params(hint, hint_id)), 2), "\n"]
+    inner_html.append("\n")
+
+    error_message = _get(params, "errorMessage")
+    if error_message:
+        error_id = params["id"] + "-error"
+        described_by = described_by + " " + error_id if described_by else error_id
+        inner_html += [
+            "\n  \n  \n  ", _trim(govuk_error_message(_error_message_params(error_message, error_id)), 2), "\n"
+        ]
+
+    inner_html.append('\n  <div class="govuk-date-input')
+    if _get(params, "classes"):
+        inner_html += [" ", escape(params["classes"])]
+    inner_html.append('"')
+    inner_html += _attributes(_get(params, "attributes"))
+    if _get(params, "id"):
+        inner_html += [' id="', escape(params["id"]), '"']
+    inner_html.append(">\n    ")
+
+    for item in items:
+        item_name = _get(item, "name")
+        label = _get(item, "label")
+        if not label:
+            label = item_name if isinstance(item_name, str) else str(item_name)
+            label = label.capitalize()
+        inner_html += [
+            '\n    <div class="govuk-date-input__item">\n      ',
+            _trim(govuk_input({
+                "label": {"text": label, "classes": "govuk-date-input__label"},
+                "id": _get(item, "id") or params["id"] + "-" + item_name,
+                "classes": "govuk-date-input__input " + (_get(item, "classes") or ""),
+                "name": params["namePrefix"] + "-" + item_name if _get(params, "namePrefix") else item_name,
+                "value": _get(item, "value"),
+                "type": "text",
+                "inputmode": _get(item, "inputmode") or "numeric",
+                "autocomplete": _get(item, "autocomplete"),
+                "pattern": _get(item, "pattern") or "[0-9]*",
+                "attributes": _get(item, "attributes"),
+            }), 6),
+            "\n    </div>\n  ",
+        ]
+    inner_html.append("\n  </div>\n")
+    inner = Markup("".join(inner_html)).strip()
+
+    html.append("\n\n")
+    html += _form_group(params)
+    html.append('">\n')
+    if fieldset:
+        html += [
+            govuk_fieldset(
+                {
+                    "describedBy": described_by,
+                    "classes": _get(fieldset, "classes"),
+                    "role": "group",
+                    "attributes": _get(fieldset, "attributes"),
+                    "legend": _get(fieldset, "legend"),
+                },
+                caller=lambda: Markup("\n  ") + inner + Markup("\n  "),
+            ),
+            "\n",
+        ]
+    else:
+        html += ["\n  ", inner, "\n"]
+    html.append("\n</div>\n\n")
+
+    return Markup("".join(html))
+
+
+def govuk_file_upload(params) -> Markup:
+    described_by = _get(params, "describedBy") or ""
+    error_message = _get(params, "errorMessage")
+
+    html = ["\n\n\n"]
+    html += _form_group(params)
+    html += ['">\n  ', _trim(govuk_label(_label_params(_get(params, "label"), _get(params, "id")))), "\n"]
+
+    hint = _get(params, "hint")
+    if hint:
+        hint_id = params["id"] + "-hint"
+        described_by = described_by + " " + hint_id if described_by else hint_id
+        html += ["\n  \n  \n  ", _trim(govuk_hint(_hint_params(hint, hint_id))), "\n"]
+    html.append("\n")
+
+    if error_message:
+        error_id = params["id"] + "-error"
+        described_by = described_by + " " + error_id if described_by else error_id
+        html += ["\n  \n  \n  ", _trim(govuk_error_message(_error_message_params(error_message, error_id))), "\n"]
+
+    html.append('\n  <input class="govuk-file-upload')
+    if _get(params, "classes"):
+        html += [" ", escape(params["classes"])]
+    if error_message:
+        html.append(" govuk-file-upload--error")
+    html += ['" id="', escape(_get(params, "id")), '" name="', escape(_get(params, "name")), '" type="file"']
+    if _get(params, "value"):
+        html += [' value="', escape(params["value"]), '"']
+    if described_by:
+        html += [' aria-describedby="', escape(described_by), '"']
+    html += _attributes(_get(params, "attributes"))
+    html.append(">\n</div>\n\n")
+
+    return Markup("".join(html))
+
+
+#: The macros we have Python versions of, by name
+MACROS: Dict[str, Callable[..., Markup]] = {
+    "govukCharacterCount": govuk_character_count,
+    "govukCheckboxes": govuk_checkboxes,
+    "govukDateInput": govuk_date_input,
+    "govukErrorMessage": govuk_error_message,
+    "govukFieldset": govuk_fieldset,
+    "govukFileUpload": govuk_file_upload,
+    "govukHint": govuk_hint,
+    "govukInput": govuk_input,
+    "govukLabel": govuk_label,
+    "govukRadios": govuk_radios,
+    "govukTextarea": govuk_textarea,
+}
+
+
+def environment_is_compatible(environment: jinja2.Environment, autoescape: bool) -> bool:
+    """Whether the macros would make the same HTML as `MACROS` in this template environment
+
+    The whitespace in the macros' output depends on how the environment
+    treats blocks and newlines, and how they handle missing parameters on
+    `undefined`, so we only claim to match the default settings (with
+    autoescaping on). `ChainableUndefined` is allowed too, as that is what
+    the macros need to cope with missing nested parameters.
+    """
+    undefined_types = (jinja2.Undefined, getattr(jinja2, "ChainableUndefined", jinja2.Undefined))
+    return bool(
+        autoescape is True
+        and environment.undefined in undefined_types
+        and not environment.trim_blocks
+        and not environment.lstrip_blocks
+        and environment.newline_sequence == "\n"
+        and environment.finalize is None
+    )
@@ -7,6 +7,12 @@ This module has two main functions:
     to_summary_list_rows(): Turn a collection of QuestionSummarys into
                             rows for govukSummaryList.
 
+`iter_summary_list_rows()` does the same as `to_summary_list_rows()` but
+yields the rows one at a time, for use with streamed templates.
+
+All of these take an optional `cache` argument, a `SummaryHTMLCache` which
+can be kept between requests to save formatting the same answers again.
+
 The logic for how to format values is based on that in the deprecated
 digitalmarketplace-frontend-toolkit, specifically the summary content macros in
 `templates/summary-content.html`.
@@ -15,24 +21,144 @@ Note: this code doesn't provide for formatting of assurance approach
 information, as that hasn't been used since G-Cloud 8.
 """
 
-from typing import List, Dict
+import threading
+from collections import namedtuple, OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
 
 from jinja2 import Markup, escape
 
 import dmutils.filters as filters
 
+from .utils import content_key
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class SummaryHTMLCache:
+    """A bounded cache for the output of `to_html()` and `to_summary_list_row()`
+
+    Results are keyed on a fingerprint of the question (its class, content and
+    labels), its answer and the formatting options, so one cache can be
+    shared between requests, services and threads; service pages are read far
+    more often than services change.
+
+    When the cache holds `maxsize` results the least recently used is dropped.
+    Use `cache_info()` or `hit_rate` to see how well it is working.
+    """
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_make(self, key: Optional[Hashable], make: Callable):
+        """Return the result cached for `key`, or call `make` and cache what it returns
+
+        If `key` is None the result of `make` is returned without caching it.
+        """
+        if key is None:
+            return make()
+
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+            self.misses += 1
+
+        result = make()
+
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found a cached result"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._results)
+
+
+def _freeze(value):
+    """Make a hashable version of an answer for use in a cache key
+
+    The type is kept alongside each value as, for example, `True == 1` and
+    `Markup("<p>") == "<p>"` but they are formatted differently.
+    """
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(item) for item in value))
+    elif isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    else:
+        return (value.__class__, value)
+
+
+def _question_fingerprint(question_summary) -> tuple:
+    """Everything about a QuestionSummary that its HTML depends on
+
+    Labels are rendered with the question's context, so they are included as rendered.
+    """
+    content = content_key(question_summary._data)
+    answers = tuple(
+        _freeze(question_summary._service_data.get(field)) for field in question_summary.form_fields
+    )
+    labels: Tuple[Any, ...] = (question_summary.label,)
+    if question_summary["type"] == "multiquestion":
+        labels += tuple(question.label for question in question_summary.questions)
+
+    return (question_summary.__class__, content, _freeze(labels), answers)
+
+
+def _cache_key(*args, **kwargs) -> Optional[Hashable]:
+    key = args + tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        # the answer contains something we can't use as a key, so don't cache it
+        return None
+    return key
+
+
+def _copy_row(row):
+    # rows are nested dicts and lists of (immutable) strings, and callers might well change them
+    if isinstance(row, dict):
+        return {key: _copy_row(value) for key, value in row.items()}
+    elif isinstance(row, list):
+        return [_copy_row(value) for value in row]
+    else:
+        return row
+
 
 def to_html(
     question_summary,
     *,
     capitalize_first: bool = False,
     format_links: bool = False,
-    open_links_in_new_tab: bool = False
+    open_links_in_new_tab: bool = False,
+    cache: Optional[SummaryHTMLCache] = None
 ) -> Markup:
     """Format the value of a QuestionSummary as HTML.
 
     :param bool capitalize_first: If True, the first letter of any text will be capitalized
     :param bool format_links: If True any HTTP URLs in any text will be turned into HTML <a> elements
+    :param SummaryHTMLCache cache: If given, the HTML will be looked up in and saved to this cache
     """
     kwargs = {
         "capitalize_first": capitalize_first,
@@ -47,6 +173,16 @@ def to_html(
     except TypeError:
         raise TypeError("to_html() expects a QuestionSummary")
 
+    if cache is not None:
+        return cache.get_or_make(
+            _cache_key("to_html", _question_fingerprint(question_summary), **kwargs),
+            lambda: _to_html(question_summary, question_type, **kwargs),
+        )
+
+    return _to_html(question_summary, question_type, **kwargs)
+
+
+def _to_html(question_summary, question_type, **kwargs) -> Markup:
     # filter_value falls back to value if the question doesn't have any
     # filter_label properties, so we can use filter_value safely in
     # all cases.
@@ -80,14 +216,34 @@ def to_summary_list_rows(questions, *, filter_empty=True, **kwargs) -> List[dict
 
     :param bool filter_empty: Whether or not to include unanswered questions in the rows
     """
-    return [
-        to_summary_list_row(question, **kwargs)
-        for question in questions
-        if not (question.is_empty and filter_empty)
-    ]
+    return list(iter_summary_list_rows(questions, filter_empty=filter_empty, **kwargs))
 
 
-def to_summary_list_row(question, *, action_link=None, **kwargs) -> Dict[str, dict]:
+def iter_summary_list_rows(questions, *, filter_empty=True, **kwargs) -> Iterator[dict]:
+    """Generate rows for govukSummaryList from a collection of QuestionSummarys.
+
+    Like `to_summary_list_rows`, but each row is only made when it is asked
+    for, so when used with a streamed template (`Template.stream()` or
+    `flask.stream_template`) the start of the page can be sent before all
+    of the answers have been formatted.
+
+    `questions` can also be a summary section, in which case its questions
+    are used; with a lazy summary (`ContentManifest.summary(..., lazy=True)`)
+    each question is then only summarised as its row is made.
+
+    `kwargs` are passed to `to_html`.
+
+    :param bool filter_empty: Whether or not to include unanswered questions in the rows
+    """
+    # Duck type a ContentSection
+    questions = getattr(questions, "questions", questions)
+
+    for question in questions:
+        if not (question.is_empty and filter_empty):
+            yield to_summary_list_row(question, **kwargs)
+
+
+def to_summary_list_row(question, *, action_link=None, cache=None, **kwargs) -> Dict[str, dict]:
     """Convert a QuestionSummary into a row for govukSummaryList.
 
     This method expects a QuestionSummary.
@@ -95,7 +251,23 @@ def to_summary_list_row(question, *, action_link=None, **kwargs) -> Dict[str, di
     `kwargs` are passed to `to_html`.
 
     :param string action_link: A link for the row's action
+    :param SummaryHTMLCache cache: If given, the row will be looked up in and saved to this cache
     """
+    if cache is not None:
+        key = _cache_key(
+            "to_summary_list_row",
+            _question_fingerprint(question),
+            action_link=action_link,
+            **kwargs
+        )
+        return _copy_row(cache.get_or_make(
+            key, lambda: _to_summary_list_row(question, action_link=action_link, **kwargs)
+        ))
+
+    return _to_summary_list_row(question, action_link=action_link, **kwargs)
+
+
+def _to_summary_list_row(question, *, action_link=None, **kwargs) -> Dict[str, dict]:
     if action_link is not None:
         empty_message = question.get("empty_message", "Not answered")
         question_label = question.label + ' (Optional)' if question.is_optional else question.label
@@ -23,6 +23,11 @@ class ContentMessage(object):
             return False
         return (self._data == other._data) and (self._context == other._context)
 
+    def __setstate__(self, state):
+        # without this, looking for `__setstate__` when unpickling or copying would go to `__getattr__` before
+        # there's any `_data`
+        self.__dict__.update(state)
+
     def __getattr__(self, key):
         try:
             field = self._data[key]
@@ -17,6 +17,11 @@ class ContentMetadata:
             return False
         return self._data == other._data
 
+    def __setstate__(self, state):
+        # without this, looking for `__setstate__` when unpickling or copying would go to `__getattr__` before
+        # there's any `_data`
+        self.__dict__.update(state)
+
     def __getattr__(self, key):
         try:
             field = self._data[key]
@@ -1,7 +1,9 @@
 from collections import OrderedDict, defaultdict
 from datetime import datetime
 import re
+from types import MappingProxyType
 
+import typing
 from typing import Optional, TypeVar
 
 from dmutils.formats import DATE_FORMAT, DISPLAY_DATE_FORMAT
@@ -10,7 +12,7 @@ from .converters import convert_to_boolean, convert_to_number
 from .errors import ContentNotFoundError
 from .formats import format_price
 from .govuk_frontend import get_href
-from .utils import TemplateField, drop_followups, get_option_value
+from .utils import TemplateField, LazyList, drop_followups, get_option_value
 
 TQuestion = TypeVar("TQuestion", bound="Question")
 TMultiquestion = TypeVar("TMultiquestion", bound="Multiquestion")
@@ -21,12 +23,22 @@ class Question(object):
     TEMPLATE_FIELDS = ['name', 'question', 'hint']
     TEMPLATE_OPTIONS_FIELDS = [('options', 'description'), ('validations', 'message')]
 
+    # We keep a lot of questions in memory, so they don't get a `__dict__`. The subclasses' attributes are declared
+    # here (the subclasses have empty `__slots__`) so that they can be mixed together, e.g. `PricingSummary`. A slot
+    # that hasn't been set falls back to `__getattr__`, just like a missing instance attribute did.
+    __slots__ = (
+        'number', '_data', '_context', '_rendered', 'type', 'questions', '_content_questions', 'boolean_list_questions',
+        'fields', 'decimal_place_restriction', '_service_data', '_value', '_hierarchy_question',
+    )
+
     def __init__(self, data, number=None, _context=None):
         self.number = number
-        self._data = data.copy()
+        # `_data` is read-only, so filtered copies of a question can share it
+        self._data = data if isinstance(data, MappingProxyType) else MappingProxyType(dict(data))
         self._context = _context
+        self._rendered = (None, None)
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "QuestionSummary":
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "QuestionSummary":
         return QuestionSummary(self, service_data)
 
     def filter(self: TQuestion, context, dynamic=True, inplace_allowed: bool = False) -> Optional[TQuestion]:
@@ -213,6 +225,46 @@ class Question(object):
     def get_question_ids(self, type=None):
         return [self.id] if type in [self.type, None] else []
 
+    def _compile_summary_value(self):
+        """Return a function of service data giving the same result as `QuestionSummary.value`
+
+        Anything that doesn't depend on the service data (rendering options, looking up units) is done
+        once here rather than every time the function is called.
+        """
+        question_id = self.id
+        has_assurance = self.has_assurance()
+        unit = self.get('unit') if self.get('type') == 'number' else None
+        unit_after = unit and self.get('unit_position') == 'after'
+        option_labels = _compile_option_labels(self.get('options'))
+
+        def summary_value(service_data):
+            if has_assurance:
+                value = service_data.get(question_id, {}).get('value', '')
+            else:
+                value = service_data.get(question_id, '')
+            if value != '' and unit:
+                if unit_after:
+                    value = u"{}{}".format(value, unit)
+                else:
+                    return u"{}{}".format(unit, value)
+            if option_labels and value:
+                return option_labels(value)
+
+            return value
+
+        return summary_value
+
+    def _compile_summary_is_empty(self):
+        """Return a function of service data giving the same result as `QuestionSummary.is_empty`"""
+        summary_value = self._compile_summary_value()
+        return lambda service_data: summary_value(service_data) in ('', [], None,)
+
+    def _compile_answer_required(self):
+        """Return a function of service data giving the same result as `QuestionSummary.answer_required`"""
+        if self.get('optional'):
+            return lambda service_data: False
+        return self._compile_summary_is_empty()
+
     def get(self, key, default=None):
         return getattr(self, key, default)
 
@@ -223,15 +275,44 @@ class Question(object):
         field = self._data[key]
 
         if isinstance(field, TemplateField):
-            return field.render(self._context)
+            rendered = self._rendered_fields()
+            if rendered is None:
+                return field.render(self._context)
+            if key not in rendered:
+                rendered[key] = field.render(self._context)
+            return rendered[key]
         elif key in [_field for _field, _ in self.TEMPLATE_OPTIONS_FIELDS]:
-            return [{k: (v.render(self._context) if isinstance(v, TemplateField) else v)
-                     for k, v in i.items()
-                     }
-                    for i in field]
+            rendered = self._rendered_fields()
+            if rendered is None:
+                return self._render_options(field)
+            if key not in rendered:
+                rendered[key] = self._render_options(field)
+            # the caller gets their own list and dicts, as they always have
+            return [dict(option) for option in rendered[key]]
         else:
             return field
 
+    def _rendered_fields(self):
+        """The fields rendered so far with the question's context, or None if the question hasn't been filtered
+
+        The context doesn't change once a question is filtered (unless it's
+        filtered again in place), so each field only needs rendering once.
+        Summaries share the dict with the question they were made from.
+        """
+        if self._context is None:
+            return None
+        context, rendered = self._rendered
+        if context is not self._context:
+            rendered = {}
+            self._rendered = (self._context, rendered)
+        return rendered
+
+    def _render_options(self, field):
+        return [{k: (v.render(self._context) if isinstance(v, TemplateField) else v)
+                 for k, v in i.items()
+                 }
+                for i in field]
+
     def __getitem__(self, key):
         return getattr(self, key)
 
@@ -249,27 +330,61 @@ class Question(object):
         else:
             return field
 
+    def __getstate__(self):
+        # the rendered fields are left out, and `_data` is pickled as a dict (which `MappingProxyType`s can't be)
+        state = {}
+        for name in _STATE_SLOTS:
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        state['_data'] = dict(self._data)
+        return state
+
+    def __setstate__(self, state):
+        self._rendered = (None, None)
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._data = MappingProxyType(self._data)
+
     def __repr__(self):
-        return '<{0.__class__.__name__}: number={0.number}, data={0._data}>'.format(self)
+        return '<{0.__class__.__name__}: number={0.number}, data={1}>'.format(self, dict(self._data))
+
+
+_STATE_SLOTS = [name for name in Question.__slots__ if name != '_rendered']
 
 
 class Multiquestion(Question):
-    def __init__(self, data, *args, **kwargs):
+    __slots__ = ()
+
+    def __init__(self, data, *args, _content_questions=None, **kwargs):
         super(Multiquestion, self).__init__(data, *args, **kwargs)
 
-        self.questions = [
-            ContentQuestion(question)
-            for question in data['questions']
-        ]
+        # the questions made from `_data`, which are shared with the questions made by filtering this one
+        if _content_questions is None:
+            _content_questions = tuple(
+                ContentQuestion(question)
+                for question in data['questions']
+            )
+        self._content_questions: typing.Tuple[Question, ...] = _content_questions
+        self.questions: typing.List[Question] = list(_content_questions)
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "MultiquestionSummary":
-        return MultiquestionSummary(self, service_data)
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "MultiquestionSummary":
+        return MultiquestionSummary(self, service_data, lazy=lazy)
 
     def filter(self: TMultiquestion, context, dynamic=True, inplace_allowed: bool = False) -> Optional[TMultiquestion]:
-        multi_question = super(Multiquestion, self).filter(context, dynamic=dynamic, inplace_allowed=inplace_allowed)
-        if not multi_question:
+        if not self._should_be_shown(context):
             return None
 
+        if inplace_allowed:
+            multi_question = self
+            multi_question._context = context
+        else:
+            # the new question filters the questions made from `_data`, not the ones already filtered
+            multi_question = self.__class__(
+                self._data, number=self.number, _context=context, _content_questions=self._content_questions
+            )
+
         multi_question.questions = list(filter(None, [
             question.filter(context, dynamic, inplace_allowed=inplace_allowed)
             for question in multi_question.questions
@@ -316,8 +431,63 @@ class Multiquestion(Question):
         )
         return OrderedDict((q.id, errors[q.id]) for q in self.questions if q.id in errors.keys())
 
+    def _compile_summary_is_empty(self):
+        questions_are_empty = [question._compile_summary_is_empty() for question in self.questions]
+        return lambda service_data: all(is_empty(service_data) for is_empty in questions_are_empty)
+
+    def _compile_answer_required(self):
+        """See `MultiquestionSummary.answer_required`, which this must give the same results as"""
+        if self.get('optional'):
+            return lambda service_data: False
+
+        answer_required_by_id = {}
+        questions_answer_required = []
+        followup_plan = []
+        for question in self.questions:
+            answer_required = question._compile_answer_required()
+            answer_required_by_id[question.id] = answer_required
+            questions_answer_required.append((question.id, answer_required))
+            if question.get('followup'):
+                followup_plan.append((
+                    question.id,
+                    answer_required,
+                    question._compile_summary_value(),
+                    list(question.followup.items()),
+                ))
+
+        def multiquestion_answer_required(service_data):
+            ignorable_ids = set()
+
+            for question_id, answer_required, summary_value, followups in followup_plan:
+                if question_id not in ignorable_ids:
+                    if answer_required(service_data):
+                        return True
+                    else:
+                        ignorable_ids.add(question_id)
+
+                question_value = summary_value(service_data)
+                answers_provided_set = frozenset(
+                    question_value if isinstance(question_value, list) else (question_value,)
+                )
+
+                for followup_id, answers_triggering_followup in followups:
+                    if answers_provided_set.intersection(answers_triggering_followup) and \
+                            answer_required_by_id[followup_id](service_data):
+                        return True
+
+                    ignorable_ids.add(followup_id)
+
+            return any(
+                answer_required(service_data)
+                for question_id, answer_required in questions_answer_required
+                if question_id not in ignorable_ids
+            )
+
+        return multiquestion_answer_required
+
 
 class DynamicList(Multiquestion):
+    __slots__ = ()
 
     def __init__(self, data, *args, **kwargs):
         super(DynamicList, self).__init__(data, *args, **kwargs)
@@ -327,14 +497,17 @@ class DynamicList(Multiquestion):
         if not dynamic:
             return super(DynamicList, self).filter(context, dynamic=dynamic, inplace_allowed=inplace_allowed)
 
-        dynamic_list = super(Multiquestion, self).filter(
-            context,
-            dynamic=dynamic,
-            inplace_allowed=inplace_allowed,
-        )
-        if not dynamic_list:
+        if not self._should_be_shown(context):
             return None
 
+        if inplace_allowed:
+            dynamic_list = self
+            dynamic_list._context = context
+        else:
+            dynamic_list = self.__class__(
+                self._data, number=self.number, _context=context, _content_questions=self._content_questions
+            )
+
         # dynamic_field: 'brief.essentialRequirements'
         dynamic_questions = self.get_dynamic_questions(context)
 
@@ -472,23 +645,26 @@ class DynamicList(Multiquestion):
     def form_fields(self):
         return [self.id]
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "DynamicListSummary":
-        return DynamicListSummary(self, service_data)
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "DynamicListSummary":
+        return DynamicListSummary(self, service_data, lazy=lazy)
 
     def _make_dynamic_question(self, question, item, index):
         question = question.filter({'item': item})
-        question._data['id'] = '{}-{}'.format(question.id, index)
 
         followups = {}
         for followup, values in question.get('followup', {}).items():
             followups['{}-{}'.format(followup, index)] = values
 
-        question._data['followup'] = followups
+        question._data = MappingProxyType(
+            dict(question._data, id='{}-{}'.format(question.id, index), followup=followups)
+        )
 
         return question
 
 
 class Pricing(Question):
+    __slots__ = ()
+
     def __init__(self, data, *args, **kwargs):
         super(Pricing, self).__init__(data, *args, **kwargs)
         self.fields = data['fields']
@@ -496,9 +672,36 @@ class Pricing(Question):
         # True if we are restricting to an integer or a 2dp value (representing pounds and optionally pence)
         self.decimal_place_restriction = data.get('decimal_place_restriction', False)
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "PricingSummary":
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "PricingSummary":
         return PricingSummary(self, service_data)
 
+    def _compile_summary_value(self):
+        price_field = self.fields.get('price')
+        minimum_price_field = self.fields.get('minimum_price')
+        maximum_price_field = self.fields.get('maximum_price')
+        price_unit_field = self.fields.get('price_unit')
+        price_interval_field = self.fields.get('price_interval')
+        hours_for_price_field = self.fields.get('hours_for_price')
+        field_defaults = self.get('field_defaults', {})
+
+        def summary_value(service_data):
+            price = service_data.get(price_field)
+            minimum_price = service_data.get(minimum_price_field)
+            maximum_price = service_data.get(maximum_price_field)
+
+            if price or minimum_price or maximum_price:
+                return format_price(
+                    price or minimum_price,
+                    maximum_price,
+                    service_data.get(price_unit_field, field_defaults.get('price_unit')),
+                    service_data.get(price_interval_field, field_defaults.get('price_interval')),
+                    service_data.get(hours_for_price_field, field_defaults.get('hours_for_price')),
+                )
+            else:
+                return ''
+
+        return summary_value
+
     def get_question(self, field_name):
         if self.id == field_name or field_name in self.fields.values():
             return self
@@ -544,6 +747,8 @@ class Pricing(Question):
 
 
 class List(Question):
+    __slots__ = ()
+
     def _get_data(self, form_data):
         if self.id not in form_data:
             return {self.id: None}
@@ -552,9 +757,31 @@ class List(Question):
 
         return {self.id: value or None}
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> 'QuestionSummary':
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> 'QuestionSummary':
         return ListSummary(self, service_data)
 
+    def _compile_summary_value(self):
+        question_id = self.id
+        has_assurance = self.has_assurance()
+        option_labels = _compile_option_labels(self.get('options'))
+        before_summary_value = self.get('before_summary_value')
+
+        def summary_value(service_data):
+            if has_assurance:
+                value = service_data.get(question_id, {}).get('value', '')
+            else:
+                value = service_data.get(question_id, '')
+
+            if option_labels and value:
+                value = [option_labels(v) for v in value]
+
+            if before_summary_value:
+                value = before_summary_value + (value or [])
+
+            return value
+
+        return summary_value
+
 
 class Hierarchy(List):
     """
@@ -567,6 +794,7 @@ class Hierarchy(List):
     because some leaf nodes (e.g. subcategories) can appear in multiple
     places in the tree (i.e. in multiple categories).
     """
+    __slots__ = ()
 
     def _get_data(self, form_data):
         if self.id not in form_data:
@@ -576,9 +804,13 @@ class Hierarchy(List):
 
         return {self.id: sorted(values) or None}
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> 'QuestionSummary':
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> 'QuestionSummary':
         return HierarchySummary(self, service_data)
 
+    def _compile_summary_value(self):
+        # the selected options have to be worked out from the service data anyway, so there's nothing to precompute
+        return lambda service_data: HierarchySummary(self, service_data).value
+
     def get_missing_values(self, selected_values_set):
         """
         Recursively retrieves un-selected parent categories of the
@@ -604,12 +836,25 @@ class Hierarchy(List):
 
 class Date(Question):
     """Class used as an interface for date data between forms, backend and summary pages."""
+    __slots__ = ()
 
     FIELDS = ('year', 'month', 'day')
 
-    def summary(self, service_data, inplace_allowed: bool = False) -> "DateSummary":
+    def summary(self, service_data, inplace_allowed: bool = False, lazy: bool = False) -> "DateSummary":
         return DateSummary(self, service_data)
 
+    def _compile_summary_value(self):
+        question_id = self.id
+
+        def summary_value(service_data):
+            value = service_data.get(question_id, '')
+            try:
+                return datetime.strptime(value, DATE_FORMAT).strftime(DISPLAY_DATE_FORMAT)
+            except ValueError:
+                return value
+
+        return summary_value
+
     @staticmethod
     def process_value(value):
         """If there are any hyphens in the value then it does not validate."""
@@ -643,11 +888,15 @@ class Date(Question):
 
 
 class QuestionSummary(Question):
+    __slots__ = ()
+
     def __init__(self, question, service_data):
         self.number = question.number
         self._data = question._data
         self._service_data = service_data
         self._context = question._context
+        question._rendered_fields()
+        self._rendered = question._rendered
 
         if question.get('boolean_list_questions'):
             self.boolean_list_questions = question.boolean_list_questions
@@ -736,6 +985,7 @@ class QuestionSummary(Question):
 
 
 class DateSummary(QuestionSummary):
+    __slots__ = ()
 
     def __init__(self, question, service_data):
         super(DateSummary, self).__init__(question, service_data)
@@ -752,9 +1002,14 @@ class DateSummary(QuestionSummary):
 
 
 class MultiquestionSummary(QuestionSummary, Multiquestion):
-    def __init__(self, question, service_data):
+    __slots__ = ()
+
+    def __init__(self, question, service_data, lazy=False):
         super(MultiquestionSummary, self).__init__(question, service_data)
-        self.questions = [q.summary(service_data) for q in question.questions]
+        if lazy:
+            self.questions = LazyList(question.questions, lambda q: q.summary(service_data, lazy=True))
+        else:
+            self.questions = [q.summary(service_data) for q in question.questions]
 
     @property
     def value(self):
@@ -802,10 +1057,12 @@ class MultiquestionSummary(QuestionSummary, Multiquestion):
 
 
 class DynamicListSummary(MultiquestionSummary, DynamicList):
-    pass
+    __slots__ = ()
 
 
 class PricingSummary(QuestionSummary, Pricing):
+    __slots__ = ()
+
     def __init__(self, question, service_data):
         super(PricingSummary, self).__init__(question, service_data)
         self.fields = question.fields
@@ -829,6 +1086,8 @@ class PricingSummary(QuestionSummary, Pricing):
 
 
 class ListSummary(QuestionSummary, List):
+    __slots__ = ()
+
     @property
     def value(self):
         if self.has_assurance():
@@ -871,6 +1130,8 @@ class ListSummary(QuestionSummary, List):
 
 
 class HierarchySummary(QuestionSummary):
+    __slots__ = ()
+
     def __init__(self, question, service_data):
         self._hierarchy_question = question
         QuestionSummary.__init__(self, question, service_data)
@@ -908,6 +1169,43 @@ class HierarchySummary(QuestionSummary):
         return _get_options_recursive(self._data.get('options', []))
 
 
+def _compile_option_labels(options):
+    """Return a function mapping an answer to its option label the way the summary classes do
+
+    That is, to the label of the first option with both a label and a matching value, or to the answer itself if
+    there isn't one. Returns None if no options have both a label and a value.
+    """
+    labelled_options = [
+        (option['value'], option['label'])
+        for option in options or []
+        if 'label' in option and 'value' in option
+    ]
+    if not labelled_options:
+        return None
+
+    labels: Optional[dict] = {}
+    try:
+        for value, label in labelled_options:
+            labels.setdefault(value, label)
+    except TypeError:
+        # unhashable option values, fall back to searching the list
+        labels = None
+
+    def option_label(value):
+        if labels is not None:
+            try:
+                return labels.get(value, value)
+            except TypeError:
+                pass
+
+        for option_value, label in labelled_options:
+            if option_value == value:
+                return label
+        return value
+
+    return option_label
+
+
 QUESTION_TYPES = {
     'dynamic_list': DynamicList,
     'multiquestion': Multiquestion,
@@ -920,6 +1218,8 @@ QUESTION_TYPES = {
 
 
 class ContentQuestion(Question):
+    __slots__ = ()
+
     def __new__(cls, data, *args, **kwargs):
         if data.get('type') in QUESTION_TYPES:
             return QUESTION_TYPES[data['type']](data, *args, **kwargs)
@@ -1,7 +1,8 @@
+import threading
 import typing
 
 from collections import abc
-from jinja2 import Markup, StrictUndefined, TemplateSyntaxError, UndefinedError
+from jinja2 import Markup, StrictUndefined, TemplateSyntaxError, UndefinedError, meta
 from markdown import Markdown
 
 from dmutils.jinja2_environment import DMSandboxedEnvironment
@@ -39,6 +40,8 @@ class _ImmutableTemplateProxy:
 
 
 class TemplateField(object):
+    __slots__ = ("source", "markdown", "template")
+
     markdown_instance = Markdown(extensions=[GOVUKFrontendExtension()])
 
     def __init__(self, field_value, markdown=None):
@@ -65,11 +68,26 @@ class TemplateField(object):
         except UndefinedError as e:
             raise ContentTemplateError(e.message)
 
+    def variables(self) -> typing.FrozenSet[str]:
+        """The names of the context variables the template uses"""
+        return frozenset(meta.find_undeclared_variables(template_environment.parse(self.source)))
+
     def __eq__(self, other):
         if not isinstance(other, TemplateField):
             return False
         return (self.source == other.source)
 
+    def __reduce__(self):
+        # the compiled template can't be pickled, so it's compiled again from the source when it's loaded
+        return TemplateField, (self.source, self.markdown)
+
+    def __copy__(self):
+        # we're (effectively) immutable.
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __repr__(self):
         return '<{}: "{}">'.format(
             self.__class__.__name__,
@@ -77,6 +95,39 @@ class TemplateField(object):
         )
 
 
+class _Identity:
+    """Wraps content for use in a cache key, comparing equal only to a wrapper of the very same object
+
+    Holding a reference to the object also means its id can't be reused while the key exists.
+    """
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+
+def content_key(data: typing.Mapping) -> tuple:
+    """A key for caching things made from a question's content
+
+    Questions made from the same content (by a `ContentLoader`, or by
+    filtering and summarising) share their (unchanging) option lists,
+    templates etc., even when the questions themselves are new, so those are
+    compared by identity rather than value. Other values are kept with their
+    type as, for example, `True == 1` and `Markup("<b>") == "<b>"` but they
+    are rendered differently.
+    """
+    return tuple(
+        (key, (value.__class__, value) if isinstance(value, (str, int, float, type(None))) else _Identity(value))
+        for key, value in data.items()
+    )
+
+
 def template_all(item):
     if isinstance(item, str):
         return TemplateField(item)
@@ -177,21 +228,65 @@ def count_unanswered_questions(service_attributes: "ContentManifest") -> typing.
     return unanswered_required, unanswered_optional
 
 
+def count_unanswered_questions_many(
+    content_manifest: "ContentManifest",
+    services: typing.Iterable[dict],
+) -> typing.List[typing.Tuple[int, int]]:
+    """
+        Given a filtered (not "summary") ContentManifest and an iterable of service data dicts, returns a list
+        with a tuple of integers for each service, giving the same counts as calling
+        `count_unanswered_questions(content_manifest.summary(service_data))` for each of them.
+
+        The required fields and followups of every question are compiled once up front, so no summary objects are
+        created for the individual services.
+    """
+    plan = [
+        (question._compile_answer_required(), question._compile_summary_is_empty())
+        for section in content_manifest
+        for question in section.questions
+    ]
+
+    counts = []
+    for service_data in services:
+        unanswered_required, unanswered_optional = 0, 0
+        for answer_required, is_empty in plan:
+            if answer_required(service_data):
+                unanswered_required += 1
+            elif is_empty(service_data):
+                unanswered_optional += 1
+        counts.append((unanswered_required, unanswered_optional))
+
+    return counts
+
+
 class LazyDict(abc.MutableMapping):
     """
     A dictionary for values that will be lazily evaluated the first time they are requested.
     If a value is callable, then it will be called the first time that value is requested and the result cached.
 
-    This is probably not thread safe, so any callable inserted should be idempotent
+    Values are evaluated one at a time (across every `LazyDict`), so a value requested by several threads at once is
+    only evaluated once, and the callables don't have to be thread safe.
     """
+    # shared, rather than one per dictionary, as the callables tend to share state (eg a `ContentLoader`)
+    _evaluating = threading.RLock()
+
     def __init__(self, *args, **kw):
         self._raw_dict = dict(*args, **kw)
 
     def __getitem__(self, key):
-        if key in self._raw_dict and callable(self._raw_dict.get(key)):
-            self._raw_dict[key] = self._raw_dict[key]()
+        value = self._raw_dict[key]
+        if callable(value):
+            with self._evaluating:
+                # another thread may have evaluated it while we waited
+                value = self._raw_dict[key]
+                if callable(value):
+                    value = self._raw_dict[key] = value()
+
+        return value
 
-        return self._raw_dict.__getitem__(key)
+    def __contains__(self, key):
+        # without this, checking for a key would evaluate its value
+        return key in self._raw_dict
 
     def __iter__(self):
         return iter(self._raw_dict)
@@ -204,3 +299,47 @@ class LazyDict(abc.MutableMapping):
 
     def __delitem__(self, key):
         self._raw_dict.__delitem__(key)
+
+
+class LazyList(abc.Sequence):
+    """
+    A read-only list whose values are made by calling `function` on the corresponding item of `items`, the first time
+    that value is requested. The result is cached, so each item is only converted once.
+
+    This is probably not thread safe, so `function` should be idempotent
+    """
+    _not_evaluated = object()
+
+    def __init__(self, items, function):
+        self._items = list(items)
+        self._function = function
+        self._values = [self._not_evaluated] * len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        value = self._values[index]
+        if value is self._not_evaluated:
+            value = self._values[index] = self._function(self._items[index])
+
+        return value
+
+    def __len__(self):
+        return len(self._items)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, LazyList)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __reduce__(self):
+        # `function` is usually a lambda, so pickle (and copy) the list we'd end up with
+        return list, (list(self),)
+
+    def __repr__(self):
+        return '<{}: {} of {} evaluated>'.format(
+            self.__class__.__name__,
+            sum(value is not self._not_evaluated for value in self._values),
+            len(self),
+        )
@@ -0,0 +1,84 @@
+"""Reload content as its files are edited, without restarting the app"""
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .content_loader import ContentLoader
+
+logger = logging.getLogger(__name__)
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ContentWatcher(object):
+    """Reloads the content a `ContentLoader` made from any of its files that have changed
+
+    This is for working on content locally: it polls the files with `os.stat`
+    rather than relying on any file system notifications. Only the content
+    made from the changed files is reloaded, as `ContentLoader.reload_files`.
+
+    >>> watcher = ContentWatcher(loader)
+    >>> # reload whatever has changed since the last check
+    >>> watcher.check()
+    >>> # or check every second in a background thread
+    >>> watcher.start(interval=1)
+    """
+    def __init__(self, loader: ContentLoader):
+        if loader._bundle is not None:
+            raise ValueError("Content loaded from a bundle can't be watched")
+
+        self.loader = loader
+        self._stats: Dict[str, Optional[Tuple[int, int]]] = {
+            path: _stat(path) for path in loader._dependency_files()
+        }
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> List[Tuple[str, ...]]:
+        """Reload the content made from any files that have changed since the last check
+
+        Returns the manifests, messages and metadata that were reloaded. Files
+        the loader has read since the last check are only watched from now on.
+        """
+        with self._lock:
+            changed = []
+            for path in self.loader._dependency_files():
+                stat = _stat(path)
+                if path in self._stats and self._stats[path] != stat:
+                    changed.append(path)
+                self._stats[path] = stat
+
+            if not changed:
+                return []
+            return self.loader.reload_files(changed)
+
+    def start(self, interval: float = 1.0):
+        """Check for changes every `interval` seconds in a background thread, until `stop()` is called"""
+        def run():
+            while not self._stopped.wait(interval):
+                try:
+                    reloaded = self.check()
+                except Exception:
+                    # the file is probably only half edited, and will change again
+                    logger.exception("Couldn't reload content")
+                else:
+                    if reloaded:
+                        logger.info("Reloaded content %s", reloaded)
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=run, name="dmcontent-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,529 @@
+#!/usr/bin/env python
+"""Rough timings for dmcontent's hot paths
+
+Usage:
+    python scripts/benchmark.py [<benchmark>...]
+
+With no arguments every benchmark is run. The content is generated in memory
+(or in a temporary directory), so no frameworks checkout is needed.
+"""
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from dmcontent import govuk_frontend  # noqa: E402
+from dmcontent.bundle import ContentBundle, build_bundle  # noqa: E402
+from dmcontent.content_loader import ContentLoader, ContentManifest, read_yaml  # noqa: E402
+from dmcontent.html import SummaryHTMLCache, to_summary_list_rows  # noqa: E402
+from dmcontent.utils import TemplateField  # noqa: E402
+from dmcontent.watch import ContentWatcher  # noqa: E402
+
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__.replace("_", "-")] = func
+    return func
+
+
+def report(label, func, number=1, repeat=5):
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"    {label:<50} {best * 1000:10.2f}ms")
+    return best
+
+
+def make_manifest_sections(sections=10, questions_per_section=10):
+    """Sections with a mix of the question types we usually see on a service page"""
+    manifest_sections = []
+    for section_index in range(sections):
+        questions = []
+        for question_index in range(questions_per_section):
+            question_id = f"s{section_index}q{question_index}"
+            kind = question_index % 5
+            if kind == 0:
+                questions.append({"id": question_id, "type": "text", "question": f"Question {question_id}"})
+            elif kind == 1:
+                questions.append({
+                    "id": question_id,
+                    "type": "radios",
+                    "question": f"Question {question_id}",
+                    "options": [{"label": f"Option {i}", "value": f"option-{i}"} for i in range(5)],
+                })
+            elif kind == 2:
+                questions.append({
+                    "id": question_id,
+                    "type": "checkboxes",
+                    "question": f"Question {question_id}",
+                    "optional": True,
+                    "options": [{"label": f"Option {i}"} for i in range(10)],
+                })
+            elif kind == 3:
+                questions.append({"id": question_id, "type": "boolean", "question": f"Question {question_id}"})
+            else:
+                questions.append({
+                    "id": question_id,
+                    "type": "multiquestion",
+                    "question": f"Question {question_id}",
+                    "questions": [
+                        {
+                            "id": f"{question_id}a",
+                            "type": "boolean",
+                            "question": "Do you?",
+                            "followup": {f"{question_id}b": [True]},
+                        },
+                        {"id": f"{question_id}b", "type": "textbox_large", "question": "How?"},
+                        {"id": f"{question_id}c", "type": "text", "question": "Anything else?", "optional": True},
+                    ],
+                })
+        manifest_sections.append({
+            "slug": f"section-{section_index}",
+            "name": f"Section {section_index}",
+            "questions": questions,
+        })
+
+    return manifest_sections
+
+
+def make_templated_manifest_sections(**kwargs):
+    """`make_manifest_sections()` with the question text, hints and option descriptions templated by lot"""
+    sections = make_manifest_sections(**kwargs)
+    for section in sections:
+        for question in section["questions"]:
+            question["question"] = TemplateField(question["question"] + " for {{ lot }}")
+            question["hint"] = TemplateField("Tell us about your {{ lot }} service")
+            for option in question.get("options", []):
+                option["description"] = TemplateField("{{ lot }} option")
+    return sections
+
+
+LONG_ANSWER = (
+    "our service is described in full at https://www.example.com/service and our accessibility statement is at "
+    "https://www.example.com/accessibility.\r\n\r\n"
+) * 5
+
+
+def make_service(manifest, index):
+    service = {"id": index}
+    for section in manifest:
+        for question in section.questions:
+            if question.type == "multiquestion":
+                service[question.questions[0].id] = bool(index % 2)
+                service[question.questions[1].id] = LONG_ANSWER
+            elif question.type == "radios":
+                service[question.id] = f"option-{index % 5}"
+            elif question.type == "checkboxes":
+                service[question.id] = [f"Option {i}" for i in range(index % 4)]
+            elif question.type == "boolean":
+                service[question.id] = bool(index % 3)
+            elif index % 7:
+                service[question.id] = f"answer {index}, more at https://www.example.com/services/{index}"
+    return service
+
+
+@benchmark
+def manifest_traversal():
+    """Read the section attributes navigation templates use, for every section of a manifest, 10,000 times"""
+    manifest = ContentManifest(make_manifest_sections()).filter({})
+
+    def walk():
+        for _ in range(10000):
+            for section in manifest:
+                section.slug, section.name, section.description, section.editable, section.edit_questions
+                section.questions, section.prefill, section.step, section.get_field_names
+
+    report("section attributes", walk, repeat=5)
+
+
+@benchmark
+def question_attributes():
+    """Read the fields a question template uses, for every question of a manifest, 100 times"""
+    manifest = ContentManifest(make_templated_manifest_sections()).filter({"lot": "cloud-hosting"})
+
+    def read():
+        for _ in range(100):
+            for section in manifest:
+                for question in section.questions:
+                    question.question, question.hint, question.get("options"), question.label
+
+    report("question fields", read, repeat=3)
+
+
+@benchmark
+def manifest_memory():
+    """Memory held by a 500 question framework's manifest and its copies filtered for 4 lots"""
+    tracemalloc.start()
+    try:
+        manifest = ContentManifest(make_templated_manifest_sections(sections=50))
+        loaded, _ = tracemalloc.get_traced_memory()
+        lots = [manifest.filter({"lot": lot}) for lot in ("cloud-hosting", "cloud-software", "cloud-support", "other")]
+        filtered, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print(f"    {'loaded manifest':<50} {loaded / 1024:10.0f}KiB")
+    print(f"    {'filtered for each lot':<50} {(filtered - loaded) / 1024:10.0f}KiB")
+    return manifest, lots
+
+
+def write_frameworks_content(content_path, frameworks=2, questions=200):
+    """Content files for some frameworks, each asking (almost) the same questions"""
+    for framework_index in range(frameworks):
+        framework_path = os.path.join(content_path, "frameworks", f"framework-{framework_index}")
+        os.makedirs(os.path.join(framework_path, "questions", "services"))
+        os.makedirs(os.path.join(framework_path, "manifests"))
+        os.makedirs(os.path.join(framework_path, "messages"))
+        for question_index in range(questions):
+            question = {
+                "question": f"Question {question_index}",
+                "question_advice": "Tell us about it.\n\nBe specific.",
+                "type": "radios" if question_index % 2 else "checkboxes",
+                "optional": bool(question_index % 3),
+                "options": [
+                    {"label": f"Option {i}", "value": f"option-{i}", "description": "Applies to {{ lot }}"}
+                    for i in range(8)
+                ],
+                "validations": [{"name": "answer_required", "message": "You need to answer this question."}],
+            }
+            if question_index == framework_index:
+                question["hint"] = f"Only on framework {framework_index}"
+            with open(os.path.join(framework_path, "questions", "services", f"q{question_index}.yml"), "w") as f:
+                yaml.safe_dump(question, f)
+        with open(os.path.join(framework_path, "manifests", "edit_submission.yml"), "w") as f:
+            yaml.safe_dump([
+                {"name": f"Section {i}", "questions": [f"q{j}" for j in range(i * 10, i * 10 + 10)]}
+                for i in range(questions // 10)
+            ], f)
+        with open(os.path.join(framework_path, "messages", "dashboard.yml"), "w") as f:
+            yaml.safe_dump({"status": {state: f"Your application is {state}" for state in ("open", "closed")}}, f)
+
+
+@benchmark
+def content_loader_memory():
+    """Memory held by a ContentLoader after loading two frameworks that share most of their questions"""
+    with tempfile.TemporaryDirectory() as content_path:
+        write_frameworks_content(content_path)
+
+        def load():
+            loader = ContentLoader(content_path)
+            for framework_slug in ("framework-0", "framework-1"):
+                loader.load_manifest(framework_slug, "services", "edit_submission")
+                loader.load_messages(framework_slug, ["dashboard"])
+            return loader
+
+        share = ContentLoader._share
+        for label in ("without sharing", "with sharing"):
+            ContentLoader._share = share if label == "with sharing" else lambda self, framework_slug, content: content
+            tracemalloc.start()
+            try:
+                loader = load()
+                loaded, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+                ContentLoader._share = share
+            print(f"    {label:<50} {loaded / 1024:10.0f}KiB")
+        for framework_slug, saved in loader.bytes_saved.items():
+            print(f"    bytes_saved[{framework_slug!r}] = {saved}")
+        print(f"    dedup_ratio = {loader.dedup_ratio:.2f}")
+        report("loading both frameworks", load, number=1, repeat=3)
+
+
+@benchmark
+def content_bundle():
+    """Load two frameworks from their YAML files and from a content bundle"""
+    with tempfile.TemporaryDirectory() as content_path:
+        write_frameworks_content(content_path)
+        bundle_path = os.path.join(content_path, "content.bundle")
+        build_bundle(content_path, bundle_path)
+
+        def load(loader):
+            for framework_slug in ("framework-0", "framework-1"):
+                loader.load_manifest(framework_slug, "services", "edit_submission")
+                loader.load_messages(framework_slug, ["dashboard"])
+            return loader
+
+        def read_files():
+            for directory, _, filenames in os.walk(os.path.join(content_path, "frameworks")):
+                for filename in filenames:
+                    read_yaml(os.path.join(directory, filename))
+
+        def read_bundle():
+            bundle = ContentBundle(bundle_path)
+            for directory, _, filenames in os.walk(os.path.join(content_path, "frameworks")):
+                for filename in filenames:
+                    bundle.read(os.path.relpath(os.path.join(directory, filename), content_path))
+
+        report("reading every YAML file", read_files, repeat=3)
+        report("reading every file from the bundle", read_bundle, repeat=3)
+        report("loading from YAML files", lambda: load(ContentLoader(content_path)), repeat=3)
+        report("loading from the bundle", lambda: load(ContentLoader.from_bundle(bundle_path)), repeat=3)
+
+        def load_lazily_and_use_one_framework():
+            loader = ContentLoader.from_bundle(bundle_path, lazy=True)
+            load(loader)
+            loader.get_manifest("framework-0", "edit_submission")
+            loader.get_message("framework-0", "dashboard")
+            return loader
+
+        report("loading lazily, then using one framework", load_lazily_and_use_one_framework, repeat=3)
+        loaders = []
+        for label, load_bundle in (
+            ("memory after loading from the bundle", lambda: load(ContentLoader.from_bundle(bundle_path))),
+            ("memory after loading lazily, using one framework", load_lazily_and_use_one_framework),
+        ):
+            tracemalloc.start()
+            try:
+                loaders.append(load_bundle())
+                loaded, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            print(f"    {label:<50} {loaded / 1024:10.0f}KiB")
+        return loaders
+
+
+@benchmark
+def hot_reload():
+    """Reload a 200 question framework after one of its question files is edited"""
+    with tempfile.TemporaryDirectory() as content_path:
+        write_frameworks_content(content_path, frameworks=1)
+        question_path = os.path.join(content_path, "frameworks", "framework-0", "questions", "services", "q42.yml")
+
+        def load():
+            loader = ContentLoader(content_path)
+            loader.load_manifest("framework-0", "services", "edit_submission")
+            loader.load_messages("framework-0", ["dashboard"])
+            return loader
+
+        loader = load()
+        watcher = ContentWatcher(loader)
+        edits = iter(range(1, 1000))
+
+        def edit_and_check():
+            edit = next(edits)
+            with open(question_path) as f:
+                question = yaml.safe_load(f)
+            question["question"] = f"Question 42, edit {edit}"
+            with open(question_path, "w") as f:
+                yaml.safe_dump(question, f)
+            os.utime(question_path, ns=(edit * 1_000_000_000, edit * 1_000_000_000))
+            assert watcher.check()
+
+        report("loading everything again", load, repeat=3)
+        report("ContentWatcher.check() with nothing changed", watcher.check, number=10)
+        report("ContentWatcher.check() after editing a question", edit_and_check, number=10)
+
+
+@benchmark
+def filter_and_summary():
+    """Filter a manifest for a lot and summarise it for a service, as a service page does"""
+    manifest = ContentManifest(make_templated_manifest_sections())
+    service = make_service(manifest.filter({"lot": "cloud-hosting"}), 1)
+
+    def cycle():
+        return manifest.filter({"lot": "cloud-hosting"}).summary(service)
+
+    tracemalloc.start()
+    try:
+        snapshots = [tracemalloc.take_snapshot()]
+        filtered = manifest.filter({"lot": "cloud-hosting"})
+        snapshots.append(tracemalloc.take_snapshot())
+        summary = filtered.summary(service)
+        snapshots.append(tracemalloc.take_snapshot())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    for label, before, after in (("filter()", *snapshots[:2]), ("summary()", *snapshots[1:])):
+        blocks = sum(statistic.count_diff for statistic in after.compare_to(before, "filename"))
+        print(f"    {'memory blocks kept by ' + label:<50} {blocks:10}")
+    print(f"    {'peak memory':<50} {peak / 1024:10.0f}KiB")
+    report("filter().summary()", cycle, number=10, repeat=5)
+    return filtered, summary
+
+
+@benchmark
+def summarise_many():
+    """A listing page showing a couple of answers from the first section of 1,000 services"""
+    manifest = ContentManifest(make_manifest_sections()).filter({})
+    services = [make_service(manifest, i) for i in range(1000)]
+
+    def use(summary):
+        return [question.value for question in summary.sections[0].questions[:2]]
+
+    report("summary() for each service", lambda: [use(manifest.summary(s)) for s in services], repeat=3)
+    report("summary(lazy=True) for each service", lambda: [use(manifest.summary(s, lazy=True)) for s in services])
+    report("summarise_many()", lambda: [use(summary) for summary in manifest.summarise_many(services)])
+
+
+@benchmark
+def summary_html():
+    """Service pages for 50 services, each viewed 10 times"""
+    manifest = ContentManifest(make_manifest_sections()).filter({})
+    services = [make_service(manifest, i) for i in range(50)] * 10
+    summaries = [manifest.summary(service) for service in services]
+
+    def render(**kwargs):
+        for summary in summaries:
+            for section in summary:
+                to_summary_list_rows(section.questions, capitalize_first=True, format_links=True, **kwargs)
+
+    report("to_summary_list_rows()", render, repeat=3)
+    cache = SummaryHTMLCache(maxsize=10000)
+    report("to_summary_list_rows(cache=...)", lambda: render(cache=cache), repeat=3)
+    print(f"    hit rate {cache.hit_rate:.1%}, {cache.cache_info()}")
+
+
+@benchmark
+def edit_pages():
+    """Edit pages for each section of 50 services, with errors on every third page"""
+    manifest_sections = make_manifest_sections()
+    manifest = ContentManifest(manifest_sections).filter({})
+    services = [make_service(manifest, i) for i in range(50)]
+    pages = []
+    for index, service in enumerate(services):
+        for section_index, section in enumerate(manifest):
+            errors = {}
+            if index % 3 == 0:
+                errors = {
+                    question.id: {"input_name": question.id, "question": question.question, "message": "Answer this"}
+                    for question in section.questions
+                }
+            pages.append((section_index, service, errors))
+
+    def render(new_manifests=False, from_scratch=False):
+        for section_index, service, errors in pages:
+            if from_scratch:
+                govuk_frontend._skeletons.clear()
+            # apps get the manifest from the content loader and filter it for each request
+            page_manifest = ContentManifest(manifest_sections).filter({}) if new_manifests else manifest
+            for question in page_manifest.sections[section_index].questions:
+                govuk_frontend.from_question(question, service, errors)
+
+    report("from_question() working out every page from scratch", lambda: render(from_scratch=True), repeat=3)
+    report("from_question() with a new manifest for each page", lambda: render(new_manifests=True), repeat=3)
+    report("from_question()", render, repeat=3)
+
+
+@benchmark
+def long_option_lists():
+    """A checkboxes question with 300 options, rendered for 200 services"""
+    manifest = ContentManifest([{
+        "slug": "section",
+        "name": "Section",
+        "questions": [{
+            "id": "locations",
+            "type": "checkboxes",
+            "question": "Where?",
+            "options": [{"label": f"Location {i}", "value": f"location-{i}"} for i in range(300)],
+        }],
+    }]).filter({})
+    question = manifest.sections[0].questions[0]
+    services = [{"locations": [f"location-{j}" for j in range(i % 10)]} for i in range(200)]
+
+    report("from_question()", lambda: [govuk_frontend.from_question(question, s) for s in services], repeat=5)
+
+
+def make_template_env():
+    """A template environment with the govuk-frontend macros, and the Jinja to import them, if we have them"""
+    try:
+        import jinja2
+        import govuk_frontend_jinja  # noqa: F401
+    except ImportError:
+        print("    skipped, needs govuk-frontend-jinja (see requirements-dev.txt)")
+        return None, None
+
+    env = jinja2.Environment(
+        loader=jinja2.PrefixLoader({"govuk_frontend_jinja": jinja2.PackageLoader("govuk_frontend_jinja")}),
+        autoescape=True,
+        undefined=jinja2.ChainableUndefined,
+    )
+    env.globals["render_question"] = govuk_frontend.render_question
+    env.globals["render_section"] = govuk_frontend.render_section
+    imports = "".join(
+        f'{{% from "govuk_frontend_jinja/components/{directory}/macro.html" import {name} %}}'
+        for name, directory in (
+            ("govukCheckboxes", "checkboxes"), ("govukCharacterCount", "character-count"),
+            ("govukFieldset", "fieldset"), ("govukInput", "input"), ("govukLabel", "label"),
+            ("govukRadios", "radios"),
+        )
+    )
+    return env, imports
+
+
+@benchmark
+def render_questions():
+    """Render each section of a manifest 10 times with govuk-frontend macros and in Python, a new manifest each time"""
+    env, imports = make_template_env()
+    if env is None:
+        return
+
+    questions_template = env.from_string(
+        imports
+        + "{% for question in section.questions %}{{ render_question(question, service, errors) }}{% endfor %}"
+    )
+    section_template = env.from_string(imports + "{{ render_section(section, service, errors) }}")
+    manifest_sections = make_manifest_sections()
+    service = make_service(ContentManifest(manifest_sections).filter({}), 1)
+
+    def render(template):
+        for _ in range(10):
+            for section_index in range(len(manifest_sections)):
+                # apps get the manifest from the content loader and filter it for each request
+                section = ContentManifest(manifest_sections).filter({}).sections[section_index]
+                template.render(section=section, service=service, errors={})
+
+    report("render_question() with macros", lambda: render(questions_template), repeat=3)
+    report("render_section() with macros", lambda: render(section_template), repeat=3)
+    govuk_frontend.python_components = True
+    try:
+        report("render_question() with python_components", lambda: render(questions_template), repeat=3)
+        report("render_section() with python_components", lambda: render(section_template), repeat=3)
+    finally:
+        govuk_frontend.python_components = False
+
+
+@benchmark
+def declaration_page():
+    """A 50 question declaration page rendered 20 times, with and without keeping the macros render() finds"""
+    env, imports = make_template_env()
+    if env is None:
+        return
+
+    template = env.from_string(
+        imports
+        + "{% for question in section.questions %}{{ render_question(question, service, errors) }}{% endfor %}"
+    )
+    section = ContentManifest(make_manifest_sections(sections=1, questions_per_section=50)).filter({}).sections[0]
+    service = make_service([section], 1)
+
+    def render():
+        for _ in range(20):
+            template.render(section=section, service=service, errors={})
+
+    cached_resolve = govuk_frontend._resolve
+    for python_components in (False, True):
+        govuk_frontend.python_components = python_components
+        label = "in Python" if python_components else "with macros"
+        try:
+            govuk_frontend._resolve = govuk_frontend._resolve_macro
+            report(f"render_question() {label}, no resolve cache", render, repeat=3)
+            govuk_frontend._resolve = cached_resolve
+            report(f"render_question() {label}", render, repeat=3)
+        finally:
+            govuk_frontend._resolve = cached_resolve
+            govuk_frontend.python_components = False
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            sys.exit(f"Unknown benchmark {name!r}, choose from: {', '.join(BENCHMARKS)}")
+    for name in names:
+        print(f"{name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name]()
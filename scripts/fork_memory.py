@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""How much of a ContentLoader's memory forked workers share with the process that loaded it
+
+Usage:
+    python scripts/fork_memory.py [--workers=<n>] [--frameworks=<n>] [--questions=<n>]
+
+Loads some generated frameworks, then (once without and once with
+`ContentLoader.freeze()`) forks workers that use the content like an app
+would, running the garbage collector as they go. Each worker reports how much
+of its memory is still shared with the others and how much has become its
+own. Needs Linux (it reads /proc/<pid>/smaps_rollup).
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from benchmark import write_frameworks_content  # noqa: E402
+from dmcontent.content_loader import ContentLoader  # noqa: E402
+
+
+def memory_kib(pid="self"):
+    """The (shared, private) memory of a process, in KiB"""
+    memory = {}
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        for line in smaps:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                memory[parts[0].rstrip(":")] = int(parts[1])
+
+    return (
+        memory["Shared_Clean"] + memory["Shared_Dirty"],
+        memory["Private_Clean"] + memory["Private_Dirty"],
+    )
+
+
+def work(loader, frameworks):
+    """Roughly what a worker does with the content while handling requests"""
+    for _ in range(3):
+        for framework_index in range(frameworks):
+            manifest = loader.get_manifest(f"framework-{framework_index}", "edit_submission")
+            filtered = manifest.filter({"lot": "cloud-hosting"})
+            for section in filtered.summary({}):
+                for question in section.questions:
+                    question.question, question.get("options"), question.answer_required
+            loader.get_message(f"framework-{framework_index}", "dashboard").status
+        gc.collect()
+
+
+def run(content_path, frameworks, workers, freeze):
+    """Load the content, fork the workers and print what they report"""
+    loader = ContentLoader(content_path)
+    for framework_index in range(frameworks):
+        loader.load_manifest(f"framework-{framework_index}", "services", "edit_submission")
+        loader.load_messages(f"framework-{framework_index}", ["dashboard"])
+    if freeze:
+        loader.freeze()
+
+    pipes = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            work(loader, frameworks)
+            os.write(write_fd, "{} {}".format(*memory_kib()).encode())
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    shared_total = private_total = 0
+    for pid, read_fd in pipes:
+        with os.fdopen(read_fd) as pipe:
+            shared, private = map(int, pipe.read().split())
+        os.waitpid(pid, 0)
+        shared_total += shared
+        private_total += private
+
+    label = "frozen" if freeze else "not frozen"
+    print(f"    {label:<50} {shared_total // workers:8}KiB shared {private_total // workers:8}KiB private")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--frameworks", type=int, default=4)
+    parser.add_argument("--questions", type=int, default=500)
+    args = parser.parse_args()
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        sys.exit("This needs /proc/<pid>/smaps_rollup (Linux 4.14 or later)")
+
+    with tempfile.TemporaryDirectory() as content_path:
+        write_frameworks_content(content_path, frameworks=args.frameworks, questions=args.questions)
+        print(f"memory per worker ({args.workers} workers, {args.frameworks} frameworks of {args.questions} questions)")
+        for freeze in (False, True):
+            # gc.freeze() is for the whole process, so each run loads the content in a fresh one
+            pid = os.fork()
+            if pid == 0:
+                run(content_path, args.frameworks, args.workers, freeze)
+                sys.stdout.flush()
+                os._exit(0)
+            os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
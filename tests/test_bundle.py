@@ -0,0 +1,229 @@
+import datetime
+import gc
+import os
+import pickle
+
+import mock
+import pytest
+import yaml
+
+from dmcontent.bundle import ContentBundle, build_bundle, main
+from dmcontent.content_loader import ContentLoader, ContentNotFoundError
+
+
+def write_yaml(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        yaml.safe_dump(content, f)
+
+
+@pytest.fixture
+def content_path(tmp_path):
+    framework_path = tmp_path / "frameworks" / "g-cloud-12"
+    write_yaml(framework_path / "manifests" / "edit_service.yml", [
+        {"name": "About {{ lot }}", "questions": ["serviceName", "serviceType"]},
+    ])
+    write_yaml(framework_path / "questions" / "services" / "serviceName.yml", {
+        "question": "Service name", "type": "text", "hint": "Up to 100 characters",
+    })
+    write_yaml(framework_path / "questions" / "services" / "serviceType.yml", {
+        "question": "Service type", "type": "radios",
+        "options": [{"label": "One", "description": "The {{ lot }} one"}, {"label": "Two"}],
+    })
+    write_yaml(framework_path / "messages" / "dashboard.yml", {"status": {"open": "{{ lot }} is open"}})
+    write_yaml(framework_path / "metadata" / "copy_services.yml", {
+        "source_framework": "g-cloud-11", "opens": datetime.date(2020, 9, 1),
+    })
+    (framework_path / "README.md").write_text("Not content")
+
+    return str(tmp_path)
+
+
+@pytest.fixture
+def bundle_path(content_path, tmp_path):
+    bundle_path = str(tmp_path / "content.bundle")
+    build_bundle(content_path, bundle_path)
+    return bundle_path
+
+
+class TestContentBundle(object):
+    def test_bundle_has_every_yaml_file(self, bundle_path):
+        bundle = ContentBundle(bundle_path)
+
+        assert len(bundle) == 5
+        assert "frameworks/g-cloud-12/questions/services/serviceName.yml" in bundle
+        assert "frameworks/g-cloud-12/README.md" not in bundle
+
+    def test_read_returns_parsed_yaml(self, bundle_path):
+        bundle = ContentBundle(bundle_path)
+
+        assert bundle.read("frameworks/g-cloud-12/questions/services/serviceName.yml") == {
+            "question": "Service name", "type": "text", "hint": "Up to 100 characters",
+        }
+        assert bundle.read("frameworks/g-cloud-12/metadata/copy_services.yml") == {
+            "source_framework": "g-cloud-11", "opens": datetime.date(2020, 9, 1),
+        }
+
+    def test_read_returns_a_new_copy_each_time(self, bundle_path):
+        bundle = ContentBundle(bundle_path)
+        path = "frameworks/g-cloud-12/manifests/edit_service.yml"
+
+        bundle.read(path)[0]["name"] = "Changed"
+
+        assert bundle.read(path)[0]["name"] == "About {{ lot }}"
+
+    def test_read_missing_file_raises_file_not_found(self, bundle_path):
+        bundle = ContentBundle(bundle_path)
+
+        with pytest.raises(FileNotFoundError):
+            bundle.read("frameworks/g-cloud-12/questions/services/notAQuestion.yml")
+
+    def test_listdir(self, bundle_path):
+        bundle = ContentBundle(bundle_path)
+
+        assert sorted(bundle.listdir("frameworks/g-cloud-12/questions/services")) == [
+            "serviceName.yml", "serviceType.yml"
+        ]
+        assert bundle.listdir("frameworks/g-cloud-12/manifests/") == ["edit_service.yml"]
+        with pytest.raises(FileNotFoundError):
+            bundle.listdir("frameworks/g-cloud-12/questions/declaration")
+        with pytest.raises(FileNotFoundError):
+            bundle.listdir("frameworks/g-cloud-12/questions/serv")
+
+    def test_not_a_bundle(self, content_path):
+        with pytest.raises(ValueError):
+            ContentBundle(os.path.join(content_path, "frameworks", "g-cloud-12", "README.md"))
+
+    def test_can_be_pickled(self, bundle_path):
+        bundle = pickle.loads(pickle.dumps(ContentBundle(bundle_path)))
+
+        assert len(bundle) == 5
+
+    def test_main_builds_bundle(self, content_path, tmp_path, capsys):
+        bundle_path = str(tmp_path / "main.bundle")
+
+        main([content_path, bundle_path])
+
+        assert len(ContentBundle(bundle_path)) == 5
+        assert capsys.readouterr().out == f"Wrote 5 files to {bundle_path}\n"
+
+
+def load(loader):
+    loader.load_manifest("g-cloud-12", "services", "edit_service")
+    loader.load_messages("g-cloud-12", ["dashboard"])
+    loader.load_metadata("g-cloud-12", ["copy_services"])
+    return loader
+
+
+class TestContentLoaderFromBundle(object):
+    def test_loads_the_same_content_as_the_yaml_files(self, content_path, bundle_path):
+        from_files = load(ContentLoader(content_path))
+        from_bundle = load(ContentLoader.from_bundle(bundle_path))
+
+        assert from_bundle._content == from_files._content
+        assert from_bundle._questions == from_files._questions
+        assert from_bundle._messages == from_files._messages
+        assert from_bundle._metadata == from_files._metadata
+
+        manifest = from_bundle.get_manifest("g-cloud-12", "edit_service").filter({"lot": "SaaS"})
+        assert manifest.sections[0].name == "About SaaS"
+        assert manifest.get_question("serviceType").options[0]["description"] == "The SaaS one"
+        assert from_bundle.get_message("g-cloud-12", "dashboard").filter({"lot": "SaaS"}).status.open == "SaaS is open"
+        assert from_bundle.get_metadata("g-cloud-12", "copy_services", "source_framework") == "g-cloud-11"
+
+    def test_does_not_read_yaml_files(self, content_path, bundle_path, tmp_path):
+        os.rename(os.path.join(content_path, "frameworks"), str(tmp_path / "moved"))
+
+        load(ContentLoader.from_bundle(bundle_path))
+
+    @pytest.mark.parametrize("load", [
+        lambda loader: loader.load_manifest("g-cloud-12", "services", "not_a_manifest"),
+        lambda loader: loader.get_question("g-cloud-12", "services", "notAQuestion"),
+        lambda loader: loader.load_messages("g-cloud-12", ["not_a_message"]),
+        lambda loader: loader.load_metadata("g-cloud-12", ["not_metadata"]),
+        lambda loader: loader.load_manifest("g-cloud-11", "services", "edit_service"),
+    ])
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_missing_content_raises_content_not_found(self, bundle_path, load, lazy):
+        with pytest.raises(ContentNotFoundError):
+            load(ContentLoader.from_bundle(bundle_path, lazy=lazy))
+
+
+@pytest.fixture
+def bundle_reads():
+    with mock.patch.object(ContentBundle, "read", autospec=True, side_effect=ContentBundle.read) as read:
+        yield read
+
+
+class TestLazyContentLoaderFromBundle(object):
+    def read_paths(self, bundle_reads):
+        return [os.path.basename(call[0][1]) for call in bundle_reads.call_args_list]
+
+    def test_loading_does_not_read_the_bundle(self, bundle_path, bundle_reads):
+        load(ContentLoader.from_bundle(bundle_path, lazy=True))
+
+        assert bundle_reads.call_count == 0
+
+    def test_content_is_read_the_first_time_it_is_asked_for(self, bundle_path, bundle_reads):
+        loader = load(ContentLoader.from_bundle(bundle_path, lazy=True))
+
+        assert loader.get_message("g-cloud-12", "dashboard", "status")
+        assert self.read_paths(bundle_reads) == ["dashboard.yml"]
+
+        loader.get_manifest("g-cloud-12", "edit_service")
+        loader.get_manifest("g-cloud-12", "edit_service")
+        loader.get_message("g-cloud-12", "dashboard")
+        assert self.read_paths(bundle_reads) == [
+            "dashboard.yml", "edit_service.yml", "serviceName.yml", "serviceType.yml"
+        ]
+
+    def test_loads_the_same_content_as_an_eager_loader(self, bundle_path):
+        eager = load(ContentLoader.from_bundle(bundle_path))
+        lazy = load(ContentLoader.from_bundle(bundle_path, lazy=True))
+
+        assert lazy._content == eager._content
+        assert lazy.get_message("g-cloud-12", "dashboard") == eager.get_message("g-cloud-12", "dashboard")
+        assert lazy.get_metadata("g-cloud-12", "copy_services") == eager.get_metadata("g-cloud-12", "copy_services")
+
+    def test_missing_questions_are_found_without_reading_the_bundle(self, bundle_path, bundle_reads):
+        loader = ContentLoader.from_bundle(bundle_path, lazy=True)
+
+        with pytest.raises(ContentNotFoundError):
+            loader.get_question("g-cloud-12", "services", "notAQuestion")
+        assert bundle_reads.call_count == 0
+
+    def test_load_question_set(self, bundle_path, bundle_reads):
+        loader = ContentLoader.from_bundle(bundle_path, lazy=True)
+
+        loader.load_question_set("g-cloud-12", "services")
+
+        assert sorted(self.read_paths(bundle_reads)) == ["serviceName.yml", "serviceType.yml"]
+
+    def test_unloaded_content_is_not_found(self, bundle_path):
+        loader = ContentLoader.from_bundle(bundle_path, lazy=True)
+
+        with pytest.raises(ContentNotFoundError):
+            loader.get_manifest("g-cloud-12", "edit_service")
+        with pytest.raises(ContentNotFoundError):
+            loader.get_message("g-cloud-12", "dashboard")
+
+    def test_missing_question_is_not_found_when_the_manifest_is_asked_for(self, content_path, bundle_path):
+        os.remove(os.path.join(content_path, "frameworks", "g-cloud-12", "questions", "services", "serviceName.yml"))
+        build_bundle(content_path, bundle_path)
+        loader = ContentLoader.from_bundle(bundle_path, lazy=True)
+
+        loader.load_manifest("g-cloud-12", "services", "edit_service")
+
+        with pytest.raises(ContentNotFoundError):
+            loader.get_manifest("g-cloud-12", "edit_service")
+
+    def test_freeze_reads_everything_that_was_loaded(self, bundle_path, bundle_reads):
+        loader = load(ContentLoader.from_bundle(bundle_path, lazy=True))
+
+        try:
+            loader.freeze()
+        finally:
+            gc.unfreeze()
+
+        assert bundle_reads.call_count == 5
+        assert loader.get_metadata("g-cloud-12", "copy_services", "source_framework") == "g-cloud-11"
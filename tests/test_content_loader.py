@@ -4,13 +4,36 @@ import mock
 from werkzeug.datastructures import ImmutableOrderedMultiDict, OrderedMultiDict
 import pytest
 
+import copy
+import datetime
+import gc
 import io
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import yaml
+
+from dmcontent.bundle import build_bundle
 from dmcontent.utils import TemplateField
 from dmcontent.content_loader import (
     ContentLoader, ContentSection, ContentManifest, ContentMessage, ContentMetadata,
-    read_yaml, ContentNotFoundError, QuestionNotFoundError, _make_slug
+    read_yaml, ContentNotFoundError, QuestionNotFoundError, _digest, _make_slug
 )
+from dmcontent.errors import ContentLoaderFrozenError
+
+
+def write_yaml(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        yaml.safe_dump(content, f)
+
+
+@pytest.fixture
+def unfreeze_gc():
+    yield
+    gc.unfreeze()
 
 
 @pytest.fixture
@@ -334,8 +357,9 @@ class TestContentManifest(object):
         content = content.filter({"lot": "IaaS"}, inplace_allowed=filter_inplace_allowed)
         assert content.get_section("first_section") is None
 
+    @pytest.mark.parametrize("lazy", (False, True,))
     @pytest.mark.parametrize("summary_inplace_allowed", (False, True,))
-    def test_summary(self, summary_inplace_allowed):
+    def test_summary(self, summary_inplace_allowed, lazy):
         content = ContentManifest([{
             "slug": "first_section",
             "name": "First section",
@@ -404,7 +428,7 @@ class TestContentManifest(object):
             'q7.unit': 'day',
             'q10': {'value': True, 'assurance': 'Service provider assertion'},
             'q11': {'value': True}
-        }, inplace_allowed=summary_inplace_allowed)
+        }, inplace_allowed=summary_inplace_allowed, lazy=lazy)
 
         assert summary.get_question('q1').value == [
             summary.get_question('q2')
@@ -429,6 +453,98 @@ class TestContentManifest(object):
         assert summary.get_question('q13').answer_required
         assert not summary.get_question('q14').answer_required
 
+    def test_lazy_summary_only_summarises_questions_when_accessed(self):
+        content = ContentManifest([
+            {
+                "slug": "first_section",
+                "name": "First section",
+                "questions": [
+                    {"id": "q1", "type": "multiquestion", "questions": [{"id": "q2"}, {"id": "q3"}]},
+                ]
+            },
+            {
+                "slug": "second_section",
+                "name": "Second section",
+                "questions": [{"id": "q4"}, {"id": "q5"}]
+            },
+        ])
+
+        with mock.patch("dmcontent.questions.QuestionSummary.__init__", autospec=True) as summary_init:
+            summary_init.return_value = None
+            summary = content.summary({"q4": "some value"}, lazy=True)
+            assert summary_init.call_count == 0
+
+            summary.get_section("second_section")
+            assert summary_init.call_count == 0
+
+            summary.get_section("second_section").questions[1]
+            assert [call[0][1].id for call in summary_init.call_args_list] == ["q5"]
+
+    def test_summarise_many(self):
+        content = ContentManifest([
+            {
+                "slug": "first_section",
+                "name": "First section",
+                "description": TemplateField("About {{ lot }}"),
+                "questions": [
+                    {
+                        "id": "q1",
+                        "type": "multiquestion",
+                        "questions": [{"id": "q2", "type": "text"}, {"id": "q3", "type": "text"}],
+                    },
+                    {"id": "q4", "type": "list", "options": [{"label": "One", "value": "1"}]},
+                ]
+            },
+            {"slug": "second_section", "name": "Second section", "questions": [{"id": "q5", "type": "text"}]},
+        ]).filter({"lot": "SaaS"})
+        services = [{"q2": "a", "q4": ["1"]}, {"q3": "b", "q5": "c"}, {}]
+
+        summaries = content.summarise_many(iter(services))
+
+        for service_data, summary in zip(services, summaries):
+            expected = content.summary(service_data)
+            assert [section.slug for section in summary] == [section.slug for section in expected]
+            assert summary.get_section("first_section").description == "About SaaS"
+            assert [q.id for q in summary.get_question("q1").value] == [q.id for q in expected.get_question("q1").value]
+            for question_id in ("q1", "q2", "q3", "q4", "q5"):
+                assert summary.get_question(question_id).answer_required == \
+                    expected.get_question(question_id).answer_required
+                assert summary.get_question(question_id).number == expected.get_question(question_id).number
+            for question_id in ("q2", "q3", "q4", "q5"):
+                assert summary.get_question(question_id).value == expected.get_question(question_id).value
+
+    def test_summarise_many_does_not_change_manifest(self):
+        content = ContentManifest([
+            {"slug": "first_section", "name": "First section", "questions": [{"id": "q1"}]},
+        ])
+
+        list(content.summarise_many([{"q1": "a"}]))[0].sections[0].questions[0]
+
+        assert content.sections[0].questions[0].__class__.__name__ == "Question"
+
+    def test_lazy_summary_keeps_question_numbers(self):
+        content = ContentManifest([
+            {"slug": "first_section", "name": "First section", "questions": [{"id": "q1"}, {"id": "q2"}]},
+            {"slug": "second_section", "name": "Second section", "questions": [{"id": "q3"}]},
+        ])
+
+        summary = content.summary({}, lazy=True)
+
+        assert [question.number for section in summary for question in section.questions] == [1, 2, 3]
+
+    def test_lazy_summary_made_in_place_can_be_changed_in_place(self):
+        content = ContentManifest([
+            {"slug": "first_section", "name": "First section", "questions": [{"id": "q1"}, {"id": "q2"}]},
+            {"slug": "second_section", "name": "Second section", "questions": [{"id": "q3"}]},
+        ])
+
+        summary = content.summary({"q1": "a"}, inplace_allowed=True, lazy=True)
+        summary = summary.filter({}, inplace_allowed=True)
+
+        assert summary is content
+        assert [section.slug for section in summary] == ["first_section", "second_section"]
+        assert [question.id for section in summary for question in section.questions] == ["q1", "q2", "q3"]
+
     @pytest.mark.parametrize("filter_inplace_allowed", (False, True,))
     def test_get_question(self, filter_inplace_allowed):
         content = ContentManifest([
@@ -2026,6 +2142,257 @@ class TestContentLoader(object):
 
         assert yaml_loader.get_question('framework-slug', 'question-set', 'question1') != q1
 
+    def test_loader_and_manifests_can_be_pickled(self, read_yaml_mock):
+        read_yaml_mock.side_effect = [
+            [{"name": "Section for {{ lot }}", "questions": ["question1", "question2"]}],
+            {
+                "question": "Which {{ lot }}?", "type": "radios",
+                "options": [{"label": "One", "description": "The {{ lot }} one"}, {"label": "Two"}],
+            },
+            {
+                "name": "Tell us", "question": "Tell us", "type": "multiquestion", "questions": ["question3"],
+                "depends": [{"on": "lot", "being": ["SaaS"]}],
+            },
+            {"question": "More about {{ lot }}", "type": "text", "question_advice": "Some *advice*"},
+            {"status": {"open": "{{ lot }} is open"}},
+        ]
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.load_manifest('framework-slug', 'question-set', 'my-manifest')
+        yaml_loader.load_messages('framework-slug', ['index'])
+
+        def describe(loader):
+            manifest = loader.get_manifest('framework-slug', 'my-manifest').filter({"lot": "SaaS"})
+            manifest = pickle.loads(pickle.dumps(manifest))
+            summary = manifest.summary({"question1": "One", "question3": "Yes"})
+            return (
+                [(section.name, section.slug) for section in manifest],
+                [
+                    (question.number, question.id, question.question, question.get('options'), question.answer_required,
+                     [(q.id, q.question, q.get('question_advice'), q.value) for q in question.get('questions', [])])
+                    for section in summary for question in section.questions
+                ],
+                loader.get_message('framework-slug', 'index').filter({"lot": "SaaS"}).status.open,
+            )
+
+        loaded = pickle.loads(pickle.dumps(yaml_loader))
+
+        assert describe(loaded) == describe(yaml_loader)
+        assert describe(loaded)[2] == "SaaS is open"
+
+    def test_same_question_in_different_frameworks_is_shared(self, read_yaml_mock):
+        read_yaml_mock.side_effect = [
+            {"question": "Which?", "options": [{"label": "One", "description": "The {{ lot }} one"}]},
+            {"question": "Which?", "options": [{"label": "One", "description": "The {{ lot }} one"}]},
+        ]
+
+        yaml_loader = ContentLoader('content/')
+        q1 = yaml_loader.get_question('framework-1', 'question-set', 'question1')
+        q2 = yaml_loader.get_question('framework-2', 'question-set', 'question1')
+
+        assert q1 == q2 == {
+            "id": "question1",
+            "slug": "question1",
+            "question": TemplateField("Which?"),
+            "options": [{"label": "One", "description": TemplateField("The {{ lot }} one")}],
+        }
+        assert q1["options"] is q2["options"]
+        assert q1["question"] is q2["question"]
+        assert yaml_loader.bytes_saved["framework-2"] > yaml_loader.bytes_saved["framework-1"]
+
+    def test_content_is_only_shared_if_it_is_the_same(self, read_yaml_mock):
+        read_yaml_mock.side_effect = [
+            {"question": "Which?", "options": [{"label": "One", "value": 1}, {"label": "Two", "value": True}]},
+            {"question": "Which?", "options": [{"label": "One", "value": True}, {"label": "Two", "value": 1}]},
+            {"question": "Which?", "question_advice": "Which?"},
+        ]
+
+        yaml_loader = ContentLoader('content/')
+        q1 = yaml_loader.get_question('framework-1', 'question-set', 'question1')
+        q2 = yaml_loader.get_question('framework-1', 'question-set', 'question2')
+        q3 = yaml_loader.get_question('framework-1', 'question-set', 'question3')
+
+        assert [option["value"] for option in q1["options"]] == [1, True]
+        assert [type(option["value"]) for option in q2["options"]] == [bool, int]
+        assert q3["question"].markdown is False
+        assert q3["question_advice"].markdown is True
+
+    def test_freeze_loads_lazy_manifests_and_freezes_gc(self, read_yaml_mock, unfreeze_gc):
+        self.set_read_yaml_mock_response(read_yaml_mock)
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.lazy_load_manifests('framework-slug', {'my-manifest': 'question-set'})
+
+        yaml_loader.freeze()
+
+        assert read_yaml_mock.call_count == self.yaml_file_count
+        assert yaml_loader.frozen
+        assert gc.get_freeze_count() > 0
+        assert [section.slug for section in yaml_loader.get_manifest('framework-slug', 'my-manifest')] == [
+            'section1', 'section-2'
+        ]
+
+    def test_frozen_loader_refuses_to_load_more_content(self, read_yaml_mock, unfreeze_gc):
+        self.set_read_yaml_mock_response(read_yaml_mock)
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.load_manifest('framework-slug', 'question-set', 'my-manifest')
+        yaml_loader.freeze()
+
+        # already loaded content can still be asked for
+        assert yaml_loader.load_manifest('framework-slug', 'question-set', 'my-manifest') is None
+        assert yaml_loader.get_question('framework-slug', 'question-set', 'question1')['id'] == 'question1'
+
+        with pytest.raises(ContentLoaderFrozenError):
+            yaml_loader.load_manifest('framework-slug', 'question-set', 'other-manifest')
+        with pytest.raises(ContentLoaderFrozenError):
+            yaml_loader.lazy_load_manifests('framework-slug', {'other-manifest': 'question-set'})
+        with pytest.raises(ContentLoaderFrozenError):
+            yaml_loader.get_question('framework-slug', 'question-set', 'other-question')
+        with pytest.raises(ContentLoaderFrozenError):
+            yaml_loader.load_messages('framework-slug', ['index'])
+        with pytest.raises(ContentLoaderFrozenError):
+            yaml_loader.load_metadata('framework-slug', ['index'])
+        assert read_yaml_mock.call_count == self.yaml_file_count
+
+    def test_frozen_loader_does_not_add_frameworks_when_content_is_missing(self, read_yaml_mock, unfreeze_gc):
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.freeze()
+
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_manifest('framework-slug', 'manifest')
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_message('framework-slug', 'index')
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_metadata('framework-slug', 'index')
+        assert yaml_loader._content == yaml_loader._messages == yaml_loader._metadata == {}
+
+    def test_missing_questions_are_found_from_a_listing_of_the_question_set(self, read_yaml_mock, tmp_path):
+        questions_path = tmp_path / "frameworks" / "framework-slug" / "questions" / "question-set"
+        questions_path.mkdir(parents=True)
+        (questions_path / "question1.yml").touch()
+        (questions_path / "README.md").touch()
+        read_yaml_mock.return_value = self.question1()
+        yaml_loader = ContentLoader(str(tmp_path))
+
+        assert yaml_loader.get_question('framework-slug', 'question-set', 'question1')['id'] == 'question1'
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_question('framework-slug', 'question-set', 'question2')
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_question('framework-slug', 'question-set', 'README')
+
+        assert read_yaml_mock.call_args_list == [mock.call(str(questions_path / "question1.yml"), file_bytes=b"")]
+
+    def test_questions_differing_only_in_case_from_a_file_are_looked_for_on_the_filesystem(
+        self, read_yaml_mock, tmp_path
+    ):
+        questions_path = tmp_path / "frameworks" / "framework-slug" / "questions" / "question-set"
+        questions_path.mkdir(parents=True)
+        (questions_path / "Question1.yml").touch()
+        read_yaml_mock.return_value = self.question1()
+        yaml_loader = ContentLoader(str(tmp_path))
+
+        # on a case-insensitive filesystem the file would be found, as it was before the question set was indexed
+        assert yaml_loader.get_question('framework-slug', 'question-set', 'question1')['id'] == 'question1'
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_question('framework-slug', 'question-set', 'question2')
+
+        assert [call[0][0] for call in read_yaml_mock.call_args_list] == [str(questions_path / "question1.yml")]
+
+    def test_questions_are_read_if_the_question_set_cannot_be_listed(self, read_yaml_mock):
+        read_yaml_mock.return_value = self.question1()
+        yaml_loader = ContentLoader('content/')
+
+        assert yaml_loader.get_question('framework-slug', 'question-set', 'question1')['id'] == 'question1'
+        assert yaml_loader._question_set_indexes == {'content/frameworks/framework-slug/questions/question-set': None}
+
+    def test_load_question_set(self, read_yaml_mock, tmp_path):
+        questions_path = tmp_path / "frameworks" / "framework-slug" / "questions" / "question-set"
+        questions_path.mkdir(parents=True)
+        for question in ("question1", "question2", "question3"):
+            (questions_path / f"{question}.yml").touch()
+        read_yaml_mock.side_effect = [self.question1(), self.question2(), self.question3()]
+        yaml_loader = ContentLoader(str(tmp_path))
+
+        yaml_loader.load_question_set('framework-slug', 'question-set')
+
+        assert set(yaml_loader._questions['framework-slug']['question-set']) == {'question1', 'question2', 'question3'}
+        assert read_yaml_mock.call_count == 3
+
+    def test_load_question_set_that_does_not_exist(self, read_yaml_mock):
+        with pytest.raises(ContentNotFoundError):
+            ContentLoader('content/').load_question_set('framework-slug', 'question-set')
+
+    def test_get_dependencies(self, read_yaml_mock):
+        self.set_read_yaml_mock_response(read_yaml_mock)
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.load_manifest('framework-slug', 'question-set', 'my-manifest')
+
+        assert yaml_loader.get_dependencies('manifest', 'framework-slug', 'my-manifest') == {
+            'content/frameworks/framework-slug/manifests/my-manifest.yml',
+            ('question', 'framework-slug', 'question-set', 'question1'),
+            ('question', 'framework-slug', 'question-set', 'question2'),
+            ('question', 'framework-slug', 'question-set', 'question3'),
+        }
+        assert yaml_loader.get_dependencies('question', 'framework-slug', 'question-set', 'question2') == {
+            'content/frameworks/framework-slug/questions/question-set/question2.yml',
+        }
+        assert yaml_loader.get_dependants(
+            'content/frameworks/framework-slug/questions/question-set/question2.yml'
+        ) == {('question', 'framework-slug', 'question-set', 'question2')}
+        assert yaml_loader.get_dependants(('question', 'framework-slug', 'question-set', 'question2')) == {
+            ('manifest', 'framework-slug', 'my-manifest'),
+        }
+
+    def test_get_files_includes_nested_questions(self, read_yaml_mock):
+        read_yaml_mock.side_effect = [
+            [{"name": "Section", "questions": ["multi"]}],
+            {"name": "Multi", "type": "multiquestion", "questions": ["nested"]},
+            {"question": "Nested", "type": "text"},
+        ]
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.load_manifest('framework-slug', 'question-set', 'my-manifest')
+
+        assert yaml_loader.get_dependencies('question', 'framework-slug', 'question-set', 'multi') == {
+            'content/frameworks/framework-slug/questions/question-set/multi.yml',
+            ('question', 'framework-slug', 'question-set', 'nested'),
+        }
+        assert yaml_loader.get_files('manifest', 'framework-slug', 'my-manifest') == {
+            'content/frameworks/framework-slug/manifests/my-manifest.yml',
+            'content/frameworks/framework-slug/questions/question-set/multi.yml',
+            'content/frameworks/framework-slug/questions/question-set/nested.yml',
+        }
+
+    def test_get_dependencies_of_content_not_loaded(self, read_yaml_mock):
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.lazy_load_manifests('framework-slug', {'my-manifest': 'question-set'})
+
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_dependencies('manifest', 'framework-slug', 'my-manifest')
+        with pytest.raises(ContentNotFoundError):
+            yaml_loader.get_cache_key('messages', 'framework-slug', 'index')
+
+    def test_cache_key_depends_only_on_the_content(self, read_yaml_mock):
+        def cache_key(content_path):
+            self.set_read_yaml_mock_response(read_yaml_mock)
+            yaml_loader = ContentLoader(content_path)
+            yaml_loader.load_manifest('framework-slug', 'question-set', 'my-manifest')
+            return yaml_loader.get_cache_key('manifest', 'framework-slug', 'my-manifest')
+
+        key = cache_key('content/')
+        assert cache_key('somewhere/else/') == key
+
+        self.question3 = lambda: {"name": "question3", "depends": [{"on": "lot", "being": "PaaS"}]}
+        assert cache_key('content/') != key
+
+    def test_cache_key_changes_when_the_content_is_reloaded(self, read_yaml_mock):
+        read_yaml_mock.return_value = {'status': 'Open'}
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.load_messages('framework-slug', ['index'])
+        key = yaml_loader.get_cache_key('messages', 'framework-slug', 'index')
+
+        read_yaml_mock.return_value = {'status': 'Closed'}
+        yaml_loader.reload_files(['content/frameworks/framework-slug/messages/index.yml'])
+
+        assert yaml_loader.get_cache_key('messages', 'framework-slug', 'index') != key
+
     def test_get_message(self, mock_read_yaml):
         mock_read_yaml.return_value = {
             'field_one': 'value_one',
@@ -2168,6 +2535,75 @@ class TestContentLoader(object):
         with pytest.raises(ContentNotFoundError):
             metadata.load_metadata('not-a-framework', ['index'])
 
+    @pytest.mark.parametrize('lazy_load, get, directory', [
+        (ContentLoader.lazy_load_messages, ContentLoader.get_message, 'messages'),
+        (ContentLoader.lazy_load_metadata, ContentLoader.get_metadata, 'metadata'),
+    ])
+    def test_lazy_loading_blocks_is_lazy(self, mock_read_yaml, lazy_load, get, directory):
+        mock_read_yaml.return_value = {'field_one': 'value_one'}
+        yaml_loader = ContentLoader('content/')
+
+        lazy_load(yaml_loader, 'g-cloud-7', ['index', 'dashboard'])
+        assert mock_read_yaml.call_count == 0
+
+        assert get(yaml_loader, 'g-cloud-7', 'index', 'field_one') == 'value_one'
+        assert get(yaml_loader, 'g-cloud-7', 'index', 'field_one') == 'value_one'
+        assert mock_read_yaml.call_args_list == [mock.call(f'content/frameworks/g-cloud-7/{directory}/index.yml')]
+
+    @pytest.mark.parametrize('lazy_load, get', [
+        (ContentLoader.lazy_load_messages, ContentLoader.get_message),
+        (ContentLoader.lazy_load_metadata, ContentLoader.get_metadata),
+    ])
+    def test_lazy_loaded_blocks_that_do_not_exist_are_not_found(self, mock_read_yaml, lazy_load, get):
+        mock_read_yaml.side_effect = IOError
+        yaml_loader = ContentLoader('content/')
+
+        lazy_load(yaml_loader, 'g-cloud-7', ['index'])
+
+        with pytest.raises(ContentNotFoundError):
+            get(yaml_loader, 'g-cloud-7', 'index')
+        with pytest.raises(ContentNotFoundError):
+            get(yaml_loader, 'g-cloud-7', 'dashboard')
+        with pytest.raises(ContentNotFoundError):
+            get(yaml_loader, 'g-cloud-8', 'index')
+        assert mock_read_yaml.call_count == 1
+
+    def test_lazy_loading_blocks_does_not_replace_loaded_blocks(self, mock_read_yaml):
+        mock_read_yaml.side_effect = [{'status': 'Open'}, {'status': 'Closed'}]
+        yaml_loader = ContentLoader('content/')
+
+        yaml_loader.load_messages('g-cloud-7', ['index'])
+        yaml_loader.lazy_load_messages('g-cloud-7', ['index', 'dashboard'])
+
+        assert yaml_loader.get_message('g-cloud-7', 'index', 'status') == 'Open'
+        assert yaml_loader.get_message('g-cloud-7', 'dashboard', 'status') == 'Closed'
+
+    @pytest.mark.parametrize('lazy_load', [ContentLoader.lazy_load_messages, ContentLoader.lazy_load_metadata])
+    def test_lazy_load_block_argument_types(self, mock_read_yaml, lazy_load):
+        with pytest.raises(TypeError) as err:
+            lazy_load(ContentLoader('content/'), 'g-cloud-7', 'index')
+
+        assert str(err.value) == 'Content blocks must be a list'
+
+    def test_lazy_loaded_blocks_are_loaded_once_when_first_asked_for_by_several_threads(self, mock_read_yaml):
+        def read_yaml(path):
+            time.sleep(0.01)
+            return {'status': 'Open'}
+        mock_read_yaml.side_effect = read_yaml
+        yaml_loader = ContentLoader('content/')
+        yaml_loader.lazy_load_messages('g-cloud-7', ['index'])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            statuses = list(executor.map(
+                lambda _: yaml_loader.get_message('g-cloud-7', 'index', 'status'), range(8)
+            ))
+
+        assert statuses == ['Open'] * 8
+        assert mock_read_yaml.call_count == 1
+        assert yaml_loader.get_dependencies('messages', 'g-cloud-7', 'index') == {
+            'content/frameworks/g-cloud-7/messages/index.yml'
+        }
+
     def test_get_manifest(self, read_yaml_mock):
         self.set_read_yaml_mock_response(read_yaml_mock)
 
@@ -2198,6 +2634,96 @@ class TestContentLoader(object):
             yaml_loader.get_manifest('framework-slug', 'manifest')
 
 
+class TestQuestionDeduplication(object):
+    @pytest.fixture
+    def content_path(self, tmp_path):
+        """Two frameworks with the same question files, except for serviceType"""
+        for framework_slug, service_type in (("g-cloud-12", "Type"), ("g-cloud-13", "Category")):
+            questions_path = tmp_path / "frameworks" / framework_slug / "questions" / "services"
+            write_yaml(questions_path / "serviceName.yml", {"question": "Name", "type": "text"})
+            write_yaml(questions_path / "serviceType.yml", {"question": service_type, "type": "text"})
+            write_yaml(questions_path / "support.yml", {
+                "name": "Support", "question": "Support", "type": "multiquestion", "questions": ["supportHours"],
+            })
+            write_yaml(questions_path / "supportHours.yml", {"question": "Hours", "type": "text"})
+
+        return str(tmp_path)
+
+    def load(self, loader):
+        for framework_slug in ("g-cloud-12", "g-cloud-13"):
+            loader.load_question_set(framework_slug, "services")
+        return loader
+
+    def test_identical_question_files_are_loaded_once(self, content_path):
+        loader = self.load(ContentLoader(content_path))
+
+        assert loader._questions["g-cloud-13"]["services"]["serviceName"] is \
+            loader._questions["g-cloud-12"]["services"]["serviceName"]
+        assert loader._questions["g-cloud-13"]["services"]["supportHours"] is \
+            loader._questions["g-cloud-12"]["services"]["supportHours"]
+        assert loader.get_question("g-cloud-13", "services", "serviceType")["question"].source == "Category"
+        assert loader.get_question("g-cloud-12", "services", "serviceType")["question"].source == "Type"
+
+    def test_multiquestions_are_not_shared(self, content_path):
+        loader = self.load(ContentLoader(content_path))
+
+        assert "support" not in {question for question, digest in loader._questions_by_content}
+        assert loader._questions["g-cloud-13"]["services"]["support"] == \
+            loader._questions["g-cloud-12"]["services"]["support"]
+
+    def test_each_question_file_is_read_once(self, content_path):
+        with mock.patch("dmcontent.content_loader.open", create=True, side_effect=open) as mocked_open:
+            self.load(ContentLoader(content_path))
+
+        assert sorted(os.path.basename(call[0][0]) for call in mocked_open.call_args_list) == sorted(
+            ["serviceName.yml", "serviceType.yml", "support.yml", "supportHours.yml"] * 2
+        )
+
+    def test_dedup_ratio(self, content_path):
+        loader = ContentLoader(content_path)
+        assert loader.dedup_ratio == 0
+
+        self.load(loader)
+
+        assert (loader.questions_loaded, loader.questions_deduplicated) == (8, 2)
+        assert loader.dedup_ratio == 0.25
+
+    def test_shared_questions_depend_on_their_own_files(self, content_path):
+        loader = self.load(ContentLoader(content_path))
+        question_path = os.path.join(
+            content_path, "frameworks", "g-cloud-13", "questions", "services", "serviceName.yml"
+        )
+
+        assert loader.get_files("question", "g-cloud-13", "services", "serviceName") == {question_path}
+
+        write_yaml(question_path, {"question": "Called", "type": "text"})
+        loader.reload_files([question_path])
+
+        assert loader.get_question("g-cloud-13", "services", "serviceName")["question"].source == "Called"
+        assert loader.get_question("g-cloud-12", "services", "serviceName")["question"].source == "Name"
+
+    def test_questions_from_a_bundle_are_deduplicated(self, content_path, tmp_path):
+        bundle_path = str(tmp_path / "content.bundle")
+        build_bundle(content_path, bundle_path)
+
+        loader = self.load(ContentLoader.from_bundle(bundle_path))
+
+        assert loader._questions["g-cloud-13"]["services"]["serviceName"] is \
+            loader._questions["g-cloud-12"]["services"]["serviceName"]
+        assert loader.dedup_ratio == 0.25
+
+
+@pytest.mark.parametrize("content", [
+    {"a": [1, 2.5, None, True]},
+    {"opens": datetime.date(2020, 9, 1)},
+    {datetime.date(2020, 9, 1): "open"},
+    {"lots": {"saas", "paas", "iaas", "scs"}},
+])
+def test_digest_is_the_same_for_equal_content(content):
+    assert _digest(content) == _digest(copy.deepcopy(content))
+    assert _digest(content) != _digest({"something": "else"})
+
+
 @pytest.mark.parametrize("title,slug", [
     ("The Title", "the-title"),
     ("This\nAnd\tThat ", "this-and-that"),
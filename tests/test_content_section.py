@@ -145,6 +145,58 @@ class TestFilterContentSection(object):
 
         assert section.slug == 'section'
 
+    def test_template_fields_are_rendered_when_set_after_creation(self):
+        section = ContentSection(
+            slug='section',
+            name='Section',
+            prefill=True,
+            editable=False,
+            edit_questions=False,
+            questions=[Question({})],
+        ).filter({'lot': 'cloud-hosting'})
+
+        section.summary_page_description = TemplateField('About {{ lot }}')
+
+        assert section.summary_page_description == 'About cloud-hosting'
+        assert section['summary_page_description'] == 'About cloud-hosting'
+        assert section.copy().summary_page_description == 'About cloud-hosting'
+
+    @pytest.mark.parametrize("lazy", (False, True))
+    def test_filter_and_summary_share_the_sections_fields(self, lazy):
+        questions = [Question({'id': 'q1', 'type': 'text'})]
+        section = ContentSection(
+            slug='section',
+            name=TemplateField('Section'),
+            prefill=True,
+            editable=False,
+            edit_questions=False,
+            questions=questions,
+            description=TemplateField('About {{ lot }}'),
+        )
+
+        filtered = section.filter({'lot': 'one'})
+        summary = filtered.summary({'q1': 'answer'}, lazy=lazy)
+
+        assert section.questions is questions and section._context is None
+        assert filtered.questions is not questions and filtered._context == {'lot': 'one'}
+        assert summary.questions[0].value == 'answer'
+        assert summary.description == 'About one'
+        for copy in (filtered, summary):
+            assert copy.__dict__['description'] is section.__dict__['description']
+
+    def test_only_template_fields_are_rendered(self):
+        section = ContentSection(
+            slug=TemplateField('section'),
+            name=TemplateField('Section'),
+            prefill=True,
+            editable=False,
+            edit_questions=False,
+            questions=[Question({})],
+        )
+
+        assert section.name == 'Section'
+        assert isinstance(section.slug, TemplateField)
+
     @pytest.mark.parametrize("filter_inplace_allowed", (False, True,))
     def test_copying_section_preserves_value_of_context_attribute(self, filter_inplace_allowed):
         section = ContentSection(
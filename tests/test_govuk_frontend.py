@@ -6,7 +6,10 @@ from unittest import mock
 import jinja2
 from jinja2 import Markup
 
-from dmcontent.questions import Pricing, Question, Multiquestion
+from dmcontent import govuk_frontend, govuk_frontend_components
+from dmcontent.content_loader import ContentSection
+from dmcontent.questions import ContentQuestion, Pricing, Question, Multiquestion
+from dmcontent.utils import TemplateField
 
 from dmcontent.govuk_frontend import (
     from_question,
@@ -24,9 +27,19 @@ from dmcontent.govuk_frontend import (
     _params,
     render,
     render_question,
+    render_section,
+    _html_paths,
+    _resolve,
+    _section_templates,
+    _with_html,
 )
 
 
+def with_data(question, **data):
+    """A copy of `question` with some of its data changed, as questions don't take new attributes"""
+    return question.__class__(dict(question._data, **data))
+
+
 class TestTextInput:
     @pytest.fixture
     def question(self):
@@ -98,7 +111,7 @@ class TestNumberInput:
         https://design-system.service.gov.uk/components/text-input/#numbers
         """
 
-        question.limits = {"integer_only": True}
+        question = with_data(question, limits={"integer_only": True})
 
         params = govuk_input(question)
 
@@ -114,7 +127,7 @@ class TestNumberInput:
         """
 
         if integer_only is False:
-            question.limits = {"integer_only": False}
+            question = with_data(question, limits={"integer_only": False})
 
         params = govuk_input(question)
 
@@ -122,8 +135,7 @@ class TestNumberInput:
         assert params["spellcheck"] is False
 
     def test_govuk_input_prefix(self, question):
-        question.unit = "£"
-        question.unit_position = "before"
+        question = with_data(question, unit="£", unit_position="before")
 
         params = govuk_input(question)
 
@@ -135,8 +147,7 @@ class TestNumberInput:
         assert params["prefix"] == {"text": "£"}
 
     def test_govuk_input_suffix(self, question):
-        question.unit = "%"
-        question.unit_position = "after"
+        question = with_data(question, unit="%", unit_position="after")
 
         params = govuk_input(question)
 
@@ -161,10 +172,7 @@ class TestNumberInput:
         expected_pattern,
         question,
     ):
-        question.limits = {"integer_only": True}
-
-        question.unit = unit
-        question.unit_position = unit_position
+        question = with_data(question, limits={"integer_only": True}, unit=unit, unit_position=unit_position)
 
         params = govuk_input(question)
 
@@ -240,10 +248,10 @@ class TestRadios:
         assert params["idPrefix"] == "input-yesOrNo"
 
     def test_govuk_radios_options_with_descriptions(self, question):
-        question.options = [
+        question = with_data(question, options=[
             {"label": "Yes", "value": "yes", "description": "Affirmative."},
             {"label": "No", "value": "no", "description": "Negative."},
-        ]
+        ])
 
         assert govuk_radios(question)["items"] == [
             {"text": "Yes", "value": "yes", "hint": {"text": "Affirmative."}},
@@ -341,10 +349,10 @@ class TestCheckboxes:
         assert params["idPrefix"] == "input-oneAndAnother"
 
     def test_govuk_checkbox_options_with_descriptions(self, question):
-        question.options = [
+        question = with_data(question, options=[
             {"label": "One", "value": "one", "description": "This is the first thing."},
             {"label": "Another", "value": "another", "description": "This is another thing."},
-        ]
+        ])
 
         assert govuk_checkboxes(question)["items"] == [
             {"text": "One", "value": "one", "hint": {"text": "This is the first thing."}},
@@ -805,7 +813,7 @@ class TestDmMultiquestion:
             assert isinstance(sub_question, (dict, Markup, str))
 
     def test_dm_multiquestion_calls_from_question_on_each_of_its_questions(self, question):
-        with mock.patch("dmcontent.govuk_frontend.from_question") as from_question:
+        with mock.patch("dmcontent.govuk_frontend._from_question", return_value=({}, [])) as from_question:
             dm_multiquestion(question)
             assert from_question.call_count == len(question.questions)
             assert from_question.call_args_list == [
@@ -814,7 +822,7 @@ class TestDmMultiquestion:
             ]
 
     def test_dm_multiquestion_passes_data_and_errors_for_each_of_its_questions(self, question):
-        with mock.patch("dmcontent.govuk_frontend.from_question") as from_question:
+        with mock.patch("dmcontent.govuk_frontend._from_question", return_value=({}, [])) as from_question:
             data = mock.MagicMock()
             errors = mock.MagicMock()
             dm_multiquestion(question, data, errors)
@@ -1105,12 +1113,12 @@ class TestGovukLabel:
         }
 
     def test_optional_question_has_optional_in_label_text(self, question):
-        question.optional = True
+        question = with_data(question, optional=True)
 
         assert govuk_label(question)["text"] == "Yes or no? (optional)"
 
     def test_not_optional_question_does_not_have_optional_in_label_text(self, question):
-        question.optional = False
+        question = with_data(question, optional=False)
 
         assert govuk_label(question)["text"] == "Yes or no?"
 
@@ -1138,14 +1146,12 @@ class TestGovukFieldset:
         }
 
     def test_optional_question_has_optional_in_legend_text(self, question):
-        question.type = "list"
-        question.optional = True
+        question = with_data(question, type="list", optional=True)
 
         assert govuk_fieldset(question)["legend"]["text"] == "Enter your criteria (optional)"
 
     def test_not_optional_question_does_not_have_optional_in_legend_text(self, question):
-        question.type = "list"
-        question.optional = False
+        question = with_data(question, type="list", optional=False)
 
         assert govuk_fieldset(question)["legend"]["text"] == "Enter your criteria"
 
@@ -1171,14 +1177,14 @@ class TestParams:
         assert params["name"] == "question"
 
     def test_hint(self, question):
-        question.hint = "Answer yes or no"
+        question = with_data(question, hint="Answer yes or no")
 
         assert _params(question)["hint"] == {
             "text": "Answer yes or no",
         }
 
     def test_hint_classes_kwarg(self, question):
-        question.hint = "Choose yes or no"
+        question = with_data(question, hint="Choose yes or no")
 
         assert _params(question, hint_classes=["app-hint"])["hint"]["classes"] == "app-hint"
 
@@ -1246,6 +1252,188 @@ class TestParams:
         assert params["errorMessage"]["text"] == "Answer yes or no only."
 
 
+class TestFromQuestionSkeletons:
+    questions = [
+        {"id": "text", "type": "text", "question": "Text", "hint": "A hint"},
+        {"id": "number", "type": "number", "question": "Number", "unit": "£", "unit_position": "before"},
+        {"id": "pricing", "type": "pricing", "question": "Price", "fields": {"price": "price"}},
+        {"id": "date", "type": "date", "question": "Date"},
+        {"id": "list", "type": "list", "question": "List", "question_advice": "Some advice"},
+        {
+            "id": "radios", "type": "radios", "question": "Radios",
+            "options": [{"label": "One", "value": "one", "description": "The first"}, {"label": "Two"}],
+        },
+        {"id": "checkboxes", "type": "checkboxes", "question": "Checkboxes", "options": [{"label": "One"}, {}]},
+        {"id": "boolean", "type": "boolean", "question": "Boolean", "optional": True},
+        {"id": "textbox_large", "type": "textbox_large", "question": "Textbox", "max_length_in_words": 10},
+        {"id": "upload", "type": "upload", "question": "Upload", "question_advice": "Some advice"},
+        {
+            "id": "multiquestion", "type": "multiquestion", "question": "Multiquestion",
+            "questions": [
+                {"id": "yesNo", "type": "boolean", "question": "Yes or no?", "followup": {"more": [True]}},
+                {"id": "more", "type": "text", "question": "Tell us more"},
+            ],
+        },
+    ]
+
+    data = [
+        {},
+        {
+            "text": "Some text", "number": 0, "price": "12", "date-day": "1", "date-year": "2020",
+            "list": ["a", "b"], "radios": "one", "checkboxes": ["One"], "boolean": False, "textbox_large": "Words",
+            "upload": "https://example.com/file.pdf", "yesNo": True, "more": "More text",
+        },
+        {"radios": "Two", "checkboxes": "One", "boolean": True, "yesNo": False},
+    ]
+
+    @pytest.fixture(params=questions, ids=[question["id"] for question in questions])
+    def content(self, request):
+        return request.param
+
+    @pytest.fixture
+    def errors(self, content):
+        return {
+            question_id: {"input_name": question_id, "question": "Question", "message": "There is a problem"}
+            for question_id in ("text", "number", "price", "date", "list", "radios", "checkboxes", "boolean",
+                                "textbox_large", "upload", "yesNo", "more")
+        }
+
+    @pytest.mark.parametrize("kwargs", [{}, {"is_page_heading": False}, {"label_classes": ["app-label"]}])
+    def test_reusing_a_question_gives_the_same_output_as_a_new_question(self, content, errors, kwargs):
+        question = ContentQuestion(content)
+        for data in self.data:
+            for data_errors in (None, errors):
+                assert (
+                    from_question(question, data, data_errors, **kwargs)
+                    == from_question(ContentQuestion(content), data, data_errors, **kwargs)
+                )
+
+    def test_changing_the_output_does_not_change_later_output(self, content, errors):
+        question = ContentQuestion(content)
+        expected = from_question(ContentQuestion(content))
+
+        for data in self.data:
+            form = from_question(question, data, errors)
+            for to_render in (form if isinstance(form, list) else [form]):
+                if isinstance(to_render, dict):
+                    to_render["params"]["hint"] = "changed"
+                    to_render["params"].get("items", []).clear()
+
+        assert from_question(question) == expected
+
+    def test_label_classes_are_not_changed(self):
+        label_classes = ["app-label"]
+        from_question(ContentQuestion(self.questions[0]), label_classes=label_classes)
+
+        assert label_classes == ["app-label"]
+
+    def test_filtering_a_question_in_place_with_a_new_context_renders_it_again(self):
+        question = ContentQuestion({
+            "id": "radios", "type": "radios", "question": TemplateField("Which {{ thing }}?"),
+            "options": [{"label": "One", "description": TemplateField("Some {{ thing }}")}],
+        })
+
+        question.filter({"thing": "lot"}, inplace_allowed=True)
+        assert from_question(question)["fieldset"]["legend"]["text"] == "Which lot?"
+
+        question.filter({"thing": "service"}, inplace_allowed=True)
+        form = from_question(question, {"radios": "One"})
+        assert form["fieldset"]["legend"]["text"] == "Which service?"
+        assert form["params"]["items"] == [
+            {"value": "One", "text": "One", "checked": True, "hint": {"text": "Some service"}}
+        ]
+
+    def test_questions_made_from_the_same_content_share_a_skeleton(self):
+        content = {
+            "id": "radios", "type": "radios", "question": TemplateField("Which {{ thing }}?"),
+            "options": [{"label": "One", "description": TemplateField("Some {{ thing }}")}],
+        }
+        question = ContentQuestion(content).filter({"thing": "lot", "other": 1})
+
+        with mock.patch("dmcontent.govuk_frontend._skeleton", wraps=govuk_frontend._skeleton) as skeleton:
+            first = from_question(question, {"radios": "One"})
+            assert from_question(ContentQuestion(content).filter({"thing": "lot", "other": 2})) == \
+                from_question(question)
+            assert skeleton.call_count == 1
+
+            other_thing = from_question(ContentQuestion(content).filter({"thing": "service"}))
+            assert skeleton.call_count == 2
+
+        assert first["fieldset"]["legend"]["text"] == "Which lot?"
+        assert other_thing["fieldset"]["legend"]["text"] == "Which service?"
+        assert other_thing["params"]["items"][0]["hint"] == {"text": "Some service"}
+
+    def test_questions_made_from_the_same_content_share_where_their_html_is(self):
+        content = {"id": "upload", "type": "upload", "question": "Upload a file", "question_advice": "Some advice"}
+
+        with mock.patch("dmcontent.govuk_frontend._html_paths", wraps=govuk_frontend._html_paths) as html_paths:
+            _, first = govuk_frontend._from_question(ContentQuestion(content).filter({}))
+            _, second = govuk_frontend._from_question(ContentQuestion(content).filter({}), {"upload": "file.pdf"})
+
+        assert html_paths.call_count == 1
+        assert first == second == [("hint", "html")]
+
+    def test_questions_with_different_content_do_not_share_a_skeleton(self):
+        first = from_question(ContentQuestion({"id": "text", "type": "text", "question": "Name"}))
+        second = from_question(ContentQuestion({"id": "text", "type": "text", "question": "Title"}))
+
+        assert first["label"]["text"] == "Name"
+        assert second["label"]["text"] == "Title"
+
+    def test_questions_with_markup_and_str_content_do_not_share_a_skeleton(self):
+        content = {"id": "text", "type": "text", "question": "Name"}
+        markup = from_question(ContentQuestion({**content, "hint": Markup("<b>x</b>")}))
+        text = from_question(ContentQuestion({**content, "hint": "<b>x</b>"}))
+
+        assert isinstance(markup["params"]["hint"]["text"], Markup)
+        assert not isinstance(text["params"]["hint"]["text"], Markup)
+
+    def test_kwargs_of_different_types_do_not_share_a_skeleton(self):
+        question = ContentQuestion({"id": "text", "type": "text", "question": "Name"})
+
+        assert from_question(question, is_page_heading=1)["label"]["isPageHeading"] == 1
+        assert from_question(question, is_page_heading=True)["label"]["isPageHeading"] is True
+
+    def test_unhashable_kwargs_are_not_cached(self):
+        question = ContentQuestion(self.questions[0])
+
+        assert (
+            from_question(question, label_text={"not": "hashable"})["label"]["text"]
+            == {"not": "hashable"}
+        )
+
+    def test_checked_items_must_be_a_string_or_a_list(self):
+        question = ContentQuestion(self.questions[5])
+
+        with pytest.raises(TypeError):
+            from_question(question, {"radios": 1})
+
+    def test_only_checked_items_are_copied(self):
+        question = ContentQuestion(self.questions[6])
+        unchecked = from_question(question)["params"]["items"]
+        checked = from_question(question, {"checkboxes": ["One"]})["params"]["items"]
+
+        assert isinstance(checked, list)
+        assert checked[0] == {"value": "One", "text": "One", "checked": True}
+        assert "checked" not in unchecked[0]
+        assert checked[1] is unchecked[1]
+
+    def test_checked_items_can_be_unhashable(self):
+        question = ContentQuestion(self.questions[6])
+
+        assert "checked" not in from_question(question, {"checkboxes": [["One"]]})["params"]["items"][0]
+
+    def test_multiquestion_followups_are_not_kept(self):
+        question = ContentQuestion(self.questions[10])
+        boolean = question.questions[0]
+        expected = from_question(boolean)
+
+        from_question(question, {"yesNo": True})
+
+        assert "conditional" not in expected["params"]["items"][0]
+        assert from_question(boolean) == expected
+
+
 class TestRender:
     @pytest.fixture
     def context(self):
@@ -1362,6 +1550,97 @@ bar
 }]) }}""")
         assert template.render() == "<div><p>foo</p></div>"
 
+    def test_it_does_not_change_the_params(self, env):
+        template = env.from_string("""{% macro test() -%}
+<p>foo</p>
+{%- endmacro %}
+{% macro wrapper(params) -%}
+{% for item in params['items'] -%}
+<div>{{ item.conditional.html | safe if item.conditional }}</div>
+{%- endfor %}
+{%- endmacro %}
+{{ render(form) }}{{ render(form) }}""")
+        form = {
+            "macro_name": "wrapper",
+            "params": {"items": [{"conditional": {"html": {"macro_name": "test"}}}, {"text": "No html"}]},
+        }
+
+        assert template.render(form=form) == "<div><p>foo</p></div><div></div><div><p>foo</p></div><div></div>"
+        assert form == {
+            "macro_name": "wrapper",
+            "params": {"items": [{"conditional": {"html": {"macro_name": "test"}}}, {"text": "No html"}]},
+        }
+
+
+class TestResolve:
+    def test_it_only_resolves_each_macro_once_per_context(self):
+        ctx = mock.Mock()
+
+        assert _resolve(ctx, "govukInput") is _resolve(ctx, "govukInput") is ctx.resolve.return_value
+        assert _resolve(ctx, "govukLabel") is ctx.resolve.return_value
+        assert ctx.resolve.call_args_list == [mock.call("govukInput"), mock.call("govukLabel")]
+
+    def test_contexts_do_not_share_macros(self):
+        env = jinja2.Environment()
+        env.globals["render"] = render
+        first = env.from_string("{% macro test() %}first{% endmacro %}{{ render([{'macro_name': 'test'}]) }}")
+        second = env.from_string("{% macro test() %}second{% endmacro %}{{ render([{'macro_name': 'test'}]) }}")
+
+        assert first.render() == "first"
+        assert second.render() == "second"
+        assert first.render() == "first"
+
+    def test_it_does_not_keep_macros_that_are_not_found(self):
+        ctx = mock.Mock()
+        ctx.resolve.return_value = jinja2.Undefined(name="govukInput")
+        assert isinstance(_resolve(ctx, "govukInput"), jinja2.Undefined)
+
+        ctx.resolve.return_value = mock.sentinel.macro
+        assert _resolve(ctx, "govukInput") is mock.sentinel.macro
+
+    def test_it_resolves_again_if_python_components_is_changed(self, monkeypatch):
+        ctx = mock.Mock()
+        ctx.environment = jinja2.Environment()
+        ctx.eval_ctx.autoescape = True
+
+        assert _resolve(ctx, "govukInput") is ctx.resolve.return_value
+        monkeypatch.setattr("dmcontent.govuk_frontend.python_components", True)
+        assert _resolve(ctx, "govukInput") is govuk_frontend_components.govuk_input
+
+
+class TestHtmlPaths:
+    def test_it_finds_html_values_in_nested_params(self):
+        params = {
+            "hint": {"html": "<p>Hint</p>"},
+            "items": [{"text": "One"}, {"conditional": {"html": [{"macro_name": "test"}]}}],
+            "label": {"text": "Label"},
+        }
+
+        assert sorted(_html_paths(params)) == [("hint", "html"), ("items", 1, "conditional", "html")]
+
+    def test_it_does_not_look_inside_html_values(self):
+        assert _html_paths({"html": {"params": {"html": "nested"}}}) == [("html",)]
+
+    def test_with_html_only_copies_the_way_to_each_path(self):
+        ctx = mock.Mock()
+        params = {
+            "hint": {"html": "<p>Hint</p>"},
+            "items": [{"text": "One"}, {"conditional": {"html": "<p>Conditional</p>"}}],
+            "label": {"text": "Label"},
+        }
+
+        rendered = _with_html(ctx, params, _html_paths(params))
+
+        assert rendered == {
+            "hint": {"html": Markup("&lt;p&gt;Hint&lt;/p&gt;")},
+            "items": [{"text": "One"}, {"conditional": {"html": Markup("&lt;p&gt;Conditional&lt;/p&gt;")}}],
+            "label": {"text": "Label"},
+        }
+        assert params["hint"] == {"html": "<p>Hint</p>"}
+        assert params["items"][1] == {"conditional": {"html": "<p>Conditional</p>"}}
+        assert rendered["label"] is params["label"]
+        assert rendered["items"][0] is params["items"][0]
+
 
 class TestRenderQuestion:
 
@@ -1371,17 +1650,18 @@ class TestRenderQuestion:
         data = mock.Mock()
         errors = mock.Mock()
 
-        with mock.patch("dmcontent.govuk_frontend.from_question") as from_question:
-            with mock.patch("dmcontent.govuk_frontend.render") as render:
+        to_render = mock.Mock()
+        html_paths = mock.Mock()
+
+        with mock.patch(
+            "dmcontent.govuk_frontend._from_question", return_value=(to_render, html_paths)
+        ) as from_question:
+            with mock.patch("dmcontent.govuk_frontend._render") as render:
                 # with default args
                 render_question(ctx, question)
 
                 assert from_question.call_args == mock.call(question, None, None)
-                assert render.call_args == mock.call(
-                    ctx,
-                    from_question(question, None, None),
-                    question=question
-                )
+                assert render.call_args == mock.call(ctx, to_render, question, html_paths)
 
                 # with args and kwargs
                 render_question(ctx, question, data, errors, some_kwarg="foobar")
@@ -1389,11 +1669,7 @@ class TestRenderQuestion:
                 assert from_question.call_args == mock.call(
                     question, data, errors, some_kwarg="foobar"
                 )
-                assert render.call_args == mock.call(
-                    ctx,
-                    from_question(question, data, errors, some_kwarg="foobar"),
-                    question=question
-                )
+                assert render.call_args == mock.call(ctx, to_render, question, html_paths)
 
     def test_it_raises_jinja2_undefined_error_if_question_type_is_not_handled(self):
         ctx = mock.Mock()
@@ -1426,3 +1702,102 @@ class TestRenderQuestion:
         )
 
         assert "This will help you to refer to your requirements" in render_question(ctx, question)
+
+
+class TestRenderSection:
+    macros = "".join(
+        f"{{% macro {name}(params) %}}<{name} {{{{ params }}}}>{{{{ caller() if caller }}}}</{name}>{{% endmacro %}}"
+        for name in ("govukLabel", "govukFieldset", "govukInput", "govukDateInput", "govukRadios", "govukCheckboxes",
+                     "govukCharacterCount", "govukFileUpload", "dmListInput")
+    )
+
+    @pytest.fixture(params=[{}, {"lstrip_blocks": True, "trim_blocks": True}], ids=["default", "trim_blocks"])
+    def env(self, request):
+        env = jinja2.Environment(autoescape=True, **request.param)
+        env.globals["render_question"] = render_question
+        env.globals["render_section"] = render_section
+        return env
+
+    @pytest.fixture
+    def section(self):
+        return ContentSection.create({
+            "slug": "section",
+            "name": "Section",
+            "questions": TestFromQuestionSkeletons.questions + [
+                {"id": "advice", "type": "text", "question": "Advice", "question_advice": "Some <b>advice</b>"},
+            ],
+        })
+
+    def render_questions(self, env, section, **render_args):
+        return env.from_string(
+            self.macros
+            + "{% for question in section.questions %}{{ render_question(question, data, errors) }}{% endfor %}"
+        ).render(section=section, **render_args)
+
+    def render_section(self, env, section, **render_args):
+        return env.from_string(
+            self.macros + "{{ render_section(section, data, errors) }}"
+        ).render(section=section, **render_args)
+
+    def test_it_renders_the_same_html_as_render_question(self, env, section):
+        errors = {
+            question_id: {"input_name": question_id, "question": "Question", "message": "There is a problem"}
+            for question_id in ("text", "number", "price", "date", "list", "radios", "checkboxes", "boolean",
+                                "textbox_large", "upload", "yesNo", "more", "advice")
+        }
+        for data in TestFromQuestionSkeletons.data:
+            for data_errors in (None, errors):
+                assert (
+                    self.render_section(env, section, data=data, errors=data_errors)
+                    == self.render_questions(env, section, data=data, errors=data_errors)
+                )
+
+    def test_it_renders_an_empty_section(self, env):
+        section = ContentSection.create({"slug": "section", "name": "Section", "questions": []})
+
+        assert self.render_section(env, section, data={}, errors=None) == ""
+
+    def test_it_only_compiles_the_section_once(self, env, section):
+        self.render_section(env, section, data={}, errors=None)
+        templates = dict(_section_templates[env])
+
+        with mock.patch.object(env, "from_string", wraps=env.from_string) as from_string:
+            self.render_section(env, section, data={"text": "Some text"}, errors={})
+
+        assert from_string.call_count == 1  # the outer template
+        assert _section_templates[env] == templates
+
+    def test_sections_made_for_each_request_share_a_template(self, env):
+        content = {
+            "slug": "section",
+            "name": "Section",
+            "questions": TestFromQuestionSkeletons.questions,
+        }
+        self.render_section(env, ContentSection.create(content).filter({}), data={}, errors=None)
+
+        with mock.patch.object(env, "from_string", wraps=env.from_string) as from_string:
+            html = self.render_section(
+                env, ContentSection.create(content).filter({}), data={"text": "Some text"}, errors=None
+            )
+
+        assert from_string.call_count == 1  # the outer template
+        assert html == self.render_questions(
+            env, ContentSection.create(content).filter({}), data={"text": "Some text"}, errors=None
+        )
+
+    def test_it_compiles_the_section_again_if_it_is_filtered_in_place(self, env):
+        section = ContentSection.create({
+            "slug": "section",
+            "name": "Section",
+            "questions": [{"id": "q1", "type": "text", "question": TemplateField("Which {{ thing }}?")}],
+        })
+
+        section.filter({"thing": "lot"}, inplace_allowed=True)
+        assert "Which lot?" in self.render_section(env, section, data={}, errors=None)
+
+        section.filter({"thing": "service"}, inplace_allowed=True)
+        assert "Which service?" in self.render_section(env, section, data={}, errors=None)
+
+    def test_it_calls_the_macros_in_the_template_context(self, env, section):
+        with pytest.raises(jinja2.UndefinedError):
+            env.from_string("{{ render_section(section, {}, {}) }}").render(section=section)
@@ -0,0 +1,382 @@
+"""
+Check the Python versions of the govuk-frontend macros against the macros themselves.
+
+The macros come from the govuk-frontend-jinja package (a Jinja port of
+govuk-frontend 3.15.0), which is a dev requirement.
+"""
+
+import itertools
+
+import jinja2
+import mock
+import pytest
+from jinja2 import Markup
+
+from dmcontent import govuk_frontend
+from dmcontent.content_loader import ContentSection
+from dmcontent.govuk_frontend import render, render_question, render_section
+from dmcontent.govuk_frontend_components import MACROS, environment_is_compatible
+from dmcontent.questions import ContentQuestion
+
+
+pytest.importorskip("govuk_frontend_jinja")
+
+MACRO_TEMPLATES = {
+    "govukCharacterCount": "character-count",
+    "govukCheckboxes": "checkboxes",
+    "govukDateInput": "date-input",
+    "govukErrorMessage": "error-message",
+    "govukFieldset": "fieldset",
+    "govukFileUpload": "file-upload",
+    "govukHint": "hint",
+    "govukInput": "input",
+    "govukLabel": "label",
+    "govukRadios": "radios",
+    "govukTextarea": "textarea",
+}
+
+IMPORTS = "".join(
+    f'{{% from "govuk_frontend_jinja/components/{directory}/macro.html" import {name} %}}'
+    for name, directory in MACRO_TEMPLATES.items()
+)
+
+# dmListInput comes from digitalmarketplace-frontend-jinja, so we have no Python version of it
+DM_LIST_INPUT = '{% macro dmListInput(params) %}<dm-list-input name="{{ params.name }}">{% endmacro %}'
+
+
+def make_env(**kwargs):
+    kwargs.setdefault("autoescape", True)
+    kwargs.setdefault("undefined", jinja2.ChainableUndefined)
+    env = jinja2.Environment(
+        loader=jinja2.PrefixLoader({"govuk_frontend_jinja": jinja2.PackageLoader("govuk_frontend_jinja")}),
+        **kwargs
+    )
+    env.globals["render"] = render
+    env.globals["render_question"] = render_question
+    env.globals["render_section"] = render_section
+    return env
+
+
+@pytest.fixture(scope="module")
+def env():
+    return make_env()
+
+
+@pytest.fixture(scope="module")
+def macros(env):
+    return {
+        name: getattr(env.get_template(f"govuk_frontend_jinja/components/{directory}/macro.html").module, name)
+        for name, directory in MACRO_TEMPLATES.items()
+    }
+
+
+@pytest.fixture
+def python_components(monkeypatch):
+    def use(value):
+        monkeypatch.setattr(govuk_frontend, "python_components", value)
+    return use
+
+
+def test_there_is_a_macro_for_every_python_component():
+    assert MACROS.keys() == MACRO_TEMPLATES.keys()
+
+
+class TestEnvironmentIsCompatible:
+    def test_default_environment_with_autoescape_is_compatible(self):
+        assert environment_is_compatible(jinja2.Environment(), True)
+        assert environment_is_compatible(make_env(), True)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"trim_blocks": True},
+        {"lstrip_blocks": True},
+        {"newline_sequence": "\r\n"},
+        {"finalize": str},
+        {"undefined": jinja2.StrictUndefined},
+    ])
+    def test_other_environments_are_not_compatible(self, kwargs):
+        assert not environment_is_compatible(jinja2.Environment(**kwargs), True)
+
+    def test_not_compatible_without_autoescape(self):
+        assert not environment_is_compatible(jinja2.Environment(), False)
+
+
+class TestComponents:
+    """Call each function and the macro of the same name with the same params"""
+
+    labels = [
+        {},
+        {"text": "Label <b>"},
+        {"html": "<b>Label</b>", "classes": "govuk-label--l", "isPageHeading": True, "attributes": {"data-x": "1"}},
+    ]
+    hints = [None, {"text": "Hint <b>"}, {"html": "<b>Hint</b>", "classes": "app-hint", "attributes": {"a": "b"}}]
+    error_messages = [
+        None,
+        {"text": "Error <b>"},
+        {"html": "<b>Error</b>", "visuallyHiddenText": None, "classes": "app-error"},
+        {"text": "Error", "visuallyHiddenText": "Oops"},
+    ]
+    fieldsets = [
+        None,
+        {"legend": {"text": "Legend <b>"}},
+        {"legend": {"html": "<b>Legend</b>", "isPageHeading": True, "classes": "govuk-fieldset__legend--l"},
+         "describedBy": "other", "classes": "app-fieldset", "attributes": {"a": "b"}},
+    ]
+
+    def check(self, macros, name, params, **kwargs):
+        assert MACROS[name](params, **kwargs) == macros[name](params, **kwargs)
+
+    @pytest.mark.parametrize("params", labels + [{"text": "Label", "for": "input-id"}])
+    def test_govuk_label(self, macros, params):
+        self.check(macros, "govukLabel", params)
+
+    @pytest.mark.parametrize("params", [hint for hint in hints if hint] + [{"text": "Hint", "id": "hint-id"}])
+    def test_govuk_hint(self, macros, params):
+        self.check(macros, "govukHint", params)
+
+    @pytest.mark.parametrize("params", [error for error in error_messages if error] + [{"text": "E", "id": "e"}])
+    def test_govuk_error_message(self, macros, params):
+        self.check(macros, "govukErrorMessage", params)
+
+    @pytest.mark.parametrize("params", [fieldset for fieldset in fieldsets if fieldset] + [{"html": "<p>Hi</p>"}])
+    @pytest.mark.parametrize("caller", [None, lambda: "<p>Escaped</p>", lambda: Markup("<p>Not escaped</p>")])
+    def test_govuk_fieldset(self, macros, params, caller):
+        if caller:
+            self.check(macros, "govukFieldset", params, caller=caller)
+        else:
+            self.check(macros, "govukFieldset", params)
+
+    @pytest.mark.parametrize("label, hint, error_message", itertools.product(labels, hints, error_messages))
+    @pytest.mark.parametrize("extra", [
+        {},
+        {"value": "A <value>", "type": "number", "spellcheck": False, "autocomplete": "off", "inputmode": "numeric",
+         "pattern": "[0-9]*", "classes": "govuk-input--width-5", "describedBy": "other", "attributes": {"a": "b"},
+         "formGroup": {"classes": "app-group"}},
+        {"prefix": {"text": "£"}, "value": None, "spellcheck": True},
+        {"suffix": {"html": "<b>per unit</b>", "classes": "app-suffix", "attributes": {"a": "b"}}},
+        {"prefix": {"text": "£", "classes": "app-prefix"}, "suffix": {"text": "each"}},
+        {"prefix": {}, "value": 0},
+    ])
+    def test_govuk_input(self, macros, label, hint, error_message, extra):
+        params = {"id": "input-id", "name": "input-name", "label": label, **extra}
+        if hint:
+            params["hint"] = hint
+        if error_message:
+            params["errorMessage"] = error_message
+        self.check(macros, "govukInput", params)
+
+    @pytest.mark.parametrize("label, hint, error_message", itertools.product(labels, hints, error_messages))
+    @pytest.mark.parametrize("extra", [
+        {},
+        {"value": "Some\n<text>", "rows": 8, "spellcheck": False, "autocomplete": "off", "classes": "app-textarea",
+         "describedBy": "other", "attributes": {"a": "b"}, "formGroup": {"classes": "app-group"}},
+    ])
+    def test_govuk_textarea(self, macros, label, hint, error_message, extra):
+        params = {"id": "textarea-id", "name": "textarea-name", "label": label, **extra}
+        if hint:
+            params["hint"] = hint
+        if error_message:
+            params["errorMessage"] = error_message
+        self.check(macros, "govukTextarea", params)
+
+    @pytest.mark.parametrize("label, hint, error_message", itertools.product(labels, hints, error_messages))
+    @pytest.mark.parametrize("extra", [
+        {"maxlength": 100},
+        {"maxwords": 50, "threshold": 75, "value": "Some <text>", "rows": 10, "spellcheck": True,
+         "classes": "app-count", "countMessage": {"classes": "app-message"}, "attributes": {"a": "b"}},
+    ])
+    def test_govuk_character_count(self, macros, label, hint, error_message, extra):
+        params = {"id": "count-id", "name": "count-name", "label": label, **extra}
+        if hint:
+            params["hint"] = hint
+        if error_message:
+            params["errorMessage"] = error_message
+        self.check(macros, "govukCharacterCount", params)
+
+    items = [
+        [],
+        [{"value": "one", "text": "One"}, {"value": "two", "html": "<b>Two</b>", "checked": True}],
+        [
+            {"value": "one", "text": "One", "id": "custom-id", "hint": {"text": "The first"},
+             "label": {"classes": "app-label", "attributes": {"a": "b"}}, "attributes": {"c": "d"}},
+            {"divider": "or"},
+            {"value": "two", "text": "Two", "disabled": True, "hint": {"html": "<b>Second</b>", "classes": "x"},
+             "conditional": {"html": Markup("\n  <p>More</p>\n")}},
+            {"value": "three", "text": "Three", "checked": True, "conditional": {"html": "<p>Even more</p>"}},
+            {"value": "none", "text": "None", "behaviour": "exclusive", "name": "other-name", "hint": {}},
+            {},
+        ],
+    ]
+
+    @pytest.mark.parametrize("name", ["govukRadios", "govukCheckboxes"])
+    @pytest.mark.parametrize(
+        "items, hint, error_message, fieldset", itertools.product(items, hints, error_messages, fieldsets)
+    )
+    @pytest.mark.parametrize("extra", [
+        {},
+        {"idPrefix": "prefix", "classes": "govuk-radios--inline", "attributes": {"a": "b"}, "describedBy": "desc",
+         "formGroup": {"classes": "app-group"}},
+    ])
+    def test_govuk_radios_and_checkboxes(self, macros, name, items, hint, error_message, fieldset, extra):
+        params = {"name": "choice", "items": items, **extra}
+        if hint:
+            params["hint"] = hint
+        if error_message:
+            params["errorMessage"] = error_message
+        if fieldset:
+            params["fieldset"] = fieldset
+        self.check(macros, name, params)
+
+    @pytest.mark.parametrize(
+        "hint, error_message, fieldset", itertools.product(hints, error_messages, fieldsets)
+    )
+    @pytest.mark.parametrize("extra", [
+        {},
+        {"items": []},
+        {
+            "namePrefix": "date", "classes": "app-date", "attributes": {"a": "b"}, "formGroup": {"classes": "x"},
+            "items": [
+                {"name": "day", "value": "1", "classes": "govuk-input--width-2"},
+                {"name": "month", "label": "Mon", "id": "custom-month", "attributes": {"a": "b"}},
+                {"name": "year", "inputmode": "text", "autocomplete": "bday-year", "pattern": "[0-9]{4}"},
+            ],
+        },
+    ])
+    def test_govuk_date_input(self, macros, hint, error_message, fieldset, extra):
+        params = {"id": "date-id", **extra}
+        if hint:
+            params["hint"] = hint
+        if error_message:
+            params["errorMessage"] = error_message
+        if fieldset:
+            params["fieldset"] = fieldset
+        self.check(macros, "govukDateInput", params)
+
+    @pytest.mark.parametrize("label, hint, error_message", itertools.product(labels, hints, error_messages))
+    @pytest.mark.parametrize("extra", [
+        {},
+        {"value": "file.pdf", "classes": "app-upload", "describedBy": "other", "attributes": {"accept": ".pdf"},
+         "formGroup": {"classes": "app-group"}},
+    ])
+    def test_govuk_file_upload(self, macros, label, hint, error_message, extra):
+        params = {"id": "upload-id", "name": "upload-name", "label": label, **extra}
+        if hint:
+            params["hint"] = hint
+        if error_message:
+            params["errorMessage"] = error_message
+        self.check(macros, "govukFileUpload", params)
+
+
+class TestRenderQuestion:
+    """Render every type of question with both the macros and the Python versions of them"""
+
+    questions = [
+        {"id": "text", "type": "text", "question": "Text", "hint": "A <hint>"},
+        {"id": "number", "type": "number", "question": "Number", "unit": "£", "unit_position": "before"},
+        {"id": "numberAfter", "type": "number", "question": "Number", "unit": "%", "unit_position": "after"},
+        {"id": "pricing", "type": "pricing", "question": "Price", "fields": {"price": "price"}},
+        {"id": "date", "type": "date", "question": "Date", "question_advice": "Some <b>advice</b>"},
+        {"id": "list", "type": "list", "question": "List", "question_advice": "Some advice"},
+        {
+            "id": "radios", "type": "radios", "question": "Radios", "hint": "Choose one",
+            "options": [{"label": "One", "value": "one", "description": "The first"}, {"label": "Two"}],
+        },
+        {
+            "id": "checkboxes", "type": "checkboxes", "question": "Checkboxes",
+            "options": [{"label": "One", "description": "The first"}, {"label": "Two & three"}],
+        },
+        {"id": "boolean", "type": "boolean", "question": "Boolean", "optional": True},
+        {"id": "textbox_large", "type": "textbox_large", "question": "Textbox", "max_length_in_words": 10},
+        {"id": "textbox_small", "type": "textbox_large", "question": "Textbox", "hint": "Be brief"},
+        {"id": "upload", "type": "upload", "question": "Upload", "question_advice": "Some advice"},
+        {
+            "id": "multiquestion", "type": "multiquestion", "question": "Multiquestion",
+            "questions": [
+                {"id": "yesNo", "type": "boolean", "question": "Yes or no?", "followup": {"more": [True]}},
+                {"id": "more", "type": "textbox_large", "question": "Tell us more"},
+                {"id": "other", "type": "text", "question": "Anything else?", "hint": "Go on"},
+            ],
+        },
+    ]
+
+    data = [
+        {},
+        {
+            "text": "Some <text>", "number": 0, "numberAfter": 12, "price": "12", "date-day": "1",
+            "date-year": "2020", "list": ["a", "b"], "radios": "one", "checkboxes": ["One", "Two & three"],
+            "boolean": False, "textbox_large": "Words", "textbox_small": "Words", "upload": "https://example.com/a.pdf",
+            "yesNo": True, "more": "More text", "other": "Other",
+        },
+        {"radios": "Two", "checkboxes": "One", "boolean": True, "yesNo": False},
+    ]
+
+    errors = {
+        question_id: {"input_name": question_id, "question": "Question", "message": "There is a <problem>"}
+        for question_id in ("text", "number", "numberAfter", "price", "date", "list", "radios", "checkboxes",
+                            "boolean", "textbox_large", "textbox_small", "upload", "yesNo", "more", "other")
+    }
+
+    template = IMPORTS + DM_LIST_INPUT + "{{ render_question(question, data, errors, **kwargs) }}"
+
+    @pytest.fixture(params=[(2, 13, 0), (3, 15, 0)], ids=["govuk-frontend-2", "govuk-frontend-3"])
+    def govuk_frontend_version(self, request, monkeypatch):
+        monkeypatch.setattr(govuk_frontend, "govuk_frontend_version", request.param)
+
+    @pytest.mark.usefixtures("govuk_frontend_version")
+    @pytest.mark.parametrize("content", questions, ids=[question["id"] for question in questions])
+    @pytest.mark.parametrize("data", data)
+    @pytest.mark.parametrize("errors", [None, errors])
+    @pytest.mark.parametrize("kwargs", [{}, {"is_page_heading": False}])
+    def test_python_components_render_the_same_html_as_macros(
+        self, env, python_components, content, data, errors, kwargs
+    ):
+        template = env.from_string(self.template)
+        render_args = {"question": ContentQuestion(content), "data": data, "errors": errors, "kwargs": kwargs}
+
+        python_components(False)
+        expected = template.render(**render_args)
+        python_components(True)
+        assert template.render(**render_args) == expected
+
+    @pytest.mark.usefixtures("govuk_frontend_version")
+    @pytest.mark.parametrize("use_python_components", [False, True])
+    def test_render_section_renders_the_same_html_as_render_question(
+        self, env, python_components, use_python_components
+    ):
+        section = ContentSection.create({"slug": "section", "name": "Section", "questions": self.questions})
+        questions_template = env.from_string(
+            IMPORTS + DM_LIST_INPUT
+            + "{% for question in section.questions %}{{ render_question(question, data, errors) }}{% endfor %}"
+        )
+        section_template = env.from_string(IMPORTS + DM_LIST_INPUT + "{{ render_section(section, data, errors) }}")
+
+        python_components(use_python_components)
+        for data in self.data:
+            for errors in (None, self.errors):
+                assert (
+                    section_template.render(section=section, data=data, errors=errors)
+                    == questions_template.render(section=section, data=data, errors=errors)
+                )
+
+    def test_python_components_are_used_when_turned_on(self, env, python_components):
+        template = env.from_string(self.template)
+        render_args = {"question": ContentQuestion(self.questions[0]), "data": {}, "errors": None, "kwargs": {}}
+
+        python_components(True)
+        with mock.patch.dict(MACROS, {"govukInput": mock.Mock(return_value="python")}):
+            assert template.render(**render_args).endswith("python")
+
+    def test_macros_are_used_when_turned_off(self, env, python_components):
+        template = env.from_string(self.template)
+        render_args = {"question": ContentQuestion(self.questions[0]), "data": {}, "errors": None, "kwargs": {}}
+
+        python_components(False)
+        with mock.patch.dict(MACROS, {"govukInput": mock.Mock(return_value="python")}):
+            assert "python" not in template.render(**render_args)
+
+    def test_macros_are_used_in_an_incompatible_environment(self, python_components):
+        template = make_env(trim_blocks=True).from_string(self.template)
+        render_args = {"question": ContentQuestion(self.questions[0]), "data": {}, "errors": None, "kwargs": {}}
+
+        python_components(True)
+        with mock.patch.dict(MACROS, {"govukInput": mock.Mock(return_value="python")}):
+            assert "python" not in template.render(**render_args)
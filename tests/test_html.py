@@ -5,7 +5,10 @@ import pytest
 from jinja2 import Markup
 
 from dmcontent.content_loader import ContentManifest
-from dmcontent.html import text_to_html, to_html, to_summary_list_rows, to_summary_list_row
+from dmcontent.utils import TemplateField
+from dmcontent.html import (
+    text_to_html, to_html, to_summary_list_rows, to_summary_list_row, iter_summary_list_rows, SummaryHTMLCache
+)
 
 
 @pytest.fixture
@@ -578,6 +581,46 @@ def test_to_summary_list_rows_can_capitalize_first(content_summary):
     }
 
 
+@pytest.mark.parametrize("filter_empty", (True, False))
+def test_iter_summary_list_rows_yields_the_same_rows_as_to_summary_list_rows(content_summary, filter_empty):
+    questions = content_summary.sections[0].questions
+    summary_list_rows = iter_summary_list_rows(questions, filter_empty=filter_empty, capitalize_first=True)
+
+    assert not isinstance(summary_list_rows, list)
+    assert list(summary_list_rows) == to_summary_list_rows(
+        questions, filter_empty=filter_empty, capitalize_first=True
+    )
+
+
+def test_iter_summary_list_rows_accepts_a_lazy_summary_section():
+    content = ContentManifest([{
+        "slug": "first_section",
+        "name": "First section",
+        "questions": [
+            {"id": "q1", "type": "text", "question": "First question"},
+            {"id": "q2", "type": "text", "question": "Second question"},
+        ],
+    }])
+    section = content.summary({"q1": "First answer", "q2": "Second answer"}, lazy=True).sections[0]
+
+    summary_list_rows = iter_summary_list_rows(section)
+
+    assert next(summary_list_rows) == {"key": {"text": "First question"}, "value": {"html": "First answer"}}
+    assert repr(section.questions) == "<LazyList: 1 of 2 evaluated>"
+    assert next(summary_list_rows) == {"key": {"text": "Second question"}, "value": {"html": "Second answer"}}
+
+
+def test_iter_summary_list_rows_can_be_used_in_a_streamed_template(content_summary):
+    env = jinja2.Environment(autoescape=True)
+    template = env.from_string(
+        "{% for row in rows %}<dt>{{ row.key.text }}</dt><dd>{{ row.value.html }}</dd>{% endfor %}"
+    )
+
+    stream = template.stream(rows=iter_summary_list_rows(content_summary.sections[0]))
+
+    assert "".join(stream) == template.render(rows=to_summary_list_rows(content_summary.sections[0].questions))
+
+
 def test_to_summary_list_row_sets_link_if_question_is_empty_and_action_link_is_set(content_summary):
     empty_string_question = to_summary_list_row(content_summary.sections[0].questions[6], action_link='/')
     assert empty_string_question["value"]["html"] == Markup('<a class="govuk-link" href="/">Not answered</a>')
@@ -607,3 +650,116 @@ def test_to_summary_list_row_sets_actions_if_question_is_not_empty_and_action_li
 def test_to_summary_list_row_adds_optional_label_if_question_is_optional_and_action_link_is_provided(content_summary):
     empty_string_question = to_summary_list_row(content_summary.sections[0].questions[23], action_link='/')
     assert empty_string_question["key"]["text"] == "Optional question which is not answered (Optional)"
+
+
+class TestSummaryHTMLCache:
+    @pytest.mark.parametrize("kwargs", ({}, {"capitalize_first": True, "format_links": True}))
+    def test_cached_rows_are_the_same_as_uncached_rows(self, content_summary, kwargs):
+        questions = content_summary.sections[0].questions
+        cache = SummaryHTMLCache()
+
+        for _ in range(2):
+            assert to_summary_list_rows(questions, filter_empty=False, cache=cache, **kwargs) == \
+                to_summary_list_rows(questions, filter_empty=False, **kwargs)
+            assert [to_html(question, cache=cache, **kwargs) for question in questions] == \
+                [to_html(question, **kwargs) for question in questions]
+
+    def test_reports_hit_rate(self, content_summary):
+        question = content_summary.sections[0].questions[0]
+        cache = SummaryHTMLCache()
+
+        to_html(question, cache=cache)
+        to_html(question, cache=cache)
+        to_html(question, cache=cache, capitalize_first=True)
+        to_html(question, cache=cache)
+
+        assert cache.cache_info() == (2, 2, 1024, 2)
+        assert cache.hit_rate == 0.5
+
+    def test_is_keyed_on_answer(self):
+        content = ContentManifest([{
+            "slug": "first_section",
+            "name": "First section",
+            "questions": [{"id": "q1", "type": "text", "question": "Question"}],
+        }])
+        cache = SummaryHTMLCache()
+
+        assert to_html(content.summary({"q1": "First answer"}).get_question("q1"), cache=cache) == "First answer"
+        assert to_html(content.summary({"q1": "Other answer"}).get_question("q1"), cache=cache) == "Other answer"
+        assert to_html(content.summary({"q1": True}).get_question("q1"), cache=cache) == "True"
+        assert to_html(content.summary({"q1": 1}).get_question("q1"), cache=cache) == "1"
+        assert to_html(content.summary({"q1": "<b>"}).get_question("q1"), cache=cache) == "&lt;b&gt;"
+        assert to_html(content.summary({"q1": Markup("<b>")}).get_question("q1"), cache=cache) == "<b>"
+        assert cache.hits == 0
+
+    def test_is_keyed_on_the_type_of_the_content(self):
+        cache = SummaryHTMLCache()
+
+        for hint in (Markup("<b>Hint</b>"), "<b>Hint</b>"):
+            content = ContentManifest([{
+                "slug": "first_section",
+                "name": "First section",
+                "questions": [{"id": "q1", "type": "text", "question": "Question", "hint": hint}],
+            }])
+            question = content.summary({"q1": "Answer"}).get_question("q1")
+            assert to_summary_list_row(question, cache=cache) == to_summary_list_row(question)
+
+        assert cache.hits == 0
+
+    def test_is_keyed_on_rendered_labels(self):
+        content = ContentManifest([{
+            "slug": "first_section",
+            "name": "First section",
+            "questions": [{
+                "id": "q1",
+                "type": "multiquestion",
+                "question": "Question",
+                "questions": [{"id": "q2", "type": "text", "question": TemplateField("About {{ lot }}")}],
+            }],
+        }])
+        cache = SummaryHTMLCache()
+
+        for lot in ("SaaS", "PaaS"):
+            question = content.filter({"lot": lot}).summary({"q2": "Answer"}).get_question("q1")
+            assert f"About {lot}" in to_html(question, cache=cache)
+
+        assert cache.hits == 0
+
+    def test_is_bounded(self, content_summary):
+        cache = SummaryHTMLCache(maxsize=3)
+
+        for question in content_summary.sections[0].questions:
+            to_html(question, cache=cache)
+
+        assert len(cache) == 3
+
+    def test_returns_copies_of_cached_rows(self, content_summary):
+        question = content_summary.sections[0].questions[0]
+        cache = SummaryHTMLCache()
+
+        row = to_summary_list_row(question, action_link="/", cache=cache)
+        row["actions"]["items"].clear()
+
+        assert to_summary_list_row(question, action_link="/", cache=cache) == \
+            to_summary_list_row(question, action_link="/")
+        assert cache.hits == 1
+
+    def test_caches_each_row_once(self, content_summary):
+        question = content_summary.sections[0].questions[0]
+        cache = SummaryHTMLCache()
+
+        to_summary_list_row(question, cache=cache)
+        to_summary_list_row(question, cache=cache)
+
+        assert cache.cache_info() == (1, 1, 1024, 1)
+
+    def test_does_not_cache_unhashable_answers(self):
+        content = ContentManifest([{
+            "slug": "first_section",
+            "name": "First section",
+            "questions": [{"id": "q1", "type": "text", "question": "Question"}],
+        }])
+        cache = SummaryHTMLCache()
+
+        assert to_html(content.summary({"q1": {"a", "b"}}).get_question("q1"), cache=cache)
+        assert len(cache) == 0
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from dmcontent.messages import ContentMessage
@@ -32,6 +35,17 @@ class TestContentMessage(object):
 
         assert message.__repr__()
 
+    @pytest.mark.parametrize("round_trip", (copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))))
+    def test_message_can_be_copied_and_pickled(self, round_trip):
+        message = ContentMessage({'name': TemplateField('Name {{ lot }}'), 'nested': {'key': 'value'}})
+        message = message.filter({'lot': 'one'})
+
+        loaded = round_trip(message)
+
+        assert loaded == message
+        assert loaded.name == 'Name one'
+        assert loaded.nested.key == 'value'
+
     def test_content_message_template_field(self):
         message = ContentMessage({'name': TemplateField("Name")})
 
@@ -1,5 +1,7 @@
 # coding=utf-8
 from collections import OrderedDict
+import copy
+import pickle
 
 import markupsafe
 from markupsafe import Markup
@@ -122,6 +124,79 @@ class QuestionTest(object):
 
         assert question.question == "Question"
 
+    @pytest.mark.parametrize("round_trip", (copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))))
+    def test_question_can_be_copied_and_pickled(self, round_trip):
+        question = self.question(
+            question=TemplateField("Question {{ lot }}"), hint=TemplateField("Hint"),
+        ).filter(self.context({"lot": "one"}))
+        question.question  # fill in the rendered fields, which aren't kept
+
+        loaded = round_trip(question)
+
+        assert type(loaded) is type(question)
+        assert repr(loaded) == repr(question)
+        assert loaded._context == question._context
+        assert (loaded.question, loaded.hint, loaded.label) == ("Question one", "Hint", "Question one")
+        assert loaded.get_question_ids() == question.get_question_ids()
+        assert loaded.form_fields == question.form_fields
+        assert loaded.get("options") == question.get("options")
+        with pytest.raises(TypeError):
+            loaded._data["id"] = "changed"
+
+    def test_filtered_questions_share_their_data(self):
+        question = self.question()
+
+        assert question.filter(self.context())._data is question._data
+        assert question.summary({})._data is question._data
+
+    def test_question_data_is_a_copy(self):
+        data = {"id": "example", "type": "text"}
+        question = ContentQuestion(data)
+        data["id"] = "changed"
+
+        assert question.id == "example"
+
+    def test_questions_have_no_dict(self):
+        question = self.question()
+
+        assert not hasattr(question, "__dict__")
+        assert not hasattr(question.summary({}), "__dict__")
+        with pytest.raises(AttributeError):
+            question.new_attribute = "value"
+
+    def test_filtered_question_fields_are_rendered_once(self):
+        question = self.question(question=TemplateField("Question {{ lot }}")).filter(self.context({"lot": "one"}))
+
+        assert question.question == "Question one"
+        assert question.question is question.question
+
+    def test_filtering_in_place_again_renders_fields_again(self):
+        question = self.question(question=TemplateField("Question {{ lot }}"))
+
+        assert question.filter(self.context({"lot": "one"}), inplace_allowed=True).question == "Question one"
+        assert question.filter(self.context({"lot": "two"}), inplace_allowed=True).question == "Question two"
+
+    def test_unfiltered_question_fields_are_rendered_on_every_access(self):
+        question = self.question(question=TemplateField("Question"))
+
+        assert question.question == "Question"
+        assert question.question is not question.question
+
+    def test_changing_filtered_options_does_not_change_the_question(self):
+        question = self.question(
+            options=[{"label": "One", "value": "one", "description": TemplateField("For {{ lot }}")}],
+        ).filter(self.context({"lot": "one"}))
+
+        question.options[0]["description"] = "changed"
+        question.options.clear()
+
+        assert question.options == [{"label": "One", "value": "one", "description": "For one"}]
+
+    def test_summaries_share_rendered_fields_with_their_question(self):
+        question = self.question(question=TemplateField("Question {{ lot }}")).filter(self.context({"lot": "one"}))
+
+        assert question.summary({}).question is question.summary({}).question
+
     def test_question_options_descriptions_render_template_fields(self):
         """Check that all TEMPLATE_OPTIONS_FIELDS fields are correctly rendered from
         TemplateFields by passing in markup and ensuring they turn into Markup objects.
@@ -213,6 +288,9 @@ class TestDates(QuestionTest):
         data.update(kwargs)
         return ContentQuestion(data)
 
+    def test_question_class_has_a_docstring(self):
+        assert type(self.question()).__doc__.startswith("Class used as an interface for date data")
+
     def test_get_data(self):
         assert self.question().get_data({
             'example-day': '19',
@@ -409,6 +487,33 @@ class TestMultiquestion(QuestionTest):
             {'example': 'value', 'example3': 'value3'}
         ) == {'example3': 'value3'}
 
+    def test_filter_shares_the_questions_data(self):
+        question = self.question()
+        filtered = question.filter({"lot": "one"})
+
+        assert [q._data for q in filtered.questions] == [q._data for q in question.questions]
+        assert all(a._data is b._data for a, b in zip(filtered.questions, question.questions))
+        assert all(q._context is None for q in question.questions)
+
+    def test_filtering_a_filtered_question_filters_all_of_its_questions(self):
+        question = self.question(questions=[
+            {"id": "example2", "type": "text", "depends": [{"on": "lot", "being": ["one"]}]},
+            {"id": "example3", "type": "text"},
+        ])
+
+        assert question.filter({"lot": "one"}).form_fields == ['example2', 'example3']
+        assert question.filter({"lot": "two"}).form_fields == ['example3']
+        assert question.filter({"lot": "two"}).filter({"lot": "one"}).form_fields == ['example2', 'example3']
+
+    def test_filtering_in_place_again_is_cumulative(self):
+        question = self.question(questions=[
+            {"id": "example2", "type": "text", "depends": [{"on": "lot", "being": ["one"]}]},
+            {"id": "example3", "type": "text"},
+        ])
+        question.filter({"lot": "two"}, inplace_allowed=True)
+
+        assert question.filter({"lot": "one"}, inplace_allowed=True).form_fields == ['example3']
+
     def test_form_fields(self):
         assert self.question().form_fields == ['example2', 'example3']
 
@@ -621,6 +726,14 @@ class TestDynamicListQuestion(QuestionTest):
             # might be nice if this raised a more specific exception indicating what you'd done wrong
             question.filter({}, inplace_allowed=filter_inplace_allowed)
 
+    def test_filtering_a_dynamic_list_again_without_dynamic_drops_the_dynamic_questions(self):
+        question = self.question().filter(self.context())
+
+        assert question.get_question_ids() == [
+            'yesno-0', 'evidence-0', 'yesno-1', 'evidence-1', 'yesno-2', 'evidence-2', 'yesno-3', 'evidence-3',
+        ]
+        assert question.filter(self.context(), dynamic=False).get_question_ids() == ['yesno', 'evidence']
+
     def test_get_data_malformed_submission_no_context_applied(self):
         question = self.question()  # no context applied
         with pytest.raises(ValueError):
@@ -874,6 +987,9 @@ class TestCheckboxTree(QuestionTest):
 
         return ContentQuestion(data)
 
+    def test_question_class_has_a_docstring(self):
+        assert type(self.question()).__doc__.strip().startswith("For our purposes, a Hierarchy is like a List")
+
     def test_get_data(self):
         assert self.question().get_data(
             OrderedMultiDict([('example', 'value_1_1'), ('example', 'value_2_1')])
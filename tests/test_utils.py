@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import mock
 import pytest
 from jinja2 import Environment, Markup
@@ -13,7 +18,7 @@ from dmcontent.utils import (
     try_load_manifest,
     try_load_metadata,
     try_load_messages,
-    count_unanswered_questions, LazyDict,
+    count_unanswered_questions, count_unanswered_questions_many, LazyDict, LazyList,
 )
 
 
@@ -25,6 +30,24 @@ class TestTemplateField(object):
     def test_template_field_repr(self):
         assert TemplateField(u'string').__repr__()
 
+    def test_template_field_has_no_dict(self):
+        assert not hasattr(TemplateField(u'string'), '__dict__')
+
+    @pytest.mark.parametrize("markdown", (None, True, False))
+    def test_template_field_can_be_pickled(self, markdown):
+        field = TemplateField(u'Hello *{{ name }}*', markdown=markdown)
+        loaded = pickle.loads(pickle.dumps(field))
+
+        assert loaded == field
+        assert loaded.markdown == field.markdown
+        assert loaded.render({'name': 'world'}) == field.render({'name': 'world'})
+
+    def test_copying_a_template_field_gives_the_same_field(self):
+        field = TemplateField(u'string')
+
+        assert copy.copy(field) is field
+        assert copy.deepcopy(field) is field
+
     def test_empty_template(self):
         field = TemplateField('')
         assert field.render() == ''
@@ -361,6 +384,83 @@ def test_count_unanswered_questions():
     assert count_unanswered_questions(mock_content_manifest) == (6, 3)
 
 
+class TestCountUnansweredQuestionsMany:
+    def manifest(self):
+        return ContentManifest([
+            {
+                "slug": "first_section",
+                "name": "First section",
+                "questions": [
+                    {
+                        "id": "q1",
+                        "type": "multiquestion",
+                        "questions": [
+                            {"id": "q2", "type": "text"},
+                            {"id": "q3", "type": "boolean", "followup": {"q4": [True], "q5": [True]}},
+                            {"id": "q4", "type": "text"},
+                            {"id": "q5", "type": "text", "optional": True},
+                            {
+                                "id": "q6",
+                                "type": "radios",
+                                "options": [
+                                    {"label": "Yes please", "value": "yes"},
+                                    {"label": "No thanks", "value": "no"},
+                                ],
+                                "followup": {"q7": ["Yes please"]},
+                            },
+                            {"id": "q7", "type": "text"},
+                        ],
+                    },
+                    {"id": "q8", "type": "text", "optional": True},
+                    {"id": "q9", "type": "number", "unit": "£", "unit_position": "before"},
+                    {
+                        "id": "q10",
+                        "type": "pricing",
+                        "fields": {"minimum_price": "q10.min", "maximum_price": "q10.max", "price_unit": "q10.unit"},
+                        "optional_fields": ["maximum_price"],
+                    },
+                ],
+            },
+            {
+                "slug": "second_section",
+                "name": "Second section",
+                "questions": [
+                    {"id": "q11", "type": "checkboxes", "options": [{"label": "One", "value": "1"}]},
+                    {"id": "q12", "type": "list", "optional": True, "before_summary_value": ["Always"]},
+                    {"id": "q13", "type": "date"},
+                    {"id": "q14", "type": "boolean", "assuranceApproach": "2answers-type1"},
+                    {
+                        "id": "q15",
+                        "type": "checkbox_tree",
+                        "optional": True,
+                        "options": [{"label": "Parent", "options": [{"label": "Child"}]}],
+                    },
+                ],
+            },
+        ]).filter({})
+
+    @pytest.mark.parametrize("service_data", (
+        {},
+        {"q2": "answer", "q3": False, "q6": "no"},
+        {"q2": "answer", "q3": True, "q4": "followup", "q6": "yes"},
+        {"q2": "answer", "q3": True, "q6": "yes", "q7": "followup"},
+        {"q8": "", "q9": 0, "q10.min": "10", "q10.unit": "day"},
+        {"q11": ["1", "2"], "q12": [], "q13": "2020-01-01", "q14": {"value": True}},
+        {"q11": [], "q13": "not a date", "q14": {"assurance": "Independent validation"}, "q15": ["Child"]},
+    ))
+    def test_counts_are_the_same_as_for_summaries(self, service_data):
+        manifest = self.manifest()
+
+        assert count_unanswered_questions_many(manifest, [service_data]) == [
+            count_unanswered_questions(manifest.summary(service_data))
+        ]
+
+    def test_counts_for_each_service(self):
+        services = [{}, {"q2": "answer", "q3": False, "q6": "no", "q9": 5}, {"q8": "answer"}]
+
+        assert count_unanswered_questions_many(self.manifest(), iter(services)) == [(6, 2), (4, 2), (6, 1)]
+
+
 class TestLazyDict:
     def setup(self):
         self.callable_mock = mock.Mock()
@@ -389,3 +489,58 @@ class TestLazyDict:
         test_dict = LazyDict(test="test")
 
         assert test_dict.get("test") == "test"
+
+    def test_contains_does_not_call(self):
+        test_dict = LazyDict(test=self.callable_mock)
+
+        assert "test" in test_dict
+        assert "other" not in test_dict
+        assert self.callable_mock.call_count == 0
+
+    def test_calls_once_when_several_threads_ask_at_once(self):
+        def evaluate():
+            time.sleep(0.01)
+            return "test"
+        self.callable_mock.side_effect = evaluate
+        test_dict = LazyDict(test=self.callable_mock)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: test_dict["test"], range(8)))
+
+        assert values == ["test"] * 8
+        assert self.callable_mock.call_count == 1
+
+
+class TestLazyList:
+    def setup(self):
+        self.callable_mock = mock.Mock(side_effect=lambda item: item * 2)
+
+    def test_calls_lazily(self):
+        test_list = LazyList([1, 2, 3], self.callable_mock)
+
+        assert self.callable_mock.call_count == 0
+        assert test_list[1] == 4
+        assert self.callable_mock.call_args_list == [mock.call(2)]
+
+    def test_caches_result(self):
+        test_list = LazyList([1, 2, 3], self.callable_mock)
+
+        test_list[0]
+        test_list[0]
+
+        assert self.callable_mock.call_count == 1
+
+    def test_pickles_as_a_list(self):
+        test_list = LazyList([1, 2, 3], lambda item: item * 2)
+
+        assert pickle.loads(pickle.dumps(test_list)) == [2, 4, 6]
+
+    def test_behaves_like_a_list(self):
+        test_list = LazyList([1, 2, 3], self.callable_mock)
+
+        assert len(test_list) == 3
+        assert list(test_list) == [2, 4, 6]
+        assert test_list[-1] == 6
+        assert test_list[1:] == [4, 6]
+        assert test_list == [2, 4, 6]
+        assert 4 in test_list
@@ -0,0 +1,249 @@
+import gc
+import os
+import threading
+import time
+
+import pytest
+import yaml
+
+from unittest import mock
+
+from dmcontent.bundle import build_bundle
+from dmcontent.content_loader import ContentLoader
+from dmcontent.errors import ContentLoaderFrozenError
+from dmcontent.watch import ContentWatcher
+
+
+def write_yaml(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        yaml.safe_dump(content, f)
+
+
+def edit_yaml(path, content):
+    """Change a file, making sure its modification time changes too"""
+    stat = os.stat(path)
+    write_yaml(path, content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def content_path(tmp_path):
+    framework_path = tmp_path / "frameworks" / "g-cloud-12"
+    write_yaml(framework_path / "manifests" / "edit_service.yml", [
+        {"name": "About", "questions": ["serviceName", "serviceType"]},
+    ])
+    write_yaml(framework_path / "manifests" / "display_service.yml", [
+        {"name": "Service", "questions": ["serviceName", "support"]},
+    ])
+    write_yaml(framework_path / "questions" / "services" / "serviceName.yml", {"question": "Name", "type": "text"})
+    write_yaml(framework_path / "questions" / "services" / "serviceType.yml", {"question": "Type", "type": "text"})
+    write_yaml(framework_path / "questions" / "services" / "support.yml", {
+        "name": "Support", "question": "Support", "type": "multiquestion", "questions": ["supportHours"],
+    })
+    write_yaml(framework_path / "questions" / "services" / "supportHours.yml", {"question": "Hours", "type": "text"})
+    write_yaml(framework_path / "messages" / "dashboard.yml", {"status": "Open"})
+    write_yaml(framework_path / "metadata" / "copy_services.yml", {"source_framework": "g-cloud-11"})
+
+    return str(tmp_path)
+
+
+@pytest.fixture
+def loader(content_path):
+    loader = ContentLoader(content_path)
+    loader.load_manifest("g-cloud-12", "services", "edit_service")
+    loader.load_manifest("g-cloud-12", "services", "display_service")
+    loader.load_messages("g-cloud-12", ["dashboard"])
+    loader.load_metadata("g-cloud-12", ["copy_services"])
+    return loader
+
+
+def path(content_path, *parts):
+    return os.path.join(content_path, "frameworks", "g-cloud-12", *parts)
+
+
+def question_text(loader, manifest, question_id):
+    return loader.get_manifest("g-cloud-12", manifest).get_question(question_id).question
+
+
+class TestReloadFiles(object):
+    def test_records_the_files_and_questions_content_is_made_from(self, content_path, loader):
+        assert loader._dependencies[("manifest", "g-cloud-12", "display_service")] == {
+            path(content_path, "manifests", "display_service.yml"),
+            ("question", "g-cloud-12", "services", "serviceName"),
+            ("question", "g-cloud-12", "services", "support"),
+        }
+        assert loader._dependencies[("question", "g-cloud-12", "services", "support")] == {
+            path(content_path, "questions", "services", "support.yml"),
+            ("question", "g-cloud-12", "services", "supportHours"),
+        }
+        assert loader._dependencies[("messages", "g-cloud-12", "dashboard")] == {
+            path(content_path, "messages", "dashboard.yml"),
+        }
+
+    def test_reloads_only_the_manifests_using_a_changed_question(self, content_path, loader):
+        untouched_question = loader._questions["g-cloud-12"]["services"]["serviceName"]
+        untouched_manifest = loader._content["g-cloud-12"]["edit_service"]
+        question_path = path(content_path, "questions", "services", "supportHours.yml")
+        write_yaml(question_path, {"question": "When", "type": "text"})
+
+        reloaded = loader.reload_files([question_path])
+
+        assert reloaded == [("manifest", "g-cloud-12", "display_service")]
+        assert question_text(loader, "display_service", "supportHours") == "When"
+        assert loader._questions["g-cloud-12"]["services"]["serviceName"] is untouched_question
+        assert loader._content["g-cloud-12"]["edit_service"] is untouched_manifest
+
+    def test_reloads_every_manifest_using_a_changed_question(self, content_path, loader):
+        question_path = path(content_path, "questions", "services", "serviceName.yml")
+        write_yaml(question_path, {"question": "Called", "type": "text"})
+
+        reloaded = loader.reload_files([question_path])
+
+        assert reloaded == [("manifest", "g-cloud-12", "display_service"), ("manifest", "g-cloud-12", "edit_service")]
+        assert question_text(loader, "edit_service", "serviceName") == "Called"
+        assert question_text(loader, "display_service", "serviceName") == "Called"
+
+    def test_reloads_messages_and_metadata(self, content_path, loader):
+        write_yaml(path(content_path, "messages", "dashboard.yml"), {"status": "Closed"})
+        write_yaml(path(content_path, "metadata", "copy_services.yml"), {"source_framework": "g-cloud-10"})
+
+        reloaded = loader.reload_files([
+            path(content_path, "messages", "dashboard.yml"), path(content_path, "metadata", "copy_services.yml")
+        ])
+
+        assert reloaded == [("messages", "g-cloud-12", "dashboard"), ("metadata", "g-cloud-12", "copy_services")]
+        assert loader.get_message("g-cloud-12", "dashboard", "status") == "Closed"
+        assert loader.get_metadata("g-cloud-12", "copy_services", "source_framework") == "g-cloud-10"
+
+    def test_finds_questions_added_since_the_content_was_loaded(self, content_path, loader):
+        write_yaml(path(content_path, "questions", "services", "serviceLogo.yml"), {"question": "Logo", "type": "text"})
+        write_yaml(path(content_path, "manifests", "edit_service.yml"), [
+            {"name": "About", "questions": ["serviceName", "serviceLogo"]},
+        ])
+
+        loader.reload_files([path(content_path, "manifests", "edit_service.yml")])
+
+        assert question_text(loader, "edit_service", "serviceLogo") == "Logo"
+
+    def test_files_nothing_was_made_from_reload_nothing(self, content_path, loader):
+        assert loader.reload_files([path(content_path, "questions", "services", "notUsed.yml")]) == []
+
+    def test_does_not_keep_the_content_it_replaced(self, content_path, loader):
+        replaced = loader._questions["g-cloud-12"]["services"]["supportHours"]
+        question_path = path(content_path, "questions", "services", "supportHours.yml")
+        write_yaml(question_path, {"question": "When", "type": "text"})
+
+        loader.reload_files([question_path])
+
+        assert not any(content is replaced for content in loader._shared._shared.values())
+        assert not any(content is replaced for content, _ in loader._questions_by_content.values())
+
+    def test_reloading_in_another_thread_records_its_own_dependencies(self, content_path):
+        loader = ContentLoader(content_path)
+        loader.load_manifest("g-cloud-12", "services", "edit_service")
+        loader.lazy_load_manifests("g-cloud-12", {"display_service": "services"})
+        edit_path = path(content_path, "manifests", "edit_service.yml")
+        display_path = path(content_path, "manifests", "display_service.yml")
+        reloading, loading = threading.Event(), threading.Event()
+        read_yaml = loader._read_yaml
+
+        def interleaved_read_yaml(yaml_file, *args, **kwargs):
+            # give the other thread the chance to start recording while this one is
+            if yaml_file == edit_path:
+                reloading.set()
+                loading.wait(0.2)
+            elif yaml_file == display_path:
+                loading.set()
+                reloader.join(0.2)
+            return read_yaml(yaml_file, *args, **kwargs)
+
+        reloader = threading.Thread(target=loader.reload_files, args=([edit_path],))
+        with mock.patch.object(loader, "_read_yaml", interleaved_read_yaml):
+            reloader.start()
+            reloading.wait(1)
+            loader.get_manifest("g-cloud-12", "display_service")
+            reloader.join()
+
+        assert loader._dependencies[("manifest", "g-cloud-12", "edit_service")] == {
+            edit_path,
+            ("question", "g-cloud-12", "services", "serviceName"),
+            ("question", "g-cloud-12", "services", "serviceType"),
+        }
+        assert loader._dependencies[("manifest", "g-cloud-12", "display_service")] == {
+            display_path,
+            ("question", "g-cloud-12", "services", "serviceName"),
+            ("question", "g-cloud-12", "services", "support"),
+        }
+
+    def test_frozen_loader_can_not_be_reloaded(self, content_path, loader):
+        try:
+            loader.freeze()
+        finally:
+            gc.unfreeze()
+
+        with pytest.raises(ContentLoaderFrozenError):
+            loader.reload_files([path(content_path, "messages", "dashboard.yml")])
+
+
+class TestContentWatcher(object):
+    def test_nothing_changed(self, loader):
+        assert ContentWatcher(loader).check() == []
+
+    def test_reloads_changed_files(self, content_path, loader):
+        watcher = ContentWatcher(loader)
+        edit_yaml(path(content_path, "questions", "services", "serviceType.yml"), {"question": "Kind", "type": "text"})
+
+        assert watcher.check() == [("manifest", "g-cloud-12", "edit_service")]
+        assert question_text(loader, "edit_service", "serviceType") == "Kind"
+        assert watcher.check() == []
+
+    def test_watches_content_loaded_after_it_started(self, content_path):
+        loader = ContentLoader(content_path)
+        loader.lazy_load_manifests("g-cloud-12", {"edit_service": "services"})
+        watcher = ContentWatcher(loader)
+        loader.get_manifest("g-cloud-12", "edit_service")
+        watcher.check()
+
+        edit_yaml(path(content_path, "manifests", "edit_service.yml"), [{"name": "Changed", "questions": []}])
+
+        assert watcher.check() == [("manifest", "g-cloud-12", "edit_service")]
+        assert loader.get_manifest("g-cloud-12", "edit_service").sections[0].name == "Changed"
+
+    def test_reloads_once_a_broken_file_is_fixed(self, content_path, loader):
+        watcher = ContentWatcher(loader)
+        manifest_path = path(content_path, "manifests", "edit_service.yml")
+        stat = os.stat(manifest_path)
+        with open(manifest_path, "w") as f:
+            f.write("- name: [")
+        os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with pytest.raises(yaml.YAMLError):
+            watcher.check()
+        assert loader.get_manifest("g-cloud-12", "edit_service").sections[0].name == "About"
+
+        edit_yaml(manifest_path, [{"name": "Fixed", "questions": ["serviceName"]}])
+
+        assert watcher.check() == [("manifest", "g-cloud-12", "edit_service")]
+        assert loader.get_manifest("g-cloud-12", "edit_service").sections[0].name == "Fixed"
+
+    def test_checks_in_the_background(self, content_path, loader):
+        watcher = ContentWatcher(loader)
+        watcher.start(interval=0.01)
+        try:
+            edit_yaml(path(content_path, "messages", "dashboard.yml"), {"status": "Closed"})
+            for _ in range(500):
+                if loader.get_message("g-cloud-12", "dashboard", "status") == "Closed":
+                    break
+                time.sleep(0.01)
+        finally:
+            watcher.stop()
+
+        assert loader.get_message("g-cloud-12", "dashboard", "status") == "Closed"
+
+    def test_bundles_can_not_be_watched(self, content_path, tmp_path):
+        bundle_path = str(tmp_path / "content.bundle")
+        build_bundle(content_path, bundle_path)
+
+        with pytest.raises(ValueError):
+            ContentWatcher(ContentLoader.from_bundle(bundle_path))